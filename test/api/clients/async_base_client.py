@@ -0,0 +1,105 @@
+"""
+Async HTTP client wrapping httpx with a shared, pooled connection.
+"""
+
+import json
+import time
+from typing import Optional
+
+import httpx
+
+from config.settings import get_settings
+from utils.request_log import get_request_log
+
+_UNSET = object()
+
+
+class AsyncBaseClient:
+    """Async API client with shared HTTP methods and authentication.
+
+    All requests go through a single ``httpx.AsyncClient`` so concurrent
+    coroutines share one keep-alive connection pool, capped at
+    ``max_connections``.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        token=_UNSET,
+        max_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+    ):
+        settings = get_settings()
+        self.base_url = (base_url or settings.BASE_URL).rstrip("/")
+        self.timeout = settings.REQUEST_TIMEOUT
+
+        max_connections = max_connections or settings.MAX_CONNECTIONS
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=settings.KEEPALIVE_EXPIRY if keepalive_expiry is None else keepalive_expiry,
+        )
+
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        resolved_token = settings.API_TOKEN if token is _UNSET else token
+        if resolved_token:
+            headers["Authorization"] = f"Basic {resolved_token}"
+
+        self.session = httpx.AsyncClient(
+            headers=headers,
+            limits=limits,
+            timeout=self.timeout,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def _url(self, endpoint: str) -> str:
+        """Build full URL from endpoint."""
+        return f"{self.base_url}{endpoint}"
+
+    async def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request and hand the exchange to the request log."""
+        started = time.perf_counter()
+        try:
+            response = await self.session.request(method, url, **kwargs)
+        except httpx.HTTPError as exc:
+            body = kwargs.get("json")
+            get_request_log().record(
+                method, url, None, (time.perf_counter() - started) * 1000,
+                request_body=None if body is None else json.dumps(body, default=str),
+                error=repr(exc),
+            )
+            raise
+        get_request_log().record(
+            method, url, response.status_code, (time.perf_counter() - started) * 1000,
+            request_body=response.request.content,
+            response_body=response.content,
+        )
+        return response
+
+    async def get(self, endpoint: str, **kwargs) -> httpx.Response:
+        """Send a GET request."""
+        return await self._send("GET", self._url(endpoint), **kwargs)
+
+    async def post(self, endpoint: str, json: dict = None, **kwargs) -> httpx.Response:
+        """Send a POST request."""
+        return await self._send("POST", self._url(endpoint), json=json, **kwargs)
+
+    async def put(self, endpoint: str, json: dict = None, **kwargs) -> httpx.Response:
+        """Send a PUT request."""
+        return await self._send("PUT", self._url(endpoint), json=json, **kwargs)
+
+    async def delete(self, endpoint: str, **kwargs) -> httpx.Response:
+        """Send a DELETE request."""
+        return await self._send("DELETE", self._url(endpoint), **kwargs)
+
+    async def close(self):
+        """Close the underlying connection pool."""
+        await self.session.aclose()
@@ -0,0 +1,32 @@
+"""
+Async API client for the /api/Employees endpoints.
+"""
+
+import httpx
+
+from clients.async_base_client import AsyncBaseClient
+from config.settings import EMPLOYEES_ENDPOINT, get_employee_by_id_endpoint
+
+
+class AsyncEmployeesClient(AsyncBaseClient):
+    """Async client for Employee CRUD operations."""
+
+    async def get_all_employees(self) -> httpx.Response:
+        """GET /api/Employees — Retrieve all employees."""
+        return await self.get(EMPLOYEES_ENDPOINT)
+
+    async def get_employee_by_id(self, employee_id: str) -> httpx.Response:
+        """GET /api/Employees/{id} — Retrieve a single employee by ID."""
+        return await self.get(get_employee_by_id_endpoint(employee_id))
+
+    async def create_employee(self, payload: dict) -> httpx.Response:
+        """POST /api/Employees — Create a new employee."""
+        return await self.post(EMPLOYEES_ENDPOINT, json=payload)
+
+    async def update_employee(self, payload: dict) -> httpx.Response:
+        """PUT /api/Employees — Update an existing employee."""
+        return await self.put(EMPLOYEES_ENDPOINT, json=payload)
+
+    async def delete_employee(self, employee_id: str) -> httpx.Response:
+        """DELETE /api/Employees/{id} — Delete an employee by ID."""
+        return await self.delete(get_employee_by_id_endpoint(employee_id))
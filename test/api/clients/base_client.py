@@ -2,28 +2,178 @@
 Base HTTP client wrapping requests library with common configuration.
 """
 
+import json
 import logging
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Any, Callable, Iterable, List, Optional
+from urllib.parse import urlsplit
 
 import requests
+from urllib3.util.retry import Retry
 
-from config.settings import BASE_URL, API_TOKEN, REQUEST_TIMEOUT
+from clients.cassette import Cassette, CassetteAdapter
+from clients.transport import HTTP2, TRANSPORTS, ConnectionStats, HttpxAdapter, InstrumentedHTTPAdapter
+from config.settings import get_settings
+from utils.json_codec import response_json
+from utils.metrics import MetricsSink, RequestTiming, endpoint_template, get_default_sink
+from utils.rate_limiter import TokenBucket
+from utils.request_log import get_request_log
 
 logger = logging.getLogger(__name__)
 
 
 _UNSET = object()
 
+# Throttling and transient gateway failures. 500 is usually a deterministic
+# server bug (and some negative tests expect one), so it is opt-in.
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+SERVER_ERROR_STATUS = 500
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def build_retry(
+    total: Optional[int] = None,
+    retry_post: Optional[bool] = None,
+    retry_server_errors: Optional[bool] = None,
+) -> Retry:
+    """Retry policy: exponential backoff with jitter, honouring Retry-After.
+
+    Idempotent methods are retried on connection errors and RETRY_STATUSES;
+    POST only when ``retry_post`` (default RETRY_POST) is set, since a retried
+    create can duplicate the employee. 500 is retried only when
+    ``retry_server_errors`` (default RETRY_SERVER_ERRORS) is set. The last
+    response is returned once retries run out, so tests still see the real
+    status code.
+    """
+    settings = get_settings()
+    total = settings.RETRY_TOTAL if total is None else total
+    retry_post = settings.RETRY_POST if retry_post is None else retry_post
+    if retry_server_errors is None:
+        retry_server_errors = settings.RETRY_SERVER_ERRORS
+    methods = (IDEMPOTENT_METHODS | {"POST"}) if retry_post else IDEMPOTENT_METHODS
+    statuses = (RETRY_STATUSES | {SERVER_ERROR_STATUS}) if retry_server_errors else RETRY_STATUSES
+    return Retry(
+        total=total,
+        backoff_factor=settings.RETRY_BACKOFF,
+        backoff_max=settings.RETRY_BACKOFF_MAX,
+        backoff_jitter=settings.RETRY_JITTER,
+        status_forcelist=statuses,
+        allowed_methods=methods,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+@lru_cache(maxsize=None)
+def default_rate_limiter() -> Optional[TokenBucket]:
+    """Process-wide limiter from RATE_LIMIT_RPS, shared by every client (None if unset)."""
+    settings = get_settings()
+    if settings.RATE_LIMIT_RPS <= 0:
+        return None
+    return TokenBucket(settings.RATE_LIMIT_RPS, burst=settings.RATE_LIMIT_BURST)
+
+
+@dataclass
+class BulkResult:
+    """Outcome of one item in a bulk operation.
+
+    ``response`` is set when the request completed (whatever its status);
+    ``error`` is set when it raised instead.
+    """
+
+    item: Any
+    response: Optional[requests.Response] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the request completed with a 2xx status."""
+        return self.error is None and self.response is not None and self.response.ok
+
+
+def run_concurrently(
+    func: Callable[[Any], requests.Response], items: Iterable, concurrency: int
+) -> List[BulkResult]:
+    """Call ``func`` on every item over a bounded thread pool.
+
+    Results are returned in input order. Exceptions are captured per item
+    rather than aborting the batch.
+    """
+
+    def _call(item) -> BulkResult:
+        try:
+            return BulkResult(item=item, response=func(item))
+        except Exception as exc:  # noqa: BLE001 — reported per item
+            logger.warning(f"Bulk item {item!r} failed: {exc}")
+            return BulkResult(item=item, error=exc)
+
+    items = list(items)
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(items)))) as executor:
+        return list(executor.map(_call, items))
+
 
 class BaseClient:
-    """Base API client with shared HTTP methods and authentication."""
+    """Base API client with shared HTTP methods and authentication.
 
-    def __init__(self, base_url: Optional[str] = None, token=_UNSET):
-        self.base_url = (base_url or BASE_URL).rstrip("/")
+    ``transport`` (default HTTP_TRANSPORT) picks the connection backend:
+    ``http1`` for urllib3, ``http2`` for httpx with HTTP/2 multiplexing (see
+    clients/transport.py). Either way ``connection_stats`` counts new and
+    reused connections, TLS handshakes and pool waits. A cassette replaces
+    the transport.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        token=_UNSET,
+        max_connections: Optional[int] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        cassette: Optional[Cassette] = None,
+        retries: Optional[int] = None,
+        retry_post: Optional[bool] = None,
+        retry_server_errors: Optional[bool] = None,
+        rate_limiter=_UNSET,
+        transport: Optional[str] = None,
+    ):
+        settings = get_settings()
+        self.base_url = (base_url or settings.BASE_URL).rstrip("/")
         self.session = requests.Session()
-        self.timeout = REQUEST_TIMEOUT
+        self.timeout = settings.REQUEST_TIMEOUT
+        self.metrics_sink = metrics_sink
+        self.rate_limiter = default_rate_limiter() if rate_limiter is _UNSET else rate_limiter
+        self.transport = transport or settings.HTTP_TRANSPORT
+        if self.transport not in TRANSPORTS:
+            raise ValueError(f"Unknown transport {self.transport!r}; choose one of {', '.join(TRANSPORTS)}")
+        self.connection_stats = ConnectionStats()
+
+        # Size the pool so concurrent bulk calls reuse connections
+        max_connections = max_connections or settings.MAX_CONNECTIONS
+        pool_kwargs = {
+            "pool_connections": max_connections,
+            "pool_maxsize": max_connections,
+            "max_retries": build_retry(retries, retry_post, retry_server_errors),
+        }
+        if cassette is not None:
+            # Record or replay responses instead of plain pass-through
+            adapter = CassetteAdapter(cassette, base_path=urlsplit(self.base_url).path, **pool_kwargs)
+        elif self.transport == HTTP2:
+            adapter = HttpxAdapter(
+                self.connection_stats,
+                max_connections=max_connections,
+                max_retries=pool_kwargs["max_retries"],
+                keepalive_expiry=settings.KEEPALIVE_EXPIRY,
+            )
+        else:
+            adapter = InstrumentedHTTPAdapter(self.connection_stats, **pool_kwargs)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
-        resolved_token = API_TOKEN if token is _UNSET else token
+        resolved_token = settings.API_TOKEN if token is _UNSET else token
         if resolved_token:
             self.session.headers.update({"Authorization": f"Basic {resolved_token}"})
 
@@ -42,39 +192,85 @@ class BaseClient:
         """Build full URL from endpoint."""
         return f"{self.base_url}{endpoint}"
 
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, report its timing to the metrics sink and hand the
+        exchange to the request log.
+
+        Waiting for the rate limiter is not counted in the timing; retries
+        and their backoff are. ``connect_ms`` is set when the request had to
+        open a connection.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        sink = self.metrics_sink or get_default_sink()
+        self.connection_stats.take_connect_ms()  # drop anything left from an earlier call
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+        except requests.RequestException as exc:
+            total_ms = (time.perf_counter() - started) * 1000
+            sink.record(RequestTiming(
+                method=method,
+                endpoint=endpoint_template(urlsplit(url).path),
+                url=url,
+                status=None,
+                total_ms=total_ms,
+                connect_ms=self.connection_stats.take_connect_ms(),
+                error=repr(exc),
+            ))
+            body = kwargs.get("json")
+            get_request_log().record(
+                method, url, None, total_ms,
+                request_body=None if body is None else json.dumps(body, default=str),
+                error=repr(exc),
+            )
+            raise
+
+        total_ms = (time.perf_counter() - started) * 1000
+        # requests sets ``elapsed`` once headers are parsed; the body is read
+        # afterwards unless the caller streams it.
+        ttfb_ms = min(response.elapsed.total_seconds() * 1000, total_ms)
+        streamed = kwargs.get("stream", False)
+        sink.record(RequestTiming(
+            method=method,
+            endpoint=endpoint_template(urlsplit(url).path),
+            url=url,
+            status=response.status_code,
+            total_ms=total_ms,
+            ttfb_ms=ttfb_ms,
+            download_ms=None if streamed else total_ms - ttfb_ms,
+            connect_ms=self.connection_stats.take_connect_ms(),
+            response_bytes=0 if streamed else len(response.content),
+        ))
+        get_request_log().record(
+            method, url, response.status_code, total_ms,
+            request_body=response.request.body,
+            response_body=None if streamed else response.content,
+        )
+        # Route response.json() through the fast, caching decoder
+        response.json = partial(response_json, response)
+        return response
+
+    @staticmethod
+    def json(response: requests.Response):
+        """Decode a response body (orjson if installed), cached on the response."""
+        return response_json(response)
+
     def get(self, endpoint: str, **kwargs) -> requests.Response:
         """Send a GET request."""
-        url = self._url(endpoint)
-        logger.info(f"GET {url}")
-        response = self.session.get(url, timeout=self.timeout, **kwargs)
-        logger.info(f"Response: {response.status_code}")
-        return response
+        return self._send("GET", self._url(endpoint), **kwargs)
 
     def post(self, endpoint: str, json: dict = None, **kwargs) -> requests.Response:
         """Send a POST request."""
-        url = self._url(endpoint)
-        logger.info(f"POST {url}")
-        logger.debug(f"Request body: {json}")
-        response = self.session.post(url, json=json, timeout=self.timeout, **kwargs)
-        logger.info(f"Response: {response.status_code}")
-        return response
+        return self._send("POST", self._url(endpoint), json=json, **kwargs)
 
     def put(self, endpoint: str, json: dict = None, **kwargs) -> requests.Response:
         """Send a PUT request."""
-        url = self._url(endpoint)
-        logger.info(f"PUT {url}")
-        logger.debug(f"Request body: {json}")
-        response = self.session.put(url, json=json, timeout=self.timeout, **kwargs)
-        logger.info(f"Response: {response.status_code}")
-        return response
+        return self._send("PUT", self._url(endpoint), json=json, **kwargs)
 
     def delete(self, endpoint: str, **kwargs) -> requests.Response:
         """Send a DELETE request."""
-        url = self._url(endpoint)
-        logger.info(f"DELETE {url}")
-        response = self.session.delete(url, timeout=self.timeout, **kwargs)
-        logger.info(f"Response: {response.status_code}")
-        return response
+        return self._send("DELETE", self._url(endpoint), **kwargs)
 
     def close(self):
         """Close the underlying session."""
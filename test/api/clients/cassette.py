@@ -0,0 +1,351 @@
+"""
+Record-and-replay transport for BaseClient.
+
+In ``record`` mode every request goes to the API as usual and the response
+is appended to a cassette. In ``replay`` mode responses are served from the
+cassette and nothing touches the network.
+
+A cassette is two files:
+
+- ``<path>.bin`` — the recorded responses back to back, each a small JSON
+  header (status, reason, headers) followed by the raw body. It is
+  memory-mapped on replay, so only the entries a run uses are read.
+- ``<path>.idx.json`` — the entry offsets plus two lookup tables mapping
+  request keys to entries, in recording order.
+
+Request keys cover the method, the path relative to the client's base URL,
+whether an Authorization header was sent, and the JSON body with volatile
+values normalized: ``expiration`` is dropped and run/worker namespaces are
+stripped from usernames. The *exact* key keeps employee IDs; the *loose* key
+also replaces every UUID with a placeholder, so requests built around
+freshly generated IDs (e.g. a random "nonexistent" ID) still match.
+
+Each entry is also filed under the current scope (``set_scope``; the suite
+uses the test's node ID). Replay serves the first unused entry for the
+exact key within the scope, then the loose key within the scope, then the
+exact and loose keys across all scopes. A test therefore gets the responses
+recorded for it even when tests run in another order or on other workers.
+Run/worker namespaces in replayed bodies are rewritten to the current one.
+
+Under pytest-xdist each worker records its own cassette
+(``worker_cassette_path``); ``merge_cassettes`` combines them afterwards.
+"""
+
+import hashlib
+import io
+import json
+import mmap
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+from utils.namespace import NAMESPACE_PATTERN, NAMESPACE_TAG, namespace
+
+RECORD = "record"
+REPLAY = "replay"
+MODES = (RECORD, REPLAY)
+
+VOLATILE_FIELDS = frozenset({"expiration"})
+
+_UUID_PATTERN = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+_UUID_PLACEHOLDER = "{id}"
+
+# A namespaced username at the start of a JSON string (see utils/namespace.py)
+_BODY_NAMESPACE_PATTERN = re.compile(rb'"' + re.escape(NAMESPACE_TAG.encode("ascii")) + rb"[0-9a-f]{6}-[a-z0-9]+-")
+
+# Response headers worth keeping; hop-by-hop and per-request ones are dropped
+_KEPT_HEADERS = ("content-type", "etag", "cache-control", "last-modified", "retry-after")
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when no recorded response matches a request."""
+
+
+# Scope the next recorded or replayed requests belong to
+_scope = ""
+
+
+def set_scope(scope: str) -> None:
+    """File requests recorded or replayed from now on under ``scope``."""
+    global _scope
+    _scope = scope
+
+
+def current_scope() -> str:
+    return _scope
+
+
+def _scoped(key: str) -> str:
+    return hashlib.sha1(f"{_scope}\n{key}".encode("utf-8")).hexdigest()
+
+
+def _normalize(value, loose: bool):
+    """Strip volatile data from a decoded JSON body."""
+    if isinstance(value, dict):
+        return {
+            key: _normalize(item, loose)
+            for key, item in value.items()
+            if key not in VOLATILE_FIELDS
+        }
+    if isinstance(value, list):
+        return [_normalize(item, loose) for item in value]
+    if isinstance(value, str):
+        value = NAMESPACE_PATTERN.sub("", value)
+        if loose:
+            value = _UUID_PATTERN.sub(_UUID_PLACEHOLDER, value)
+    return value
+
+
+def _normalized_body(body, loose: bool) -> str:
+    if not body:
+        return ""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    try:
+        decoded = json.loads(body)
+    except ValueError:
+        return hashlib.sha1(body).hexdigest()
+    return json.dumps(_normalize(decoded, loose), sort_keys=True, separators=(",", ":"))
+
+
+def request_keys(method: str, path: str, body, authenticated: bool) -> Tuple[str, str]:
+    """Return the (exact, loose) cassette keys for a request."""
+    auth = "auth" if authenticated else "anon"
+    exact = f"{method.upper()} {path} {auth} {_normalized_body(body, loose=False)}"
+    loose = (
+        f"{method.upper()} {_UUID_PATTERN.sub(_UUID_PLACEHOLDER, path)} {auth} "
+        f"{_normalized_body(body, loose=True)}"
+    )
+    return (
+        hashlib.sha1(exact.encode("utf-8")).hexdigest(),
+        hashlib.sha1(loose.encode("utf-8")).hexdigest(),
+    )
+
+
+class Cassette:
+    """On-disk store of recorded responses, opened for recording or replay."""
+
+    def __init__(self, path, mode: str):
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r}; expected one of {MODES}")
+        self.path = Path(path)
+        self.mode = mode
+        self.data_path = self.path.with_name(self.path.name + ".bin")
+        self.index_path = self.path.with_name(self.path.name + ".idx.json")
+        self._lock = threading.Lock()
+        # entry number -> (offset, header length, body length)
+        self._entries: List[Tuple[int, int, int]] = []
+        self._exact: Dict[str, List[int]] = {}
+        self._loose: Dict[str, List[int]] = {}
+        # Same, keyed by (scope, key)
+        self._scoped_exact: Dict[str, List[int]] = {}
+        self._scoped_loose: Dict[str, List[int]] = {}
+        self._used = set()
+        self._data = None
+        self._map = None
+
+        if mode == RECORD:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._data = open(self.data_path, "wb")
+        else:
+            self._open_for_replay()
+
+    def _open_for_replay(self):
+        if not self.index_path.exists():
+            raise FileNotFoundError(
+                f"No cassette at {self.index_path}; record one first with CASSETTE_MODE=record"
+            )
+        index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        self._entries = [tuple(entry) for entry in index["entries"]]
+        self._exact = index["exact"]
+        self._loose = index["loose"]
+        self._scoped_exact = index.get("scoped_exact", {})
+        self._scoped_loose = index.get("scoped_loose", {})
+        self._data = open(self.data_path, "rb")
+        if self.data_path.stat().st_size:
+            self._map = mmap.mmap(self._data.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def record(self, keys: Tuple[str, str], status: int, reason: str, headers: dict, body: bytes):
+        """Append a response under the given (exact, loose) request keys."""
+        header = json.dumps(
+            {"status": status, "reason": reason, "headers": headers}, separators=(",", ":")
+        ).encode("utf-8")
+        with self._lock:
+            offset = self._data.tell()
+            self._data.write(header)
+            self._data.write(body)
+            number = len(self._entries)
+            self._entries.append((offset, len(header), len(body)))
+            self._exact.setdefault(keys[0], []).append(number)
+            self._loose.setdefault(keys[1], []).append(number)
+            self._scoped_exact.setdefault(_scoped(keys[0]), []).append(number)
+            self._scoped_loose.setdefault(_scoped(keys[1]), []).append(number)
+
+    def extend(self, other: "Cassette"):
+        """Append every entry of ``other``, a cassette opened for replay."""
+        with self._lock:
+            base_offset = self._data.tell()
+            base_number = len(self._entries)
+            if other._map is not None:
+                self._data.write(other._map)
+            self._entries.extend(
+                (offset + base_offset, header_length, body_length)
+                for offset, header_length, body_length in other._entries
+            )
+            for table, source in (
+                (self._exact, other._exact),
+                (self._loose, other._loose),
+                (self._scoped_exact, other._scoped_exact),
+                (self._scoped_loose, other._scoped_loose),
+            ):
+                for key, numbers in source.items():
+                    table.setdefault(key, []).extend(number + base_number for number in numbers)
+
+    def play(self, keys: Tuple[str, str]) -> Optional[Tuple[dict, bytes]]:
+        """Return the next unused (header, body) for the keys, or None."""
+        candidates = (
+            self._scoped_exact.get(_scoped(keys[0]), ()),
+            self._scoped_loose.get(_scoped(keys[1]), ()),
+            self._exact.get(keys[0], ()),
+            self._loose.get(keys[1], ()),
+        )
+        with self._lock:
+            for numbers in candidates:
+                number = self._next_unused(numbers)
+                if number is not None:
+                    break
+            else:
+                return None
+            self._used.add(number)
+
+        offset, header_length, body_length = self._entries[number]
+        body_start = offset + header_length
+        header = json.loads(self._map[offset:body_start])
+        return header, self._map[body_start:body_start + body_length]
+
+    def _next_unused(self, numbers) -> Optional[int]:
+        for number in numbers:
+            if number not in self._used:
+                return number
+        return None
+
+    def close(self):
+        """Flush the index (record mode) and release the files."""
+        with self._lock:
+            if self._data is None:
+                return
+            if self.mode == RECORD:
+                self._data.close()
+                index = {
+                    "entries": self._entries,
+                    "exact": self._exact,
+                    "loose": self._loose,
+                    "scoped_exact": self._scoped_exact,
+                    "scoped_loose": self._scoped_loose,
+                }
+                self.index_path.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+            else:
+                if self._map is not None:
+                    self._map.close()
+                self._data.close()
+            self._data = None
+
+
+def worker_cassette_path(path, worker: str) -> Path:
+    """Where an xdist worker records its part of the cassette at ``path``."""
+    path = Path(path)
+    return path.with_name(f"{path.name}.{worker}")
+
+
+def worker_cassettes(path) -> List[Path]:
+    """The worker cassettes recorded for ``path`` and not merged yet."""
+    path = Path(path)
+    suffix = ".idx.json"
+    return sorted(
+        index.with_name(index.name[:-len(suffix)])
+        for index in path.parent.glob(f"{path.name}.gw*{suffix}")
+    )
+
+
+def remove_cassette(path):
+    """Delete a cassette's data and index files, if present."""
+    path = Path(path)
+    for suffix in (".bin", ".idx.json"):
+        path.with_name(path.name + suffix).unlink(missing_ok=True)
+
+
+def merge_cassettes(path, parts) -> int:
+    """Write the cassettes ``parts`` into one at ``path`` and delete them.
+
+    Returns the number of entries in the merged cassette.
+    """
+    merged = Cassette(path, RECORD)
+    try:
+        for part_path in parts:
+            part = Cassette(part_path, REPLAY)
+            merged.extend(part)
+            part.close()
+            remove_cassette(part_path)
+        return len(merged)
+    finally:
+        merged.close()
+
+
+class CassetteAdapter(HTTPAdapter):
+    """HTTPAdapter that records responses to, or replays them from, a cassette.
+
+    ``base_path`` is the path of the client's base URL; it is stripped from
+    request paths so a cassette recorded against one host (or the fake API)
+    replays against any other.
+    """
+
+    def __init__(self, cassette: Cassette, base_path: str = "", **kwargs):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+        self.base_path = base_path.rstrip("/")
+
+    def _keys(self, request) -> Tuple[str, str]:
+        parts = urlsplit(request.url)
+        path = parts.path
+        if self.base_path and path.startswith(self.base_path):
+            path = path[len(self.base_path):]
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        return request_keys(request.method, path, request.body, "Authorization" in request.headers)
+
+    def send(self, request, **kwargs):
+        keys = self._keys(request)
+
+        if self.cassette.mode == REPLAY:
+            entry = self.cassette.play(keys)
+            if entry is None:
+                raise CassetteMissError(
+                    f"No recorded response for {request.method} {request.url} "
+                    f"in {self.cassette.index_path}"
+                )
+            header, body = entry
+            # Recorded usernames carry the recording run's namespace
+            body = _BODY_NAMESPACE_PATTERN.sub(b'"' + namespace().encode("utf-8"), body)
+            raw = HTTPResponse(
+                body=io.BytesIO(body),
+                headers=header["headers"],
+                status=header["status"],
+                reason=header["reason"],
+                preload_content=False,
+            )
+            return self.build_response(request, raw)
+
+        response = super().send(request, **kwargs)
+        headers = {
+            name: value for name, value in response.headers.items() if name.lower() in _KEPT_HEADERS
+        }
+        self.cassette.record(keys, response.status_code, response.reason, headers, response.content)
+        return response
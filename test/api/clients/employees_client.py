@@ -2,31 +2,123 @@
 API client for the /api/Employees endpoints.
 """
 
+from contextlib import closing
+from typing import Iterable, Iterator, List, Optional
+
 import requests
 
-from clients.base_client import BaseClient
+from clients.base_client import BaseClient, BulkResult, run_concurrently
+from clients.response_cache import ResponseCache
 from config.settings import EMPLOYEES_ENDPOINT, get_employee_by_id_endpoint
+from utils.json_stream import iter_json_array
+from utils.registry import EmployeeRegistry
+
+DEFAULT_BULK_CONCURRENCY = 8
+STREAM_CHUNK_SIZE = 64 * 1024
 
 
 class EmployeesClient(BaseClient):
-    """Client for Employee CRUD operations."""
+    """Client for Employee CRUD operations.
+
+    If a ``registry`` is given, every employee created through this client is
+    recorded in it and removed again when deleted through this client.
+
+    If a ``response_cache`` is given, ``get_all_employees`` and
+    ``get_employee_by_id`` are served from it (see clients/response_cache.py)
+    and every create/update/delete invalidates the list and the affected
+    employee.
+    """
+
+    def __init__(
+        self,
+        *args,
+        registry: Optional[EmployeeRegistry] = None,
+        response_cache: Optional[ResponseCache] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.registry = registry
+        self.response_cache = response_cache
+
+    def _read(self, endpoint: str) -> requests.Response:
+        """GET through the response cache, if one is configured."""
+        if self.response_cache is None:
+            return self.get(endpoint)
+        return self.response_cache.get(
+            self._url(endpoint), lambda headers: self.get(endpoint, headers=headers)
+        )
+
+    def _invalidate(self, employee_id=None):
+        """Drop cached reads a write may have changed."""
+        if self.response_cache is None:
+            return
+        urls = [self._url(EMPLOYEES_ENDPOINT)]
+        if employee_id:
+            urls.append(self._url(get_employee_by_id_endpoint(str(employee_id))))
+        self.response_cache.invalidate(*urls)
 
     def get_all_employees(self) -> requests.Response:
         """GET /api/Employees — Retrieve all employees."""
-        return self.get(EMPLOYEES_ENDPOINT)
+        return self._read(EMPLOYEES_ENDPOINT)
+
+    def iter_all_employees(self, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[dict]:
+        """GET /api/Employees, streamed — yield employees one at a time.
+
+        The body is read in ``chunk_size`` pieces and parsed incrementally,
+        so memory stays flat however many employees there are. The request
+        is sent on the first ``next()``; stopping early closes the response.
+        Raises ``requests.HTTPError`` on a non-2xx status.
+        """
+        response = self.get(EMPLOYEES_ENDPOINT, stream=True)
+        with closing(response):
+            response.raise_for_status()
+            yield from iter_json_array(response.iter_content(chunk_size))
 
     def get_employee_by_id(self, employee_id: str) -> requests.Response:
         """GET /api/Employees/{id} — Retrieve a single employee by ID."""
-        return self.get(get_employee_by_id_endpoint(employee_id))
+        return self._read(get_employee_by_id_endpoint(employee_id))
 
     def create_employee(self, payload: dict) -> requests.Response:
         """POST /api/Employees — Create a new employee."""
-        return self.post(EMPLOYEES_ENDPOINT, json=payload)
+        response = self.post(EMPLOYEES_ENDPOINT, json=payload)
+        self._invalidate()
+        if self.registry is not None and response.ok:
+            try:
+                employee_id = response.json().get("id")
+            except (ValueError, AttributeError):
+                employee_id = None
+            if employee_id:
+                self.registry.add(employee_id)
+        return response
 
     def update_employee(self, payload: dict) -> requests.Response:
         """PUT /api/Employees — Update an existing employee."""
-        return self.put(EMPLOYEES_ENDPOINT, json=payload)
+        response = self.put(EMPLOYEES_ENDPOINT, json=payload)
+        self._invalidate(payload.get("id") if isinstance(payload, dict) else None)
+        return response
 
     def delete_employee(self, employee_id: str) -> requests.Response:
         """DELETE /api/Employees/{id} — Delete an employee by ID."""
-        return self.delete(get_employee_by_id_endpoint(employee_id))
+        response = self.delete(get_employee_by_id_endpoint(employee_id))
+        self._invalidate(employee_id)
+        if self.registry is not None and response.ok:
+            self.registry.discard(employee_id)
+        return response
+
+    def create_employees(
+        self, payloads: Iterable[dict], concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> List[BulkResult]:
+        """POST /api/Employees for each payload, up to ``concurrency`` at a time.
+
+        Returns one BulkResult per payload, in input order.
+        """
+        return run_concurrently(self.create_employee, payloads, concurrency)
+
+    def delete_employees(
+        self, employee_ids: Iterable[str], concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> List[BulkResult]:
+        """DELETE /api/Employees/{id} for each ID, up to ``concurrency`` at a time.
+
+        Returns one BulkResult per ID, in input order.
+        """
+        return run_concurrently(self.delete_employee, employee_ids, concurrency)
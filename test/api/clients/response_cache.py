@@ -0,0 +1,142 @@
+"""
+Client-side cache for GET responses, used by EmployeesClient.
+
+A cached response is served without a request while it is younger than the
+TTL. Once stale, it is revalidated with ``If-None-Match`` (ETag) or
+``If-Modified-Since`` (Last-Modified) when the server sent one, and a 304
+re-serves the cached body without re-downloading it. Responses without
+validators are simply fetched again. Writes through the client invalidate
+the affected entries.
+
+Each URL has a generation, bumped by ``invalidate`` (``clear`` bumps them
+all). A fetch only stores its response if the generation is unchanged, so a
+read that started before a write cannot re-cache the pre-write response.
+"""
+
+import copy
+import threading
+import time
+from dataclasses import dataclass
+from functools import partial
+from typing import Dict, Optional, Tuple
+
+import requests
+
+from utils.json_codec import response_json
+
+DEFAULT_CACHE_TTL = 2.0
+
+
+@dataclass
+class CacheEntry:
+    response: requests.Response
+    stored_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.monotonic() - self.stored_at < ttl
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Revalidation headers, empty if the server sent no validator."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _clone(response: requests.Response) -> requests.Response:
+    """Shallow copy with its own parsed-JSON cache, so callers can't share mutations."""
+    clone = copy.copy(response)
+    clone.__dict__.pop("_parsed_json", None)
+    clone.json = partial(response_json, clone)
+    return clone
+
+
+class ResponseCache:
+    """Thread-safe URL → response cache with TTL and validator support."""
+
+    def __init__(self, ttl: float = DEFAULT_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: Dict[str, CacheEntry] = {}
+        # URL → times invalidated; the epoch counts clear() calls
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self.hits = 0           # served without a request
+        self.revalidated = 0    # served after a 304
+        self.misses = 0         # full GET
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        with self._lock:
+            return self._entries.get(url)
+
+    def _current(self, url: str, generation: Optional[Tuple[int, int]]) -> bool:
+        return generation is None or generation == (self._epoch, self._generations.get(url, 0))
+
+    def store(self, url: str, response: requests.Response, generation: Optional[Tuple[int, int]] = None):
+        """Cache a 200 response (anything else is dropped, along with any old entry).
+
+        With ``generation`` (taken before the fetch) nothing happens if the
+        URL was invalidated in the meantime.
+        """
+        with self._lock:
+            if not self._current(url, generation):
+                return
+            if response.status_code != 200:
+                self._entries.pop(url, None)
+                return
+            self._entries[url] = CacheEntry(
+                response=response,
+                stored_at=time.monotonic(),
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+
+    def refresh(self, url: str, generation: Optional[Tuple[int, int]] = None):
+        """Restart an entry's TTL after a successful revalidation."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None and self._current(url, generation):
+                entry.stored_at = time.monotonic()
+
+    def invalidate(self, *urls: str):
+        with self._lock:
+            for url in urls:
+                self._entries.pop(url, None)
+                self._generations[url] = self._generations.get(url, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+            self._epoch += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, url: str, fetch) -> requests.Response:
+        """Return the response for ``url``, calling ``fetch(headers)`` only when needed."""
+        with self._lock:
+            entry = self._entries.get(url)
+            generation = self._epoch, self._generations.get(url, 0)
+        if entry is not None and entry.is_fresh(self.ttl):
+            with self._lock:
+                self.hits += 1
+            return _clone(entry.response)
+
+        headers = entry.conditional_headers() if entry is not None else {}
+        response = fetch(headers)
+        if entry is not None and headers and response.status_code == 304:
+            with self._lock:
+                self.revalidated += 1
+            self.refresh(url, generation)
+            return _clone(entry.response)
+
+        with self._lock:
+            self.misses += 1
+        self.store(url, response, generation)
+        return response
@@ -0,0 +1,546 @@
+"""
+Transport backends for BaseClient, with connection-reuse counters.
+
+``BaseClient`` always talks ``requests``; the transport is the adapter
+mounted on its session:
+
+- ``http1`` (default): urllib3's pooled HTTP/1.1 connections
+  (``InstrumentedHTTPAdapter``).
+- ``http2``: an httpx connection pool (``HttpxAdapter``). Over HTTPS it
+  negotiates HTTP/2, so concurrent requests are multiplexed as streams on
+  one connection instead of each holding its own. Needs the ``h2`` package
+  (``pip install "httpx[http2]"``); against a plain-HTTP server, or one
+  that does not offer ``h2``, it speaks HTTP/1.1.
+
+Both adapters count into a ``ConnectionStats``:
+
+- ``new_connections``: TCP connections opened.
+- ``reused_connections``: requests sent on an existing connection, or as
+  another stream on an HTTP/2 connection.
+- ``tls_handshakes``: TLS handshakes. More handshakes than expected usually
+  means the gateway closed idle connections (see KEEPALIVE_EXPIRY).
+- ``pool_waits`` and ``pool_wait_ms``: requests that waited for a free
+  HTTP/1.1 connection, and how long they waited. urllib3 pools don't block:
+  when all connections are busy they open extra ones and close them
+  afterwards (``discarded_connections``).
+
+They also time connection setup per request, which BaseClient reports as
+``RequestTiming.connect_ms``.
+"""
+
+import threading
+import time
+from collections import Counter
+from typing import Optional
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from requests.adapters import DEFAULT_POOLBLOCK, BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3 import PoolManager
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, HTTPError, ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
+
+try:
+    import h2
+except ImportError:  # httpx only speaks HTTP/2 with it; see HttpxAdapter
+    h2 = None
+
+HTTP1 = "http1"
+HTTP2 = "http2"
+TRANSPORTS = (HTTP1, HTTP2)
+
+# Connection-specific headers; HTTP/2 forbids them
+_HOP_BY_HOP_HEADERS = frozenset({"connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"})
+
+
+class ConnectionStats:
+    """Thread-safe connection counters for one client (see the module docstring)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Setup time of connections opened by the current thread's request
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.new_connections = 0
+            self.reused_connections = 0
+            self.tls_handshakes = 0
+            self.pool_waits = 0
+            self.pool_wait_ms = 0.0
+            self.discarded_connections = 0
+            self.connect_ms = 0.0
+            self.http_versions = Counter()
+
+    def record_connect(self, elapsed_ms: float, tls: bool):
+        with self._lock:
+            self.new_connections += 1
+            self.tls_handshakes += tls
+            self.connect_ms += elapsed_ms
+        self._local.connect_ms = getattr(self._local, "connect_ms", 0.0) + elapsed_ms
+
+    def record_request(self, reused: bool, http_version: Optional[str]):
+        """Count one attempt (a retry is another); the version is None if it failed."""
+        with self._lock:
+            self.requests += 1
+            self.reused_connections += reused
+            if http_version is not None:
+                self.http_versions[http_version] += 1
+
+    def record_pool_wait(self, elapsed_ms: float):
+        with self._lock:
+            self.pool_waits += 1
+            self.pool_wait_ms += elapsed_ms
+
+    def record_discard(self):
+        with self._lock:
+            self.discarded_connections += 1
+
+    def take_connect_ms(self) -> Optional[float]:
+        """Connection setup time of the current thread's request since the last call.
+
+        None if the request reused a connection.
+        """
+        return self._local.__dict__.pop("connect_ms", None)
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Share of requests that did not open a connection."""
+        with self._lock:
+            return self.reused_connections / self.requests if self.requests else 0.0
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "new_connections": self.new_connections,
+                "reused_connections": self.reused_connections,
+                "tls_handshakes": self.tls_handshakes,
+                "pool_waits": self.pool_waits,
+                "pool_wait_ms": round(self.pool_wait_ms, 2),
+                "discarded_connections": self.discarded_connections,
+                "mean_connect_ms": round(self.connect_ms / self.new_connections, 2) if self.new_connections else None,
+                "http_versions": dict(self.http_versions),
+            }
+
+    def summary(self) -> str:
+        stats = self.snapshot()
+        versions = ", ".join(f"{version} x{count}" for version, count in sorted(stats["http_versions"].items()))
+        return (
+            f"{stats['requests']} requests over {stats['new_connections']} new connection(s) "
+            f"({stats['reused_connections']} reused, {stats['tls_handshakes']} TLS handshake(s), "
+            f"{stats['pool_waits']} pool wait(s) totalling {stats['pool_wait_ms']}ms, "
+            f"{stats['discarded_connections']} discarded){f'; {versions}' if versions else ''}"
+        )
+
+
+# --- urllib3 (HTTP/1.1) ---
+
+
+class _InstrumentedConnectionMixin:
+    stats: Optional[ConnectionStats] = None
+
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+        if self.stats is not None:
+            self.stats.record_connect((time.perf_counter() - started) * 1000, tls=isinstance(self, HTTPSConnection))
+
+
+class _InstrumentedHTTPConnection(_InstrumentedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _InstrumentedHTTPSConnection(_InstrumentedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _InstrumentedPoolMixin:
+    stats: Optional[ConnectionStats] = None
+
+    def _new_conn(self):
+        conn = super()._new_conn()
+        conn.stats = self.stats
+        return conn
+
+    def _get_conn(self, timeout=None):
+        # Non-blocking pools never wait; blocking ones wait when the queue is empty
+        if not (self.block and self.pool is not None and self.pool.empty()):
+            return super()._get_conn(timeout)
+        started = time.perf_counter()
+        conn = super()._get_conn(timeout)
+        self.stats.record_pool_wait((time.perf_counter() - started) * 1000)
+        return conn
+
+    def _make_request(self, conn, *args, **kwargs):
+        # A connection that is not open yet connects inside _make_request
+        self.stats.record_request(reused=conn.sock is not None, http_version="HTTP/1.1")
+        return super()._make_request(conn, *args, **kwargs)
+
+    def _put_conn(self, conn):
+        if conn is not None and self.pool is not None and self.pool.full():
+            self.stats.record_discard()
+        super()._put_conn(conn)
+
+
+class _InstrumentedHTTPConnectionPool(_InstrumentedPoolMixin, HTTPConnectionPool):
+    ConnectionCls = _InstrumentedHTTPConnection
+
+
+class _InstrumentedHTTPSConnectionPool(_InstrumentedPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = _InstrumentedHTTPSConnection
+
+
+class _InstrumentedPoolManager(PoolManager):
+    def __init__(self, stats: ConnectionStats, **kwargs):
+        super().__init__(**kwargs)
+        self.stats = stats
+        self.pool_classes_by_scheme = {
+            "http": _InstrumentedHTTPConnectionPool,
+            "https": _InstrumentedHTTPSConnectionPool,
+        }
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context)
+        pool.stats = self.stats
+        return pool
+
+
+class InstrumentedHTTPAdapter(HTTPAdapter):
+    """``HTTPAdapter`` whose urllib3 pools count into ``stats``."""
+
+    def __init__(self, stats: ConnectionStats, **kwargs):
+        # HTTPAdapter.__init__ builds the pool manager, which needs stats
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=DEFAULT_POOLBLOCK, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _InstrumentedPoolManager(
+            self.stats, num_pools=connections, maxsize=maxsize, block=block, **pool_kwargs
+        )
+
+
+# --- httpx (HTTP/2) ---
+
+
+class _LockedH2State:
+    """Proxy making every call into an ``h2`` connection state machine atomic.
+
+    httpcore's sync HTTP/2 connection mutates its ``H2Connection`` from every
+    thread with a stream on it, and only locks the socket writes.
+    ``H2Connection`` is not thread-safe: e.g. ``data_to_send()`` copies and
+    then resets the outgoing buffer, so a frame another thread appends in
+    between is lost, and the peer's HPACK state no longer matches.
+    """
+
+    def __init__(self, state, lock: threading.RLock):
+        self._state = state
+        self._lock = lock
+
+    def __getattr__(self, name):
+        attribute = getattr(self._state, name)
+        if not callable(attribute):
+            return attribute
+
+        def locked(*args, **kwargs):
+            with self._lock:
+                return attribute(*args, **kwargs)
+
+        return locked
+
+
+# Events after which an attempt no longer needs the adapter's stream lock:
+# its HTTP/2 stream is open, or it turned out to be an HTTP/1.1 request
+_STREAM_OPENED_EVENTS = (
+    "http2.send_request_headers.complete",
+    "http2.send_request_headers.failed",
+    "http11.send_request_headers.started",
+)
+
+
+class _Trace:
+    """httpcore trace callback: connection setup and reuse of one attempt.
+
+    With a ``stream_lock`` (held by the caller) the lock is released as soon
+    as the attempt's request headers are on their way.
+    """
+
+    def __init__(
+        self,
+        stats: ConnectionStats,
+        stream_lock: Optional[threading.Lock] = None,
+        on_http2_connection=None,
+    ):
+        self.stats = stats
+        self._on_http2_connection = on_http2_connection
+        self.sent = False
+        self.connect_started = None
+        self.connected = None
+        self.tls = False
+        self._stream_lock = stream_lock
+
+    def release_stream_lock(self):
+        lock, self._stream_lock = self._stream_lock, None
+        if lock is not None:
+            lock.release()
+
+    def __call__(self, event: str, info: dict):
+        now = time.perf_counter()
+        self.sent = True
+        if event in _STREAM_OPENED_EVENTS:
+            self.release_stream_lock()
+        elif event == "http2.send_connection_init.started" and self._on_http2_connection is not None:
+            self._on_http2_connection()
+        elif event == "connection.connect_tcp.started":
+            self.connect_started = now
+        elif event == "connection.connect_tcp.complete":
+            self.connected = now
+        elif event == "connection.start_tls.complete":
+            self.tls = True
+            self.connected = now
+
+    def finish(self, http_version: Optional[str]):
+        """Record the attempt; ``http_version`` is None if it failed."""
+        if self.connected is not None:
+            self.stats.record_connect((self.connected - self.connect_started) * 1000, tls=self.tls)
+        # A failed attempt that never got a connection reused nothing
+        reused = self.connected is None and (http_version is not None or self.sent)
+        self.stats.record_request(reused=reused, http_version=http_version)
+
+
+class _RetryView:
+    """The parts of a urllib3 response that ``Retry`` reads, for an httpx response."""
+
+    def __init__(self, response: httpx.Response):
+        self.status = response.status_code
+        self.headers = response.headers
+
+    def get_redirect_location(self):
+        return False
+
+
+class _Slot:
+    """One of an adapter's in-flight request slots, released exactly once.
+
+    Without a semaphore the request is not capped and the slot is a no-op.
+    """
+
+    def __init__(self, semaphore: Optional[threading.BoundedSemaphore], stats: ConnectionStats):
+        if semaphore is not None and not semaphore.acquire(blocking=False):
+            started = time.perf_counter()
+            semaphore.acquire()
+            stats.record_pool_wait((time.perf_counter() - started) * 1000)
+        self._semaphore = semaphore
+        self._held = semaphore is not None
+
+    def release(self):
+        if self._held:
+            self._held = False
+            self._semaphore.release()
+
+
+class _HttpxRaw:
+    """``Response.raw`` for an httpx response: requests reads the body through it.
+
+    The request's slot is freed once the body has been read or the response
+    closed, like a connection going back to the pool.
+    """
+
+    def __init__(self, response: httpx.Response, slot: _Slot):
+        self._response = response
+        self._slot = slot
+
+    def stream(self, chunk_size=None, decode_content=True):
+        try:
+            yield from self._response.iter_bytes(chunk_size)
+        except httpx.TimeoutException as exc:
+            self.close()
+            raise requests.ConnectionError(exc) from exc
+        except httpx.HTTPError as exc:
+            self.close()
+            raise requests.exceptions.ChunkedEncodingError(exc) from exc
+        # httpx closes the response itself once the body is read
+        self._slot.release()
+
+    def read(self, amt=None, decode_content=True):
+        try:
+            return self._response.read()
+        finally:
+            self._slot.release()
+
+    def close(self):
+        self._response.close()
+        self._slot.release()
+
+    release_conn = close
+
+
+def _timeout(timeout) -> httpx.Timeout:
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+def _retry_error(exc: httpx.TransportError) -> HTTPError:
+    """The urllib3 error ``Retry`` classifies the same way (connect vs read)."""
+    if isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        return ConnectTimeoutError(str(exc))  # nothing was sent yet
+    if isinstance(exc, httpx.ReadTimeout):
+        return ReadTimeoutError(None, None, str(exc))
+    return ProtocolError(str(exc))
+
+
+def _requests_error(exc: httpx.TransportError, request: requests.PreparedRequest) -> requests.RequestException:
+    if isinstance(exc, httpx.ConnectTimeout):
+        return requests.ConnectTimeout(exc, request=request)
+    if isinstance(exc, httpx.TimeoutException):
+        return requests.ReadTimeout(exc, request=request)
+    return requests.ConnectionError(exc, request=request)
+
+
+class HttpxAdapter(BaseAdapter):
+    """Sends ``requests`` requests through an httpx pool, with HTTP/2 when available.
+
+    Retries follow the same urllib3 ``Retry`` policy as ``HTTPAdapter``.
+    Certificates are checked by httpx (honouring SSL_CERT_FILE); the
+    per-request ``verify``, ``cert`` and ``proxies`` arguments are ignored.
+
+    Over HTTP/1.1 at most ``max_connections`` requests are in flight; the
+    rest wait here (counted as pool waits). httpcore's own queue for a full
+    pool of HTTP/1.1 connections is not thread-safe: under contention it
+    reads from sockets another thread has closed and fails with
+    ``ReadError``. Once an origin has negotiated HTTP/2, requests to it skip
+    the cap and are multiplexed as streams, up to the server's
+    concurrent-stream limit, which httpcore enforces.
+
+    httpcore's sync HTTP/2 connection picks a stream ID and sends its
+    headers without a lock in between. Two threads can then open streams out
+    of order, and the server resets the whole connection. Opening a stream
+    is therefore serialized here: each attempt holds a lock until its
+    request headers are sent. Streams still run concurrently after that,
+    with every call into the connection's ``h2`` state made atomic
+    (``_LockedH2State``), installed before the connection sends anything.
+
+    ``http2`` needs the ``h2`` package; without it the adapter refuses to
+    start rather than quietly speak HTTP/1.1.
+    """
+
+    def __init__(
+        self,
+        stats: ConnectionStats,
+        max_connections: int,
+        max_retries: Retry,
+        keepalive_expiry: Optional[float] = None,
+        http2: bool = True,
+    ):
+        super().__init__()
+        if http2 and h2 is None:
+            raise ImportError('The http2 transport needs the h2 package: pip install "httpx[http2]"')
+        self.stats = stats
+        self.max_retries = max_retries
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._stream_lock = threading.Lock() if http2 else None
+        self._h2_lock = threading.RLock()
+        # (scheme, host:port) of origins that negotiated HTTP/2
+        self._http2_origins = set()
+        self.client = httpx.Client(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            follow_redirects=False,
+        )
+
+    def _lock_http2_connections(self):
+        """Wrap the h2 state of pooled HTTP/2 connections in ``_LockedH2State``.
+
+        Called when a connection starts its HTTP/2 preface: by then httpcore
+        has created it, and no other thread uses it before the preface.
+        """
+        for connection in self.client._transport._pool.connections:
+            http2_connection = getattr(connection, "_connection", None)
+            state = getattr(http2_connection, "_h2_state", None)
+            if state is not None and not isinstance(state, _LockedH2State):
+                http2_connection._h2_state = _LockedH2State(state, self._h2_lock)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        headers = [(name, value) for name, value in request.headers.items() if name.lower() not in _HOP_BY_HOP_HEADERS]
+        body = request.body.encode("utf-8") if isinstance(request.body, str) else request.body
+        retry = self.max_retries
+        origin = urlsplit(request.url)[:2]
+
+        while True:
+            slot = _Slot(None if origin in self._http2_origins else self._slots, self.stats)
+            if self._stream_lock is not None:
+                self._stream_lock.acquire()
+            trace = _Trace(self.stats, self._stream_lock, on_http2_connection=self._lock_http2_connections)
+            try:
+                outgoing = self.client.build_request(
+                    request.method,
+                    request.url,
+                    headers=headers,
+                    content=body,
+                    timeout=_timeout(timeout),
+                    extensions={"trace": trace},
+                )
+                response = self.client.send(outgoing, stream=True)
+            except httpx.TransportError as exc:
+                trace.release_stream_lock()
+                slot.release()
+                trace.finish(None)
+                try:
+                    retry = retry.increment(request.method, request.url, error=_retry_error(exc))
+                except HTTPError:
+                    raise _requests_error(exc, request) from exc
+                retry.sleep()
+                continue
+            except BaseException:
+                trace.release_stream_lock()
+                slot.release()
+                raise
+            trace.release_stream_lock()
+            trace.finish(response.http_version)
+            if response.http_version == "HTTP/2":
+                self._http2_origins.add(origin)
+
+            if retry.is_retry(request.method, response.status_code, "Retry-After" in response.headers):
+                try:
+                    retry = retry.increment(request.method, request.url, response=_RetryView(response))
+                except HTTPError:
+                    return self.build_response(request, response, slot)  # out of retries: the last response
+                response.read()
+                response.close()
+                slot.release()
+                retry.sleep(_RetryView(response))
+                continue
+            return self.build_response(request, response, slot)
+
+    def build_response(
+        self, request: requests.PreparedRequest, response: httpx.Response, slot: _Slot
+    ) -> requests.Response:
+        result = requests.Response()
+        result.status_code = response.status_code
+        result.headers = CaseInsensitiveDict(response.headers.items())
+        result.encoding = get_encoding_from_headers(result.headers)
+        result.reason = response.reason_phrase
+        result.raw = _HttpxRaw(response, slot)
+        result.url = request.url
+        result.request = request
+        result.connection = self
+        return result
+
+    def close(self):
+        self.client.close()
@@ -1,32 +1,45 @@
 """
 Application settings loaded from environment variables.
 
-All required variables are validated at import time.
-If any required variable is missing, the module raises EnvironmentError
-with a clear message.
+Settings are resolved lazily: importing this module reads nothing. The first
+call to ``get_settings()`` loads the root .env file, validates the required
+variables and caches the result, so ``pytest --collect-only`` and every
+xdist worker only pay for it once it is actually needed. If a required
+variable is missing, that first call raises EnvironmentError with a clear
+message. BASE_URL and API_TOKEN are not required when USE_FAKE_API is set
+or CASSETTE_MODE is "replay".
+
+Module attributes (``settings.BASE_URL``) still work and resolve through
+``get_settings()``, but avoid ``from config.settings import BASE_URL`` at
+module level — it forces resolution at import time.
 
 Locally: values are loaded from the root .env file via python-dotenv.
 On CI: values are injected via GitHub Secrets → workflow env.
 """
 
 import os
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
-from dotenv import load_dotenv
+
+# Endpoints
+EMPLOYEES_ENDPOINT = "/api/Employees"
+
+
+def get_employee_by_id_endpoint(employee_id: str) -> str:
+    """Return the endpoint for a specific employee by ID."""
+    return f"{EMPLOYEES_ENDPOINT}/{employee_id}"
 
 
 def _find_project_root() -> Path:
     """Walk up from this file to find the project root (contains .git)."""
     current = Path(__file__).resolve().parent
-    while current != current.parent:
-        if (current / ".git").is_dir():
-            return current
-        current = current.parent
+    for parent in [current, *current.parents]:
+        if (parent / ".git").exists():
+            return parent
     raise FileNotFoundError("Could not find project root (.git directory not found)")
 
 
-load_dotenv(_find_project_root() / ".env")
-
-
 def _require_env(name: str) -> str:
     """Return the value of an environment variable or raise if missing."""
     value = os.getenv(name)
@@ -38,16 +51,117 @@ def _require_env(name: str) -> str:
     return value
 
 
-BASE_URL = _require_env("BASE_URL")
-API_TOKEN = _require_env("API_TOKEN")
+def _env_flag(name: str) -> bool:
+    """Return True if an environment variable is set to a truthy value."""
+    return os.getenv(name, "").strip().lower() in ("1", "true", "yes", "on")
 
-# Timeouts (seconds) — optional, has a sensible default
-REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "30"))
 
-# Endpoints
-EMPLOYEES_ENDPOINT = "/api/Employees"
+@dataclass(frozen=True)
+class Settings:
+    """Resolved settings; field names match their environment variables."""
 
+    BASE_URL: str
+    API_TOKEN: str
+    # Offline mode — run against the in-process fake API (see fake_api/)
+    USE_FAKE_API: bool
+    FAKE_API_DEFECTS: bool
+    # Record/replay cassette (see clients/cassette.py) — "record", "replay" or ""
+    CASSETTE_MODE: str
+    CASSETTE_PATH: str
+    # Faker seed used while recording or replaying, so generated payloads repeat
+    CASSETTE_SEED: int
+    # Payload pool (see utils/data_factory.py) — identities generated up front
+    PAYLOAD_POOL_SIZE: int
+    PAYLOAD_SEED: int
+    # Persistent ledger of created employee IDs (see utils/ledger.py)
+    LEDGER_PATH: str
+    # Timeouts (seconds)
+    REQUEST_TIMEOUT: int
+    # Retries. Idempotent methods (GET/PUT/DELETE) are retried on 429/502/503/504
+    # and connection errors with exponential backoff and jitter, honouring
+    # Retry-After. POST is only retried when RETRY_POST is set, 500 only when
+    # RETRY_SERVER_ERRORS is set.
+    RETRY_TOTAL: int
+    RETRY_BACKOFF: float
+    RETRY_BACKOFF_MAX: float
+    RETRY_JITTER: float
+    RETRY_POST: bool
+    RETRY_SERVER_ERRORS: bool
+    # Client-side rate limit (requests/second across all threads) — 0 disables
+    RATE_LIMIT_RPS: float
+    RATE_LIMIT_BURST: int
+    # Request log (see utils/request_log.py): fraction of successful calls
+    # logged, exchanges kept for failing tests, bytes of each body kept
+    REQUEST_LOG_SAMPLE: float
+    REQUEST_LOG_BUFFER: int
+    REQUEST_LOG_BODY_LIMIT: int
+    # Connection pool
+    MAX_CONNECTIONS: int
+    KEEPALIVE_EXPIRY: float
+    # BaseClient transport (see clients/transport.py) — "http1" or "http2"
+    HTTP_TRANSPORT: str
 
-def get_employee_by_id_endpoint(employee_id: str) -> str:
-    """Return the endpoint for a specific employee by ID."""
-    return f"{EMPLOYEES_ENDPOINT}/{employee_id}"
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Load .env, validate and return the settings (cached after the first call)."""
+    from dotenv import load_dotenv  # deferred: only needed on first access
+
+    load_dotenv(_find_project_root() / ".env")
+
+    use_fake_api = _env_flag("USE_FAKE_API")
+    cassette_mode = os.getenv("CASSETTE_MODE", "").strip().lower()
+
+    if cassette_mode == "replay":
+        # Nothing is sent; any syntactically valid URL will do.
+        base_url = os.getenv("BASE_URL") or "http://cassette.invalid"
+        api_token = os.getenv("API_TOKEN") or "cassette-api-token"
+    elif use_fake_api:
+        # The fake server's URL is only known once it starts; conftest supplies it.
+        base_url = os.getenv("BASE_URL", "")
+        api_token = os.getenv("API_TOKEN") or "fake-api-token"
+    else:
+        base_url = _require_env("BASE_URL")
+        api_token = _require_env("API_TOKEN")
+
+    return Settings(
+        BASE_URL=base_url,
+        API_TOKEN=api_token,
+        USE_FAKE_API=use_fake_api,
+        FAKE_API_DEFECTS=_env_flag("FAKE_API_DEFECTS"),
+        CASSETTE_MODE=cassette_mode,
+        CASSETTE_PATH=os.getenv(
+            "CASSETTE_PATH", str(Path(__file__).resolve().parent.parent / "cassettes" / "api")
+        ),
+        CASSETTE_SEED=int(os.getenv("CASSETTE_SEED", "1234")),
+        PAYLOAD_POOL_SIZE=int(os.getenv("PAYLOAD_POOL_SIZE", "1000")),
+        PAYLOAD_SEED=int(os.getenv("PAYLOAD_SEED", "0")),
+        LEDGER_PATH=os.getenv(
+            "LEDGER_PATH", str(Path(__file__).resolve().parent.parent / ".employee-ledger.jsonl")
+        ),
+        REQUEST_TIMEOUT=int(os.getenv("REQUEST_TIMEOUT", "30")),
+        RETRY_TOTAL=int(os.getenv("RETRY_TOTAL", "3")),
+        RETRY_BACKOFF=float(os.getenv("RETRY_BACKOFF", "0.5")),
+        RETRY_BACKOFF_MAX=float(os.getenv("RETRY_BACKOFF_MAX", "10")),
+        RETRY_JITTER=float(os.getenv("RETRY_JITTER", "0.25")),
+        RETRY_POST=_env_flag("RETRY_POST"),
+        RETRY_SERVER_ERRORS=_env_flag("RETRY_SERVER_ERRORS"),
+        RATE_LIMIT_RPS=float(os.getenv("RATE_LIMIT_RPS", "0")),
+        RATE_LIMIT_BURST=int(os.getenv("RATE_LIMIT_BURST", "1")),
+        REQUEST_LOG_SAMPLE=float(os.getenv("REQUEST_LOG_SAMPLE", "0")),
+        REQUEST_LOG_BUFFER=int(os.getenv("REQUEST_LOG_BUFFER", "20")),
+        REQUEST_LOG_BODY_LIMIT=int(os.getenv("REQUEST_LOG_BODY_LIMIT", "2048")),
+        MAX_CONNECTIONS=int(os.getenv("MAX_CONNECTIONS", "20")),
+        KEEPALIVE_EXPIRY=float(os.getenv("KEEPALIVE_EXPIRY", "30")),
+        HTTP_TRANSPORT=os.getenv("HTTP_TRANSPORT", "http1").strip().lower(),
+    )
+
+
+_SETTING_NAMES = frozenset(field.name for field in fields(Settings))
+
+
+def __getattr__(name: str):
+    """Resolve module-level settings (``settings.BASE_URL``) on first access."""
+    if name in _SETTING_NAMES:
+        return getattr(get_settings(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
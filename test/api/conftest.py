@@ -2,24 +2,401 @@
 Root conftest.py — shared fixtures for the entire API test suite.
 """
 
+import logging
+import os
+import ssl
+import uuid
+
 import pytest
+import pytest_asyncio
 
+from clients.async_employees_client import AsyncEmployeesClient
+from clients.cassette import (
+    RECORD,
+    REPLAY,
+    Cassette,
+    current_scope,
+    merge_cassettes,
+    remove_cassette,
+    set_scope,
+    worker_cassette_path,
+    worker_cassettes,
+)
 from clients.employees_client import EmployeesClient
+from clients.transport import HTTP2
+from clients.response_cache import ResponseCache
+from config.settings import get_settings
+from fake_api import FakeEmployeesServer
+from utils import data_factory
 from utils.data_factory import generate_employee_payload
+from utils.employee_pool import EmployeePool
+from utils.ledger import EmployeeLedger
+from utils.namespace import run_id
+from utils.registry import EmployeeRegistry
+from utils.sweeper import sweep
+
+logger = logging.getLogger(__name__)
+
+pytest_plugins = ["plugins.latency_report", "plugins.request_log", "plugins.scheduler"]
+
+# Markers of slow, load-heavy tests that only run with their opt-in flag,
+# whatever -m selects
+OPT_IN_MARKERS = {"benchmark": "--run-benchmarks", "fuzz": "--run-fuzz"}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--employee-pool-size",
+        type=int,
+        default=2,
+        help="Employees bulk-created up front for the pooled_employee fixtures (default 2).",
+    )
+    parser.addoption(
+        "--no-sweep",
+        action="store_true",
+        default=False,
+        help="Skip the end-of-session sweep of records this run left on the backend.",
+    )
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run the tests marked benchmark (deselected otherwise, even by -m).",
+    )
+    parser.addoption(
+        "--run-fuzz",
+        action="store_true",
+        default=False,
+        help="Run the tests marked fuzz (deselected otherwise, even by -m).",
+    )
+    parser.addoption(
+        "--benchmark-sizes",
+        default="100,1000,10000",
+        help="Dataset sizes for the list-endpoint benchmark (default 100,1000,10000).",
+    )
+    parser.addoption(
+        "--benchmark-repeats",
+        type=int,
+        default=5,
+        help="Timed repetitions per benchmark measurement (default 5).",
+    )
+    parser.addoption(
+        "--fuzz-cases",
+        type=int,
+        default=500,
+        help="Cases sent by the contract fuzzer (default 500).",
+    )
+    parser.addoption(
+        "--fuzz-seed",
+        type=int,
+        default=0,
+        help="Seed for the contract fuzzer's case generator (default 0).",
+    )
+    parser.addoption(
+        "--benchmark-json",
+        default="benchmark-results.json",
+        help="Where the list-endpoint benchmark writes its results (default benchmark-results.json).",
+    )
+
+
+def _persistent_backend(settings) -> bool:
+    """True when records outlive the session (not the fake API or a replay)."""
+    return not settings.USE_FAKE_API and settings.CASSETTE_MODE != REPLAY
+
+
+def _recording() -> bool:
+    try:
+        return get_settings().CASSETTE_MODE == RECORD
+    except EnvironmentError:
+        return False
+
+
+def _is_xdist_controller(config) -> bool:
+    return getattr(config.option, "dist", "no") != "no" and not hasattr(config, "workerinput")
+
+
+def pytest_configure(config):
+    if not _is_xdist_controller(config):
+        return
+    # xdist only hands its run UID to workers; fix it up front so the
+    # controller's session-finish sweep sees the same run namespace.
+    if getattr(config.option, "testrunuid", None) is None:
+        config.option.testrunuid = uuid.uuid4().hex
+    os.environ["PYTEST_XDIST_TESTRUNUID"] = config.option.testrunuid
+
+    # Worker cassettes left by an interrupted recording would be merged
+    # into this one
+    try:
+        settings = get_settings()
+    except EnvironmentError:
+        return
+    if settings.CASSETTE_MODE == RECORD:
+        # Each worker would provision its own employee pool, and replayed
+        # tests would meet a pool recorded by another worker; pool tests are
+        # grouped onto one worker instead (pytest_collection_modifyitems)
+        if config.option.dist != "loadgroup":
+            raise pytest.UsageError(
+                "CASSETTE_MODE=record under pytest-xdist needs --dist loadgroup, "
+                "so the employee pool is provisioned and recorded by one worker"
+            )
+        for part in worker_cassettes(settings.CASSETTE_PATH):
+            remove_cassette(part)
+
+
+# tryfirst: xdist reads the xdist_group marks in its own modifyitems hook
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Deselect benchmark and fuzz tests unless their opt-in flag is given.
+
+    While recording, also group the tests that use a provisioning fixture,
+    so ``--dist loadgroup`` runs them on the one worker that records the pool.
+    """
+    if _recording():
+        # Imported here: pytest_plugins must load the plugin first, so its
+        # assertions are rewritten
+        from plugins.scheduler import provisioning_fixture
+
+        for item in items:
+            provisioning = provisioning_fixture(item)
+            if provisioning:
+                item.add_marker(pytest.mark.xdist_group(provisioning))
+
+    skipped = [marker for marker, flag in OPT_IN_MARKERS.items() if not config.getoption(flag)]
+    if not skipped:
+        return
+    selected, deselected = [], []
+    for item in items:
+        opted_out = any(item.get_closest_marker(marker) for marker in skipped)
+        (deselected if opted_out else selected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    """
+    Merge the workers' cassettes after a distributed recording, then delete
+    whatever this run left on the backend: records in this run's namespace
+    plus this run's outstanding ledger entries. Runs once, on the xdist
+    controller (or the only process), after fixture teardown.
+    """
+    config = session.config
+    if hasattr(config, "workerinput") or config.option.collectonly:
+        return
+    try:
+        settings = get_settings()
+    except EnvironmentError:
+        return  # already reported by the fixtures that needed settings
+    if settings.CASSETTE_MODE == RECORD and _is_xdist_controller(config):
+        parts = worker_cassettes(settings.CASSETTE_PATH)
+        entries = merge_cassettes(settings.CASSETTE_PATH, parts)
+        logger.info(f"Merged {len(parts)} worker cassette(s) into {settings.CASSETTE_PATH} ({entries} entries)")
+    if config.getoption("--no-sweep") or not _persistent_backend(settings):
+        return
+    try:
+        with EmployeesClient() as client:
+            report = sweep(client, ledger=EmployeeLedger(settings.LEDGER_PATH), run=run_id())
+    except Exception as exc:  # noqa: BLE001 — never fail the run over cleanup
+        logger.warning(f"Orphan sweep failed: {exc}")
+        return
+    if report.found or report.stale:
+        logger.info(f"Orphan sweep: {report.summary()}")
+
+
+def _test_scope(item) -> str:
+    """The test's node ID, without the ``@group`` suffix ``--dist loadgroup`` adds."""
+    group = item.get_closest_marker("xdist_group")
+    suffix = f"@{group.args[0]}" if group and group.args else ""
+    if suffix and item.nodeid.endswith(suffix):
+        return item.nodeid[:-len(suffix)]
+    return item.nodeid
+
+
+def _seed_for_cassette(scope: str):
+    """Seed Faker for ``scope`` (a test ID), as it was seeded when recording."""
+    data_factory.seed(f"{get_settings().CASSETTE_SEED}:{scope}")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Seed Faker per test while recording/replaying, so each test generates
+    the same payloads it generated when the cassette was recorded, and file
+    the test's requests under its node ID in the cassette."""
+    settings = get_settings()
+    if settings.CASSETTE_MODE:
+        # Recorded usernames carry the run namespace; pin it so a replay
+        # generates the same payloads as the recording.
+        os.environ.setdefault("TEST_RUN_ID", f"cassette-{settings.CASSETTE_SEED}")
+        scope = _test_scope(item)
+        set_scope(scope)
+        _seed_for_cassette(scope)
 
 
 @pytest.fixture(scope="session")
-def employees_client():
+def cassette(request):
+    """
+    The record/replay cassette selected by CASSETTE_MODE, or None.
+    Recording writes the cassette index when the session ends. Under xdist
+    each worker records its own cassette; the controller merges them.
+    """
+    settings = get_settings()
+    if not settings.CASSETTE_MODE:
+        yield None
+        return
+    path = settings.CASSETTE_PATH
+    if settings.CASSETTE_MODE == RECORD and hasattr(request.config, "workerinput"):
+        path = worker_cassette_path(path, request.config.workerinput["workerid"])
+    recorded = Cassette(path, settings.CASSETTE_MODE)
+    yield recorded
+    recorded.close()
+
+
+@pytest.fixture(scope="session")
+def fake_api():
+    """
+    Start the in-process fake Employees API on an ephemeral port when
+    USE_FAKE_API is set. Yields None when running against the real API.
+    """
+    settings = get_settings()
+    if not settings.USE_FAKE_API or settings.CASSETTE_MODE == REPLAY:
+        yield None
+        return
+    with FakeEmployeesServer(token=settings.API_TOKEN, emulate_defects=settings.FAKE_API_DEFECTS) as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def api_base_url(fake_api):
+    """Base URL every client fixture targets: the fake server or BASE_URL."""
+    return fake_api.url if fake_api else get_settings().BASE_URL
+
+
+@pytest.fixture(scope="session")
+def employee_registry():
+    """
+    Per-worker registry of employees created through ``employees_client``
+    and not yet deleted. Each xdist worker is its own process, so each gets
+    its own registry and only ever cleans up its own records.
+
+    On a persistent backend every add/delete is also written to the shared
+    ledger, so the sweeper can find the records if a worker dies.
+    """
+    settings = get_settings()
+    if _persistent_backend(settings):
+        return EmployeeRegistry(ledger=EmployeeLedger(settings.LEDGER_PATH))
+    return EmployeeRegistry()
+
+
+@pytest.fixture(scope="session")
+def employees_client(api_base_url, employee_registry, cassette):
     """Provide a session-scoped EmployeesClient instance."""
-    client = EmployeesClient()
+    client = EmployeesClient(base_url=api_base_url, registry=employee_registry, cassette=cassette)
+    yield client
+
+    # Teardown: remove anything tests left behind (e.g. failed before cleanup)
+    leftovers = employee_registry.ids()
+    if leftovers:
+        client.delete_employees(leftovers)
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def _cached_employees_client(api_base_url, employee_registry, cassette):
+    client = EmployeesClient(
+        base_url=api_base_url,
+        registry=employee_registry,
+        cassette=cassette,
+        response_cache=ResponseCache(),
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture()
+def cached_employees_client(_cached_employees_client):
+    """
+    EmployeesClient with a read cache (ETag/Last-Modified revalidation, short
+    TTL otherwise) for tests that re-read unchanged state. Writes through it
+    invalidate the affected entries; the cache is emptied after each test.
+    """
+    yield _cached_employees_client
+    _cached_employees_client.response_cache.clear()
+
+
+@pytest.fixture(scope="session")
+def _transport_clients():
+    clients = {}
+    yield clients
+    for client in clients.values():
+        client.close()
+
+
+@pytest.fixture()
+def transport_client(request, _transport_clients, api_base_url, employee_registry, cassette):
+    """
+    EmployeesClient over the transport named by the test's indirect
+    parameter (see clients/transport.py), with its connection counters
+    reset for the test.
+    """
+    if cassette is not None:
+        pytest.skip("A cassette replaces the client transport")
+    transport = request.param
+    if transport == HTTP2:
+        pytest.importorskip("h2", reason='The http2 transport needs h2 (pip install "httpx[http2]")')
+    client = _transport_clients.get(transport)
+    if client is None:
+        client = _transport_clients[transport] = EmployeesClient(
+            base_url=api_base_url,
+            registry=employee_registry,
+            transport=transport,
+        )
+    client.connection_stats.reset()
+    return client
+
+
+@pytest.fixture(scope="session")
+def https_fake_api(fake_api):
+    """
+    The fake API behind a TLS + HTTP/2 front end (fake_api/http2.py) with a
+    throwaway certificate authority. Yields (front end, CA bundle path).
+    Skipped unless the suite runs against the fake API.
+    """
+    if fake_api is None:
+        pytest.skip("Needs the fake API (USE_FAKE_API=1)")
+    http2 = pytest.importorskip("fake_api.http2", reason='Needs h2 (pip install "httpx[http2]")')
+    trustme = pytest.importorskip("trustme")
+    authority = trustme.CA()
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    authority.issue_cert("127.0.0.1").configure_cert(context)
+    with authority.cert_pem.tempfile() as ca_bundle, http2.Http2Frontend(fake_api.url, context) as frontend:
+        yield frontend, ca_bundle
+
+
+@pytest.fixture()
+def https_http2_client(https_fake_api, employee_registry, monkeypatch):
+    """
+    EmployeesClient on the http2 transport talking to ``https_fake_api``.
+    Its pool is two connections, so HTTP/1.1 would make most concurrent
+    requests wait.
+    """
+    frontend, ca_bundle = https_fake_api
+    # httpx loads SSL_CERT_FILE when the client is created
+    monkeypatch.setenv("SSL_CERT_FILE", ca_bundle)
+    client = EmployeesClient(
+        base_url=frontend.url,
+        registry=employee_registry,
+        transport=HTTP2,
+        max_connections=2,
+    )
     yield client
     client.close()
 
 
 @pytest.fixture(scope="session")
-def unauthenticated_client():
+def unauthenticated_client(api_base_url, cassette):
     """Provide an EmployeesClient with no auth token."""
-    client = EmployeesClient(token=None)
+    client = EmployeesClient(base_url=api_base_url, token=None, cassette=cassette)
     yield client
     client.close()
 
@@ -43,3 +420,77 @@ def created_employee(employees_client):
     # Teardown: delete the employee if it still exists
     if employee_id:
         employees_client.delete_employee(str(employee_id))
+
+
+@pytest.fixture(scope="session")
+def employee_pool(employees_client, request):
+    """
+    Session pool of pre-created employees, provisioned in one bulk call and
+    deleted in one concurrent batch at session end.
+    """
+    pool = EmployeePool(employees_client, size=request.config.getoption("--employee-pool-size"))
+    cassette_mode = get_settings().CASSETTE_MODE
+    if cassette_mode:
+        # Same payloads whichever test sets the pool up; then hand that test
+        # back the payloads it would have had without provisioning
+        scope = current_scope()
+        _seed_for_cassette("employee_pool")
+    pool.provision()
+    if cassette_mode:
+        _seed_for_cassette(scope)
+    yield pool
+    pool.drain()
+
+
+@pytest.fixture()
+def pooled_employee(employee_pool, request):
+    """
+    Lend a pooled employee to a test that only reads it.
+    Yields a tuple of (response_data, payload), like ``created_employee``.
+    """
+    employee = employee_pool.acquire(key=_test_scope(request.node))
+    yield employee
+    employee_pool.release(employee)
+
+
+@pytest.fixture()
+def mutable_pooled_employee(employee_pool, request):
+    """
+    Lend a pooled employee to a test that may modify it; it is reset to its
+    original payload via PUT afterwards instead of being recreated.
+    Yields a tuple of (response_data, payload), like ``created_employee``.
+    """
+    employee = employee_pool.acquire(key=_test_scope(request.node))
+    yield employee
+    employee_pool.release(employee, dirty=True)
+
+
+@pytest_asyncio.fixture()
+async def async_employees_client(api_base_url):
+    """Provide an AsyncEmployeesClient backed by a pooled keep-alive connection."""
+    if get_settings().CASSETTE_MODE == REPLAY:
+        pytest.skip("The async client talks to the network directly; cassettes cover the sync client only")
+    client = AsyncEmployeesClient(base_url=api_base_url)
+    yield client
+    await client.close()
+
+
+@pytest_asyncio.fixture()
+async def async_created_employee(async_employees_client):
+    """
+    Async counterpart of ``created_employee``.
+    Yields a tuple of (response_data, payload) so tests can reference both.
+    """
+    payload = generate_employee_payload()
+    response = await async_employees_client.create_employee(payload)
+    assert response.status_code == 200, (
+        f"Setup: failed to create employee. Status: {response.status_code}, Body: {response.text}"
+    )
+    data = response.json()
+    employee_id = data.get("id")
+
+    yield data, payload
+
+    # Teardown: delete the employee if it still exists
+    if employee_id:
+        await async_employees_client.delete_employee(str(employee_id))
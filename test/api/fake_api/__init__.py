@@ -0,0 +1,5 @@
+"""In-process fake of the Employees API for offline runs."""
+
+from fake_api.server import EmployeeStore, FakeEmployeesServer
+
+__all__ = ["EmployeeStore", "FakeEmployeesServer"]
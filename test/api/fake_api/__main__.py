@@ -0,0 +1,33 @@
+"""
+Run the fake Employees API standalone.
+
+    python -m fake_api --port 8000 [--defects] [--token TOKEN]
+"""
+
+import argparse
+import logging
+import time
+
+from fake_api.server import FakeEmployeesServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local fake of /api/Employees.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--token", default=None, help="Require 'Basic <token>' (any token if omitted)")
+    parser.add_argument("--defects", action="store_true", help="Emulate defects/api-bugs behaviour")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    with FakeEmployeesServer(args.host, args.port, args.token, args.defects) as server:
+        print(f"Fake Employees API on {server.url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+HTTP/2 front end for the fake Employees API.
+
+``FakeEmployeesServer`` speaks plain HTTP/1.1 (``http.server``).
+``Http2Frontend`` terminates TLS, negotiates ``h2`` through ALPN and relays
+every stream to a backend such as the fake server over HTTP/1.1, so the
+http2 transport (clients/transport.py) can be exercised end to end.
+
+Each TLS connection is served by one thread with one backend connection.
+Requests arrive multiplexed, and responses are sent in the order the
+requests completed. The caller supplies the server-side ``ssl.SSLContext``;
+the tests issue a throwaway certificate with ``trustme``.
+"""
+
+import http.client
+import logging
+import socketserver
+import ssl
+import threading
+from collections import deque
+from urllib.parse import urlsplit
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.exceptions
+
+logger = logging.getLogger(__name__)
+
+# Connection-specific headers; HTTP/2 forbids them
+_HOP_BY_HOP_HEADERS = frozenset({"connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"})
+
+
+class _Http2Session:
+    """One client connection: reads frames, relays complete requests, writes responses."""
+
+    def __init__(self, sock: ssl.SSLSocket, backend: http.client.HTTPConnection):
+        self.sock = sock
+        self.backend = backend
+        self.conn = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        # stream id -> (headers, body) of requests still being received
+        self._receiving = {}
+        # (stream id, headers, body) of complete requests, in arrival order
+        self._ready = deque()
+        self._open = True
+
+    def run(self):
+        self.conn.initiate_connection()
+        self._flush()
+        while self._open:
+            if self._ready:
+                self._respond(*self._ready.popleft())
+            else:
+                self._receive()
+
+    def _flush(self):
+        data = self.conn.data_to_send()
+        if data:
+            self.sock.sendall(data)
+
+    def _receive(self):
+        data = self.sock.recv(65535)
+        if not data:
+            self._open = False
+            return
+        for event in self.conn.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                self._receiving[event.stream_id] = (dict(event.headers), bytearray())
+            elif isinstance(event, h2.events.DataReceived):
+                self._receiving[event.stream_id][1].extend(event.data)
+                self.conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, h2.events.StreamEnded):
+                headers, body = self._receiving.pop(event.stream_id)
+                self._ready.append((event.stream_id, headers, bytes(body)))
+            elif isinstance(event, h2.events.StreamReset):
+                self._receiving.pop(event.stream_id, None)
+            elif isinstance(event, h2.events.ConnectionTerminated):
+                self._open = False
+        self._flush()
+
+    def _respond(self, stream_id: int, headers: dict, body: bytes):
+        forwarded = {name: value for name, value in headers.items() if not name.startswith(":")}
+        forwarded["host"] = headers.get(":authority", "")
+        self.backend.request(headers[":method"], headers[":path"], body=body or None, headers=forwarded)
+        response = self.backend.getresponse()
+        payload = response.read()
+
+        response_headers = [(":status", str(response.status))] + [
+            (name.lower(), value)
+            for name, value in response.getheaders()
+            if name.lower() not in _HOP_BY_HOP_HEADERS
+        ]
+        try:
+            self.conn.send_headers(stream_id, response_headers, end_stream=not payload)
+            remaining = memoryview(payload)
+            while remaining and self._open:
+                size = min(self.conn.local_flow_control_window(stream_id), self.conn.max_outbound_frame_size)
+                if size <= 0:
+                    # Wait for the client to open its window
+                    self._flush()
+                    self._receive()
+                    continue
+                self.conn.send_data(stream_id, remaining[:size].tobytes(), end_stream=len(remaining) <= size)
+                remaining = remaining[size:]
+            self._flush()
+        except h2.exceptions.StreamClosedError:
+            pass  # the client reset the stream
+
+
+class _Http2Handler(socketserver.BaseRequestHandler):
+    def handle(self):
+        try:
+            sock = self.server.ssl_context.wrap_socket(self.request, server_side=True)
+        except (ssl.SSLError, OSError) as exc:
+            logger.debug(f"HTTP/2 front end: TLS handshake failed: {exc}")
+            return
+        if sock.selected_alpn_protocol() != "h2":
+            sock.close()
+            return
+        self.server.count_connection()
+
+        backend = http.client.HTTPConnection(self.server.backend.hostname, self.server.backend.port, timeout=30)
+        try:
+            _Http2Session(sock, backend).run()
+        except (OSError, h2.exceptions.ProtocolError) as exc:
+            logger.debug(f"HTTP/2 front end: connection closed: {exc}")
+        finally:
+            backend.close()
+            sock.close()
+
+
+class _Http2Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, backend_url: str, ssl_context: ssl.SSLContext):
+        super().__init__(address, _Http2Handler)
+        self.backend = urlsplit(backend_url)
+        self.ssl_context = ssl_context
+        self.connections = 0
+        self._lock = threading.Lock()
+
+    def count_connection(self):
+        with self._lock:
+            self.connections += 1
+
+
+class Http2Frontend:
+    """TLS + HTTP/2 server relaying to an HTTP/1.1 backend URL.
+
+    Binds to an ephemeral port by default; use ``url`` as a client
+    ``base_url``. ``ssl_context`` needs a certificate for the host.
+    Usable as a context manager.
+    """
+
+    def __init__(self, backend_url: str, ssl_context: ssl.SSLContext, host: str = "127.0.0.1", port: int = 0):
+        ssl_context.set_alpn_protocols(["h2"])
+        self._server = _Http2Server((host, port), backend_url, ssl_context)
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"https://{host}:{port}"
+
+    @property
+    def connections(self) -> int:
+        """HTTP/2 connections accepted so far."""
+        return self._server.connections
+
+    def start(self):
+        """Start serving on a background thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="fake-employees-api-h2", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"HTTP/2 front end listening on {self.url}")
+        return self
+
+    def stop(self):
+        """Stop serving and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
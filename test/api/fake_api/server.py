@@ -0,0 +1,372 @@
+"""
+In-process stand-in for the Employees API.
+
+Serves ``/api/Employees`` (GET list, GET by id, POST, PUT, DELETE) from an
+in-memory store using the README benefits rules. GET responses carry an
+ETag and answer a matching ``If-None-Match`` with 304. With ``emulate_defects``
+it reproduces the behaviour documented in ``defects/api-bugs/`` instead of
+the OpenAPI contract, so the suite can be run offline in either mode.
+"""
+
+import hashlib
+import json
+import logging
+import random
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from config.settings import EMPLOYEES_ENDPOINT
+
+logger = logging.getLogger(__name__)
+
+# Benefits rules (see project README)
+PAYCHECKS_PER_YEAR = 26
+EMPLOYEE_BENEFITS_COST = 1000
+DEPENDANT_BENEFITS_COST = 500
+DEFAULT_SALARY = 52000.0
+
+# OpenAPI constraints
+MAX_STRING_LENGTH = 50
+MIN_DEPENDANTS = 0
+MAX_DEPENDANTS = 32
+REQUIRED_FIELDS = ("username", "firstName", "lastName")
+
+PARTITION_KEY = "TestUser"
+EXPIRATION_TTL = timedelta(days=1)
+
+
+class EmployeeStore:
+    """Thread-safe in-memory employee table."""
+
+    def __init__(self, emulate_defects: bool = False):
+        self.emulate_defects = emulate_defects
+        self._employees = {}
+        # Defect 4: deleted employees stay retrievable by ID
+        self._deleted = {}
+        self._lock = threading.Lock()
+
+    def list(self) -> list:
+        with self._lock:
+            return list(self._employees.values())
+
+    def get(self, employee_id: str) -> Optional[dict]:
+        with self._lock:
+            employee = self._employees.get(employee_id)
+            if employee is None and self.emulate_defects:
+                employee = self._deleted.get(employee_id)
+            return employee
+
+    def create(self, payload: dict) -> dict:
+        employee_id = str(uuid.uuid4())
+        employee = self._build(employee_id, payload)
+        with self._lock:
+            self._employees[employee_id] = employee
+        return employee
+
+    def update(self, employee_id: str, payload: dict) -> Optional[dict]:
+        with self._lock:
+            if employee_id not in self._employees:
+                if not self.emulate_defects:
+                    return None
+                # Defect 7: PUT for an unknown ID succeeds without storing anything
+                return self._build(employee_id, payload)
+            employee = self._build(employee_id, payload)
+            self._employees[employee_id] = employee
+            return employee
+
+    def delete(self, employee_id: str) -> bool:
+        with self._lock:
+            employee = self._employees.pop(employee_id, None)
+            if employee is not None:
+                self._deleted[employee_id] = employee
+            # Defect 5: DELETE reports success for unknown/already-deleted IDs
+            return employee is not None or self.emulate_defects
+
+    def _build(self, employee_id: str, payload: dict) -> dict:
+        """Build a stored employee record, including computed pay fields."""
+        dependants = payload.get("dependants")
+        dependants = 0 if dependants is None else dependants
+        salary = payload.get("salary")
+        salary = DEFAULT_SALARY if salary is None else float(salary)
+
+        username = payload.get("username")
+        if self.emulate_defects:
+            # Defect 1: the provided username is replaced with a generated one
+            username = f"TestUser{random.randint(100, 999)}"
+
+        gross = salary / PAYCHECKS_PER_YEAR
+        benefits_cost = (
+            EMPLOYEE_BENEFITS_COST + DEPENDANT_BENEFITS_COST * dependants
+        ) / PAYCHECKS_PER_YEAR
+        expiration = datetime.now(timezone.utc) + EXPIRATION_TTL
+
+        return {
+            "partitionKey": PARTITION_KEY,
+            "sortKey": employee_id,
+            "username": username,
+            "id": employee_id,
+            "firstName": payload.get("firstName"),
+            "lastName": payload.get("lastName"),
+            "dependants": dependants,
+            "expiration": expiration.isoformat(),
+            "salary": salary,
+            "gross": gross,
+            "benefitsCost": benefits_cost,
+            "net": gross - benefits_cost,
+        }
+
+
+def validate_employee_payload(payload, emulate_defects: bool = False) -> dict:
+    """Return a field → message map of contract violations (empty if valid)."""
+    if not isinstance(payload, dict):
+        return {"": "A non-empty JSON object request body is required."}
+
+    errors = {}
+    # Defects 2, 3 and 8: names and dependants are not validated at all
+    if not emulate_defects:
+        for field in REQUIRED_FIELDS:
+            value = payload.get(field)
+            if value is None:
+                errors[field] = f"The {field} field is required."
+            elif not isinstance(value, str):
+                errors[field] = f"The {field} field must be a string."
+            elif len(value) > MAX_STRING_LENGTH:
+                errors[field] = (
+                    f"The field {field} must be a string with a maximum length of {MAX_STRING_LENGTH}."
+                )
+
+        dependants = payload.get("dependants")
+        if dependants is not None:
+            if isinstance(dependants, bool) or not isinstance(dependants, int):
+                errors["dependants"] = "The dependants field must be an integer."
+            elif not MIN_DEPENDANTS <= dependants <= MAX_DEPENDANTS:
+                errors["dependants"] = (
+                    f"The field dependants must be between {MIN_DEPENDANTS} and {MAX_DEPENDANTS}."
+                )
+    elif payload.get("dependants") is not None and not isinstance(payload["dependants"], int):
+        errors["dependants"] = "The dependants field must be an integer."
+
+    salary = payload.get("salary")
+    if salary is not None and (isinstance(salary, bool) or not isinstance(salary, (int, float))):
+        errors["salary"] = "The salary field must be a number."
+
+    return errors
+
+
+def _is_uuid(value) -> bool:
+    try:
+        uuid.UUID(str(value))
+    except ValueError:
+        return False
+    return True
+
+
+class _EmployeesHandler(BaseHTTPRequestHandler):
+    """Routes /api/Employees requests to the server's EmployeeStore."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "FakeEmployeesAPI/1.0"
+    # Headers and body are written separately; avoid Nagle/delayed-ACK stalls
+    disable_nagle_algorithm = True
+
+    # --- plumbing ---
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _send_json(self, status: int, body=None, etag: bool = False):
+        """Send a JSON response; with ``etag``, tag it and honour If-None-Match."""
+        data = b"" if body is None else json.dumps(body).encode("utf-8")
+        tag = f'"{hashlib.sha1(data).hexdigest()[:20]}"' if etag else None
+        if tag and self.headers.get("If-None-Match") == tag:
+            self.send_response(304)
+            self.send_header("ETag", tag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        if tag:
+            self.send_header("ETag", tag)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_validation_error(self, errors: dict):
+        self._send_json(400, {
+            "title": "One or more validation errors occurred.",
+            "status": 400,
+            "errors": {field: [message] for field, message in errors.items()},
+        })
+
+    def _read_body(self) -> bytes:
+        """Consume the request body so the keep-alive stream stays in sync."""
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _read_json(self):
+        """Return (ok, payload); ok is False if the body is not valid JSON."""
+        if not self._body:
+            return True, None
+        try:
+            return True, json.loads(self._body)
+        except ValueError:
+            return False, None
+
+    def _authorized(self) -> bool:
+        header = self.headers.get("Authorization")
+        token = self.server.token
+        if not header or (token and header != f"Basic {token}"):
+            self._send_json(401)
+            return False
+        return True
+
+    def _route(self):
+        """Return (matched, employee_id) for the request path."""
+        path = self.path.split("?", 1)[0]
+        if path.rstrip("/") == EMPLOYEES_ENDPOINT:
+            return True, None
+        prefix = f"{EMPLOYEES_ENDPOINT}/"
+        if path.startswith(prefix) and "/" not in path[len(prefix):]:
+            return True, path[len(prefix):]
+        return False, None
+
+    def _dispatch(self, handler):
+        self._body = self._read_body()
+        matched, employee_id = self._route()
+        if not matched:
+            self._send_json(404)
+            return
+        if not self._authorized():
+            return
+        handler(employee_id)
+
+    # --- verbs ---
+
+    def do_GET(self):
+        self._dispatch(self._get)
+
+    def do_POST(self):
+        self._dispatch(self._post)
+
+    def do_PUT(self):
+        self._dispatch(self._put)
+
+    def do_DELETE(self):
+        self._dispatch(self._delete)
+
+    def _get(self, employee_id):
+        store = self.server.store
+        if employee_id is None:
+            self._send_json(200, store.list(), etag=True)
+            return
+        if not _is_uuid(employee_id):
+            self._send_validation_error({"id": f"The value '{employee_id}' is not valid."})
+            return
+        employee = store.get(employee_id)
+        if employee is None:
+            # Defect 6: unknown IDs return 200 with an empty body
+            self._send_json(200 if store.emulate_defects else 404)
+            return
+        self._send_json(200, employee, etag=True)
+
+    def _post(self, employee_id):
+        if employee_id is not None:
+            self._send_json(405)
+            return
+        ok, payload = self._read_json()
+        errors = validate_employee_payload(payload, self.server.store.emulate_defects) if ok else {
+            "": "The request body is not valid JSON."
+        }
+        if errors:
+            self._send_validation_error(errors)
+            return
+        self._send_json(200, self.server.store.create(payload))
+
+    def _put(self, employee_id):
+        if employee_id is not None:
+            self._send_json(405)
+            return
+        ok, payload = self._read_json()
+        errors = validate_employee_payload(payload, self.server.store.emulate_defects) if ok else {
+            "": "The request body is not valid JSON."
+        }
+        if not errors and payload.get("id") is None and self.server.store.emulate_defects:
+            # Known API behaviour: a PUT without an id is rejected by routing
+            self._send_json(405)
+            return
+        if not errors and not _is_uuid(payload.get("id")):
+            errors["id"] = "A valid employee id is required."
+        if errors:
+            self._send_validation_error(errors)
+            return
+        employee = self.server.store.update(str(payload["id"]), payload)
+        if employee is None:
+            self._send_json(404)
+            return
+        self._send_json(200, employee)
+
+    def _delete(self, employee_id):
+        if employee_id is None:
+            self._send_json(405)
+            return
+        if not _is_uuid(employee_id):
+            self._send_validation_error({"id": f"The value '{employee_id}' is not valid."})
+            return
+        deleted = self.server.store.delete(employee_id)
+        self._send_json(200 if deleted else 404)
+
+
+class FakeEmployeesServer:
+    """Threaded HTTP server hosting the fake Employees API.
+
+    Binds to an ephemeral port by default; use ``url`` as a client
+    ``base_url``. Usable as a context manager.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        token: Optional[str] = None,
+        emulate_defects: bool = False,
+    ):
+        self._httpd = ThreadingHTTPServer((host, port), _EmployeesHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.store = EmployeeStore(emulate_defects=emulate_defects)
+        self._httpd.token = token
+        self._thread = None
+
+    @property
+    def store(self) -> EmployeeStore:
+        return self._httpd.store
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Start serving on a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="fake-employees-api", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Fake Employees API listening on {self.url}")
+        return self
+
+    def stop(self):
+        """Stop serving and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
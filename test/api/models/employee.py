@@ -1,10 +1,10 @@
 """Pydantic model used to validate employee API responses in tests."""
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 
 class EmployeeResponse(BaseModel):
@@ -22,3 +22,8 @@ class EmployeeResponse(BaseModel):
     gross: Optional[float] = None
     benefitsCost: Optional[float] = None
     net: Optional[float] = None
+
+
+# Built once and reused: validates a whole list response in a single pass,
+# directly from raw JSON bytes via ``validate_json``.
+EmployeeListAdapter = TypeAdapter(List[EmployeeResponse])
@@ -0,0 +1,224 @@
+"""
+Columnar, memory-compact store for employee list results.
+
+A list response held as dicts (or ``EmployeeResponse`` objects) costs well
+over a kilobyte per employee. ``EmployeeTable`` keeps one column per field
+instead:
+
+- numeric fields (dependants, salary, gross, benefitsCost, net and the
+  expiration timestamp) in ``array('d')`` columns, with NaN for missing values
+- IDs and sort keys as 16 raw UUID bytes each
+- first/last names and partition keys as interned strings, so repeated
+  values share one object
+
+That brings a record down to under 200 bytes. Rows are read through
+``EmployeeRow``, a two-slot view that behaves like the dict it replaces
+(``row["salary"]``, ``row.get("id")``), so existing assertion helpers accept
+it. Numeric columns come out as NumPy arrays for the vectorized oracle.
+
+Fill a table straight from the streamed list and the dicts never coexist:
+
+    table = EmployeeTable.from_records(client.iter_all_employees())
+"""
+
+import math
+import sys
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from uuid import UUID
+
+import numpy as np
+
+from models.employee import EmployeeResponse
+
+NUMERIC_FIELDS = ("dependants", "salary", "gross", "benefitsCost", "net")
+UUID_FIELDS = ("id", "sortKey")
+INTERNED_FIELDS = ("partitionKey", "firstName", "lastName")
+FIELDS = tuple(EmployeeResponse.model_fields)
+
+_UUID_SIZE = 16
+_NULL_UUID = bytes(_UUID_SIZE)
+
+
+def _to_float(value, field: str) -> float:
+    if value is None:
+        return math.nan
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"{field} must be numeric, got {value!r}")
+    return float(value)
+
+
+def _to_timestamp(value) -> float:
+    """Expiration as epoch seconds; naive datetimes are taken as UTC."""
+    if value is None:
+        return math.nan
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class EmployeeRow:
+    """Read-only, dict-like view of one row of an ``EmployeeTable``."""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "EmployeeTable", index: int):
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, field: str):
+        if field not in FIELDS:
+            raise KeyError(field)
+        return self._table._value(field, self._index)
+
+    def get(self, field: str, default=None):
+        value = self[field] if field in FIELDS else None
+        return default if value is None else value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The record as the list endpoint returned it (missing fields as None)."""
+        return {field: self._table._value(field, self._index) for field in FIELDS}
+
+    def to_model(self) -> EmployeeResponse:
+        return EmployeeResponse(**self.to_dict())
+
+    def __eq__(self, other):
+        if isinstance(other, EmployeeRow):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"EmployeeRow({self.to_dict()!r})"
+
+
+class EmployeeTable:
+    """Employees stored column by column; see the module docstring."""
+
+    def __init__(self):
+        self._numeric: Dict[str, array] = {field: array("d") for field in NUMERIC_FIELDS}
+        self._expiration = array("d")
+        self._uuids: Dict[str, bytearray] = {field: bytearray() for field in UUID_FIELDS}
+        # Row → original value for IDs that are missing or not UUIDs
+        self._odd_uuids: Dict[str, Dict[int, Any]] = {field: {} for field in UUID_FIELDS}
+        self._strings: Dict[str, List[Optional[str]]] = {
+            field: [] for field in (*INTERNED_FIELDS, "username")
+        }
+        self._row_by_id: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> "EmployeeTable":
+        """Build a table from list-response dicts (a list or a stream)."""
+        table = cls()
+        for record in records:
+            table.append(record)
+        return table
+
+    @classmethod
+    def from_models(cls, models: Iterable[EmployeeResponse]) -> "EmployeeTable":
+        table = cls()
+        for model in models:
+            table.append(model)
+        return table
+
+    def append(self, record):
+        """Add one employee, given as a dict or an ``EmployeeResponse``."""
+        if isinstance(record, EmployeeResponse):
+            record = {field: getattr(record, field) for field in FIELDS}
+        row = len(self)
+
+        # Convert everything before touching a column, so a bad record
+        # leaves the table unchanged.
+        numbers = [_to_float(record.get(field), field) for field in NUMERIC_FIELDS]
+        expiration = _to_timestamp(record.get("expiration"))
+        uuids = []
+        for field in UUID_FIELDS:
+            value = record.get(field)
+            try:
+                uuids.append((value if isinstance(value, UUID) else UUID(str(value))).bytes)
+            except ValueError:
+                uuids.append(None)
+
+        for field, number in zip(NUMERIC_FIELDS, numbers):
+            self._numeric[field].append(number)
+        self._expiration.append(expiration)
+        for field, raw in zip(UUID_FIELDS, uuids):
+            if raw is None:
+                self._odd_uuids[field][row] = record.get(field)
+            self._uuids[field] += raw or _NULL_UUID
+        for field in INTERNED_FIELDS:
+            value = record.get(field)
+            self._strings[field].append(sys.intern(value) if isinstance(value, str) else value)
+        self._strings["username"].append(record.get("username"))
+        self._row_by_id = None
+
+    def _value(self, field: str, row: int):
+        if field in self._numeric:
+            value = self._numeric[field][row]
+            if math.isnan(value):
+                return None
+            return int(value) if field == "dependants" else value
+        if field in self._uuids:
+            odd = self._odd_uuids[field]
+            if row in odd:
+                return odd[row]
+            offset = row * _UUID_SIZE
+            return str(UUID(bytes=bytes(self._uuids[field][offset:offset + _UUID_SIZE])))
+        if field == "expiration":
+            value = self._expiration[row]
+            return None if math.isnan(value) else datetime.fromtimestamp(value, timezone.utc)
+        return self._strings[field][row]
+
+    def __len__(self) -> int:
+        return len(self._expiration)
+
+    def __getitem__(self, row: int) -> EmployeeRow:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("EmployeeTable index out of range")
+        return EmployeeRow(self, row)
+
+    def __iter__(self) -> Iterator[EmployeeRow]:
+        for row in range(len(self)):
+            yield EmployeeRow(self, row)
+
+    def column(self, field: str):
+        """One field for every row.
+
+        Numeric fields come back as a float64 NumPy array (NaN where
+        missing) — a copy, so the table can keep growing. Other fields come
+        back as a list.
+        """
+        if field in self._numeric:
+            return np.array(self._numeric[field], dtype=float)
+        if field == "expiration":
+            return np.array(self._expiration, dtype=float)
+        if field in FIELDS:
+            return [self._value(field, row) for row in range(len(self))]
+        raise KeyError(field)
+
+    def get(self, employee_id) -> Optional[EmployeeRow]:
+        """The first row with the given ID, or None.
+
+        The ID lookup table is built on first use.
+        """
+        if self._row_by_id is None:
+            self._row_by_id = {}
+            for row, value in enumerate(self.column("id")):
+                self._row_by_id.setdefault(str(value), row)
+        row = self._row_by_id.get(str(employee_id))
+        return None if row is None else EmployeeRow(self, row)
+
+    def __contains__(self, employee_id) -> bool:
+        return self.get(employee_id) is not None
+
+    def to_records(self) -> Iterator[Dict[str, Any]]:
+        for row in range(len(self)):
+            yield EmployeeRow(self, row).to_dict()
+
+    def to_models(self) -> Iterator[EmployeeResponse]:
+        for row in range(len(self)):
+            yield EmployeeRow(self, row).to_model()
@@ -0,0 +1 @@
+"""pytest plugins registered from the root conftest."""
@@ -0,0 +1,154 @@
+"""
+pytest plugin: per-endpoint latency histograms and slowest API calls.
+
+Installs an in-memory metrics sink for the session, tags every request with
+the running test, prints a summary at the end of the run and writes it as
+JSON — by default next to the pytest-html report (``latency.json``). Under
+pytest-xdist, workers send their timings to the controller, which reports
+on the whole run.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from utils.latency import histogram, summarize
+from utils.metrics import InMemoryMetricsSink, RequestTiming, set_default_sink
+
+_SINK_KEY = pytest.StashKey[InMemoryMetricsSink]()
+_BAR_WIDTH = 40
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("latency", "API latency report")
+    group.addoption(
+        "--latency-json",
+        default=None,
+        help="Write the latency report to this JSON file "
+             "(default: latency.json next to the --html report, if any).",
+    )
+    group.addoption(
+        "--latency-slowest",
+        type=int,
+        default=10,
+        help="Number of slowest API calls to list (default 10, 0 to disable the report).",
+    )
+
+
+def pytest_configure(config):
+    sink = InMemoryMetricsSink()
+    config.stash[_SINK_KEY] = sink
+    set_default_sink(sink)
+
+
+def pytest_unconfigure(config):
+    if _SINK_KEY in config.stash:
+        set_default_sink(None)
+
+
+def pytest_sessionfinish(session):
+    # xdist worker: hand timings to the controller, which prints the report
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["latency_timings"] = [
+            t.to_dict() for t in session.config.stash[_SINK_KEY].timings()
+        ]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    # xdist controller: merge the timings a finished worker collected
+    sink = node.config.stash[_SINK_KEY]
+    for data in getattr(node, "workeroutput", {}).get("latency_timings", []):
+        sink.record(RequestTiming(**data))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    sink = item.config.stash[_SINK_KEY]
+    sink.context = item.nodeid
+    yield
+    sink.context = None
+
+
+def build_latency_report(sink: InMemoryMetricsSink, slowest: int) -> dict:
+    """Summaries and histograms per endpoint plus the slowest calls."""
+    endpoints = {}
+    for name, timings in sorted(sink.by_endpoint().items()):
+        totals = [t.total_ms for t in timings]
+        ttfbs = [t.ttfb_ms for t in timings if t.ttfb_ms is not None]
+        downloads = [t.download_ms for t in timings if t.download_ms is not None]
+        # Only calls that had to open a connection carry connect_ms
+        connects = [t.connect_ms for t in timings if t.connect_ms is not None]
+        endpoints[name] = {
+            "total": summarize(totals),
+            "ttfb": summarize(ttfbs),
+            "download": summarize(downloads),
+            "connect": summarize(connects),
+            "errors": sum(1 for t in timings if t.error is not None),
+            "histogram": histogram(totals),
+        }
+
+    slowest_calls = sorted(sink.timings(), key=lambda t: t.total_ms, reverse=True)[:slowest]
+    return {
+        "requests": len(sink.timings()),
+        "endpoints": endpoints,
+        "slowest": [t.to_dict() for t in slowest_calls],
+    }
+
+
+def _report_path(config):
+    explicit = config.getoption("--latency-json")
+    if explicit:
+        return Path(explicit)
+    html = getattr(config.option, "htmlpath", None)
+    if html:
+        return Path(html).resolve().parent / "latency.json"
+    return None
+
+
+def _write_histogram(terminalreporter, name: str, stats: dict):
+    total = stats["total"]
+    connect = stats["connect"]
+    terminalreporter.write_line(
+        f"{name}  n={total['count']}  p50={total['p50_ms']}ms  "
+        f"p95={total['p95_ms']}ms  p99={total['p99_ms']}ms  max={total['max_ms']}ms  "
+        f"connects={connect['count']} (mean {connect['mean_ms']}ms)"
+    )
+    buckets = stats["histogram"]
+    occupied = [i for i, bucket in enumerate(buckets) if bucket["count"]]
+    if not occupied:
+        return
+    peak = max(bucket["count"] for bucket in buckets)
+    # Only print the span of buckets that actually hold samples
+    for bucket in buckets[occupied[0]:occupied[-1] + 1]:
+        label = f"<= {bucket['le_ms']}ms" if bucket["le_ms"] is not None else "  > last"
+        bar = "#" * round(bucket["count"] / peak * _BAR_WIDTH)
+        terminalreporter.write_line(f"    {label:>10} {bucket['count']:>6} {bar}")
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    slowest = config.getoption("--latency-slowest")
+    sink = config.stash.get(_SINK_KEY, None)
+    if sink is None or slowest <= 0 or not sink.timings():
+        return
+
+    report = build_latency_report(sink, slowest)
+
+    terminalreporter.write_sep("=", "API latency")
+    for name, stats in report["endpoints"].items():
+        _write_histogram(terminalreporter, name, stats)
+
+    terminalreporter.write_sep("-", f"slowest {len(report['slowest'])} API calls")
+    for timing in report["slowest"]:
+        terminalreporter.write_line(
+            f"{timing['total_ms']:>9.1f}ms  {timing['method']:<6} {timing['endpoint']:<28} "
+            f"{timing['status']}  {timing['test'] or '-'}"
+        )
+
+    path = _report_path(config)
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2))
+        terminalreporter.write_line(f"Latency report written to {path}")
@@ -0,0 +1,44 @@
+"""
+pytest plugin: attach a failing test's recent API exchanges to its report.
+
+The request log (utils/request_log.py) keeps the last REQUEST_LOG_BUFFER
+exchanges in memory. The buffer is cleared before each test and, only if
+the test fails, dumped as JSON lines into a "recent API exchanges" report
+section, bodies included. Passing tests cost nothing beyond the buffering.
+"""
+
+import pytest
+
+from utils.request_log import get_request_log
+
+SECTION = "recent API exchanges"
+
+
+def _request_log():
+    try:
+        return get_request_log()
+    except EnvironmentError:
+        return None  # reported by the fixtures that need settings
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    request_log = _request_log()
+    if request_log is None:
+        yield
+        return
+    request_log.clear()
+    request_log.context = item.nodeid
+    yield
+    request_log.context = None
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    request_log = _request_log() if report.failed else None
+    if request_log is not None:
+        dump = request_log.dump()
+        if dump:
+            report.sections.append((f"{SECTION} ({report.when})", dump))
@@ -0,0 +1,109 @@
+"""
+pytest plugin: schedule tests in lanes by the data they touch.
+
+Each test is put in one of three lanes, from its fixtures and markers:
+
+- ``negative``: marked ``negative`` and using no data fixture. These tests
+  only send requests the API should reject.
+- ``read_only``: uses ``pooled_employee`` or is marked ``read_only``. These
+  tests never change what they read.
+- ``mutating``: everything else, including every test that uses
+  ``created_employee``, ``mutable_pooled_employee`` or is marked ``crud``.
+  This is the default, because it is the safe assumption.
+
+``@pytest.mark.lane("read_only")`` overrides the classification.
+
+Tests run lane by lane: negative, then read-only, then mutating. Within a
+lane, tests sharing a provisioning fixture (``employee_pool``) run back to
+back, so a worker provisions its pool early and the tests that reuse it
+follow. Under ``pytest -n`` nothing is pinned to a worker: each worker
+provisions its own small pool, and every lane spreads over all workers.
+``--no-schedule`` keeps the collection order.
+
+Reordering across modules means a module- or class-scoped fixture used by
+tests in different lanes is set up more than once. The suite's data
+fixtures are session- or function-scoped, so this costs nothing here.
+"""
+
+from collections import Counter
+
+import pytest
+
+NEGATIVE = "negative"
+READ_ONLY = "read_only"
+MUTATING = "mutating"
+LANES = (NEGATIVE, READ_ONLY, MUTATING)
+
+# Fixtures that hand a test a record it may change (or that it owns)
+MUTATING_FIXTURES = frozenset({"created_employee", "mutable_pooled_employee", "async_created_employee"})
+# Fixtures that hand a test a shared record it must not change
+READ_ONLY_FIXTURES = frozenset({"pooled_employee"})
+# Session fixtures that create data shared by many tests
+PROVISIONING_FIXTURES = ("employee_pool",)
+
+_LANE_KEY = pytest.StashKey[str]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("scheduler", "API test scheduling")
+    group.addoption(
+        "--no-schedule",
+        action="store_true",
+        default=False,
+        help="Run tests in collection order instead of negative / read-only / mutating lanes.",
+    )
+
+
+def classify(item) -> str:
+    """The lane ``item`` runs in."""
+    explicit = item.get_closest_marker("lane")
+    if explicit is not None:
+        lane = explicit.args[0] if explicit.args else explicit.kwargs.get("name")
+        if lane not in LANES:
+            raise pytest.UsageError(f"{item.nodeid}: unknown lane {lane!r} (expected one of {LANES})")
+        return lane
+
+    fixtures = set(getattr(item, "fixturenames", ()))
+    if fixtures & MUTATING_FIXTURES or item.get_closest_marker("crud"):
+        return MUTATING
+    if item.get_closest_marker("negative") and not fixtures & (READ_ONLY_FIXTURES | set(PROVISIONING_FIXTURES)):
+        return NEGATIVE
+    if fixtures & READ_ONLY_FIXTURES or item.get_closest_marker("read_only"):
+        return READ_ONLY
+    return MUTATING
+
+
+def provisioning_fixture(item) -> str:
+    """The shared provisioning fixture ``item`` depends on, or ""."""
+    fixtures = getattr(item, "fixturenames", ())
+    return next((name for name in PROVISIONING_FIXTURES if name in fixtures), "")
+
+
+def lane_of(item) -> str:
+    """The lane assigned at collection (None if scheduling is off)."""
+    return item.stash.get(_LANE_KEY, None)
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--no-schedule"):
+        return
+
+    order = {lane: rank for rank, lane in enumerate(LANES)}
+    keys = {}
+    for index, item in enumerate(items):
+        lane = classify(item)
+        provisioning = provisioning_fixture(item)
+        item.stash[_LANE_KEY] = lane
+        # Tests without a provisioning fixture sort after those with one
+        keys[item.nodeid] = (order[lane], provisioning == "", provisioning, index)
+
+    items.sort(key=lambda item: keys[item.nodeid])
+
+
+def pytest_report_collectionfinish(config, items):
+    if config.getoption("--no-schedule"):
+        return None
+    counts = Counter(lane_of(item) for item in items)
+    if not counts:
+        return None
+    return "scheduler: " + ", ".join(f"{counts[lane]} {lane}" for lane in LANES)
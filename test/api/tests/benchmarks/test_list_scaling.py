@@ -0,0 +1,130 @@
+"""
+Scaling benchmark for GET /api/Employees versus dataset size.
+
+Marked ``benchmark``: deselected unless ``--run-benchmarks`` is given.
+Run it on its own:
+
+    pytest --run-benchmarks tests/benchmarks
+    USE_FAKE_API=1 pytest --run-benchmarks tests/benchmarks --benchmark-sizes 100,1000,10000,50000
+
+The dataset grows through ``EmployeesClient.create_employees`` to each size
+in turn. At each size the list call is timed, along with the response size,
+JSON decode time and ``EmployeeResponse`` validation time. Results are
+written to ``--benchmark-json`` with stable key order, so two runs can be
+diffed. Seeded employees are deleted when the module finishes.
+"""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from config.settings import get_settings
+from models.employee import EmployeeListAdapter
+from utils.assertions import assert_bulk_status_codes, assert_status_code
+from utils.data_factory import generate_employee_payload
+from utils.json_codec import loads, orjson
+from utils.latency import summarize
+
+pytestmark = pytest.mark.benchmark
+
+# Concurrent creates/deletes while seeding and tearing down the dataset
+SEED_CONCURRENCY = 16
+
+
+def pytest_generate_tests(metafunc):
+    if "dataset_size" in metafunc.fixturenames:
+        sizes = sorted(int(size) for size in metafunc.config.getoption("--benchmark-sizes").split(","))
+        metafunc.parametrize("dataset_size", sizes, ids=[f"n{size}" for size in sizes])
+
+
+class _Dataset:
+    """Employees seeded for the benchmark; grows monotonically."""
+
+    def __init__(self, client):
+        self.client = client
+        self.ids = []
+
+    def grow_to(self, size: int) -> float:
+        """Create employees until ``size`` exist; returns the seconds it took."""
+        started = time.perf_counter()
+        payloads = [generate_employee_payload() for _ in range(size - len(self.ids))]
+        results = self.client.create_employees(payloads, concurrency=SEED_CONCURRENCY)
+        assert_bulk_status_codes(results, 200)
+        self.ids.extend(str(result.response.json()["id"]) for result in results)
+        return time.perf_counter() - started
+
+    def clear(self):
+        self.client.delete_employees(self.ids, concurrency=SEED_CONCURRENCY)
+        self.ids.clear()
+
+
+def _time_ms(func, repeats: int) -> list:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+@pytest.fixture(scope="module")
+def dataset(employees_client):
+    seeded = _Dataset(employees_client)
+    yield seeded
+    seeded.clear()
+
+
+@pytest.fixture(scope="module")
+def benchmark_results(request):
+    """Collects one entry per dataset size and writes them out at module end."""
+    results = []
+    yield results
+
+    settings = get_settings()
+    report = {
+        "benchmark": "list_employees_scaling",
+        "target": "fake" if settings.USE_FAKE_API else "remote",
+        "json_decoder": "orjson" if orjson is not None else "json",
+        "repeats": request.config.getoption("--benchmark-repeats"),
+        "results": results,
+    }
+    path = Path(request.config.getoption("--benchmark-json"))
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+class TestListScaling:
+    """GET /api/Employees cost as the dataset grows."""
+
+    def test_list_employees_scaling(self, employees_client, dataset, benchmark_results, dataset_size, request):
+        """Measure list latency, payload size, decode and validation time at one size."""
+        seed_seconds = dataset.grow_to(dataset_size)
+        repeats = request.config.getoption("--benchmark-repeats")
+
+        latencies, ttfbs = [], []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            response = employees_client.get_all_employees()
+            latencies.append((time.perf_counter() - started) * 1000)
+            ttfbs.append(response.elapsed.total_seconds() * 1000)
+            assert_status_code(response, 200)
+
+        content = response.content
+        employees = loads(content)
+        assert len(employees) >= dataset_size, (
+            f"Expected at least {dataset_size} employees in the list, got {len(employees)}"
+        )
+
+        benchmark_results.append({
+            "size": dataset_size,
+            "records": len(employees),
+            "response_bytes": len(content),
+            "bytes_per_record": round(len(content) / max(len(employees), 1), 1),
+            "seed_seconds": round(seed_seconds, 3),
+            "latency": summarize(latencies),
+            "ttfb": summarize(ttfbs),
+            "decode": summarize(_time_ms(lambda: loads(content), repeats)),
+            "validate": summarize(_time_ms(lambda: EmployeeListAdapter.validate_python(employees), repeats)),
+            "validate_json": summarize(_time_ms(lambda: EmployeeListAdapter.validate_json(content), repeats)),
+        })
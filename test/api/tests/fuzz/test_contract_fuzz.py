@@ -0,0 +1,37 @@
+"""
+Property-based contract fuzzing of POST/PUT /api/Employees.
+
+Marked ``fuzz``: deselected unless ``--run-fuzz`` is given. Run it on
+its own:
+
+    pytest --run-fuzz tests/fuzz
+    pytest --run-fuzz tests/fuzz --fuzz-cases 5000 --fuzz-seed 7
+
+Generates ``--fuzz-cases`` valid and invalid payloads from the
+``EmployeeResponse`` model and the spec limits, sends them concurrently and
+fails with one line per failure cluster, each with its shrunk reproducer
+and the defect report it maps onto (see utils/contract_fuzzer.py).
+"""
+
+import itertools
+
+import pytest
+
+from utils.contract_fuzzer import ContractFuzzer, iter_cases
+
+pytestmark = pytest.mark.fuzz
+
+FUZZ_CONCURRENCY = 16
+
+
+class TestContractFuzz:
+    """Fuzz the create and update payload contract."""
+
+    def test_payload_contract(self, employees_client, request):
+        """Valid payloads should be stored as sent; invalid ones rejected with a 4xx."""
+        cases = itertools.islice(
+            iter_cases(seed=request.config.getoption("--fuzz-seed")),
+            request.config.getoption("--fuzz-cases"),
+        )
+        report = ContractFuzzer(employees_client, concurrency=FUZZ_CONCURRENCY).run(cases)
+        assert not report.clusters, report.format()
@@ -5,8 +5,15 @@ Validates that gross, benefitsCost, and net are computed correctly.
 
 import pytest
 
-from utils.assertions import assert_status_code
+from models.employee_table import EmployeeTable
+from utils.assertions import (
+    assert_status_code,
+    assert_bulk_status_codes,
+    assert_employees_match_oracle,
+)
+from utils.benefits_oracle import expected_paycheck
 from utils.data_factory import generate_employee_payload
+from utils.employee_index import EmployeeIndex
 
 
 class TestEmployeeBenefitsCalculation:
@@ -82,29 +89,27 @@ class TestEmployeeBenefitsCalculation:
     @pytest.mark.regression
     def test_more_dependants_increases_benefits_cost(self, employees_client):
         """More dependants should result in higher benefits cost."""
-        # Employee with 0 dependants
-        payload_0 = generate_employee_payload(salary=52000.0, dependants=0)
-        response_0 = employees_client.create_employee(payload_0)
-        assert_status_code(response_0, 200)
-        data_0 = response_0.json()
-
-        # Employee with 5 dependants
-        payload_5 = generate_employee_payload(salary=52000.0, dependants=5)
-        response_5 = employees_client.create_employee(payload_5)
-        assert_status_code(response_5, 200)
-        data_5 = response_5.json()
-
-        benefits_0 = data_0.get("benefitsCost", 0)
-        benefits_5 = data_5.get("benefitsCost", 0)
-
-        assert benefits_5 > benefits_0, (
-            f"Benefits with 5 dependants ({benefits_5}) should be greater than "
-            f"benefits with 0 dependants ({benefits_0})"
-        )
-
-        # Cleanup
-        employees_client.delete_employee(str(data_0["id"]))
-        employees_client.delete_employee(str(data_5["id"]))
+        payloads = [
+            generate_employee_payload(salary=52000.0, dependants=0),
+            generate_employee_payload(salary=52000.0, dependants=5),
+        ]
+        results = employees_client.create_employees(payloads)
+        created_ids = [str(r.response.json()["id"]) for r in results if r.ok]
+
+        try:
+            assert_bulk_status_codes(results, 200)
+            data_0, data_5 = (r.response.json() for r in results)
+
+            benefits_0 = data_0.get("benefitsCost", 0)
+            benefits_5 = data_5.get("benefitsCost", 0)
+
+            assert benefits_5 > benefits_0, (
+                f"Benefits with 5 dependants ({benefits_5}) should be greater than "
+                f"benefits with 0 dependants ({benefits_0})"
+            )
+        finally:
+            # Cleanup
+            employees_client.delete_employees(created_ids)
 
     @pytest.mark.positive
     @pytest.mark.regression
@@ -147,17 +152,18 @@ class TestEmployeeBenefitsCalculation:
         data = response.json()
 
         # $1000/year / 26 paychecks = $38.46 per paycheck
-        expected_benefits = round(1000 / 26, 2)
+        expected = expected_paycheck(salary=52000.0, dependants=0)
+        expected_benefits = expected["benefitsCost"]
         assert round(data.get("benefitsCost", 0), 2) == expected_benefits, (
             f"Expected benefitsCost {expected_benefits}, got {data.get('benefitsCost')}"
         )
 
-        expected_gross = round(52000 / 26, 2)
+        expected_gross = expected["gross"]
         assert round(data.get("gross", 0), 2) == expected_gross, (
             f"Expected gross {expected_gross}, got {data.get('gross')}"
         )
 
-        expected_net = round(expected_gross - expected_benefits, 2)
+        expected_net = expected["net"]
         assert round(data.get("net", 0), 2) == expected_net, (
             f"Expected net {expected_net}, got {data.get('net')}"
         )
@@ -174,14 +180,13 @@ class TestEmployeeBenefitsCalculation:
         data = response.json()
 
         # ($1000 + 3 * $500) / 26 = $2500 / 26 = $96.15
-        annual_cost = 1000 + 3 * 500
-        expected_benefits = round(annual_cost / 26, 2)
+        expected = expected_paycheck(salary=52000.0, dependants=3)
+        expected_benefits = expected["benefitsCost"]
         assert round(data.get("benefitsCost", 0), 2) == expected_benefits, (
             f"Expected benefitsCost {expected_benefits}, got {data.get('benefitsCost')}"
         )
 
-        expected_gross = round(52000 / 26, 2)
-        expected_net = round(expected_gross - expected_benefits, 2)
+        expected_net = expected["net"]
         assert round(data.get("net", 0), 2) == expected_net, (
             f"Expected net {expected_net}, got {data.get('net')}"
         )
@@ -192,27 +197,80 @@ class TestEmployeeBenefitsCalculation:
     @pytest.mark.regression
     def test_same_salary_same_dependants_same_benefits(self, employees_client):
         """Two employees with the same salary and dependants should have the same benefits."""
-        payload_1 = generate_employee_payload(salary=52000.0, dependants=2)
-        payload_2 = generate_employee_payload(salary=52000.0, dependants=2)
-
-        response_1 = employees_client.create_employee(payload_1)
-        assert_status_code(response_1, 200)
-        data_1 = response_1.json()
+        payloads = [
+            generate_employee_payload(salary=52000.0, dependants=2),
+            generate_employee_payload(salary=52000.0, dependants=2),
+        ]
+        results = employees_client.create_employees(payloads)
+        created_ids = [str(r.response.json()["id"]) for r in results if r.ok]
+
+        try:
+            assert_bulk_status_codes(results, 200)
+            data_1, data_2 = (r.response.json() for r in results)
+
+            assert round(data_1.get("benefitsCost", 0), 2) == round(data_2.get("benefitsCost", 0), 2), (
+                "Same salary and dependants should yield same benefitsCost"
+            )
+            assert round(data_1.get("gross", 0), 2) == round(data_2.get("gross", 0), 2), (
+                "Same salary should yield same gross"
+            )
+            assert round(data_1.get("net", 0), 2) == round(data_2.get("net", 0), 2), (
+                "Same salary and dependants should yield same net"
+            )
+        finally:
+            # Cleanup
+            employees_client.delete_employees(created_ids)
 
-        response_2 = employees_client.create_employee(payload_2)
-        assert_status_code(response_2, 200)
-        data_2 = response_2.json()
-
-        assert round(data_1.get("benefitsCost", 0), 2) == round(data_2.get("benefitsCost", 0), 2), (
-            "Same salary and dependants should yield same benefitsCost"
-        )
-        assert round(data_1.get("gross", 0), 2) == round(data_2.get("gross", 0), 2), (
-            "Same salary should yield same gross"
-        )
-        assert round(data_1.get("net", 0), 2) == round(data_2.get("net", 0), 2), (
-            "Same salary and dependants should yield same net"
-        )
+    @pytest.mark.positive
+    @pytest.mark.regression
+    def test_bulk_benefits_match_oracle(self, employees_client):
+        """Every employee across a salary × dependants grid should match the benefits oracle."""
+        salaries = [26000.0, 52000.0, 60000.0, 123456.78]
+        dependant_counts = [0, 1, 5, 32]
+        payloads = [
+            generate_employee_payload(salary=salary, dependants=dependants)
+            for salary in salaries
+            for dependants in dependant_counts
+        ]
+        results = employees_client.create_employees(payloads)
+        created_ids = [str(r.response.json()["id"]) for r in results if r.ok]
+
+        try:
+            assert_bulk_status_codes(results, 200)
+
+            # Verify the stored records, as returned by the list endpoint
+            list_response = employees_client.get_all_employees()
+            assert_status_code(list_response, 200)
+            employees = EmployeeIndex(list_response.json())
+            assert_employees_match_oracle(employees.get(eid) or {"id": eid} for eid in created_ids)
+        finally:
+            # Cleanup
+            employees_client.delete_employees(created_ids)
 
-        # Cleanup
-        employees_client.delete_employee(str(data_1["id"]))
-        employees_client.delete_employee(str(data_2["id"]))
+    @pytest.mark.positive
+    @pytest.mark.regression
+    def test_streamed_table_matches_oracle(self, employees_client):
+        """The list streamed into a columnar EmployeeTable should match the benefits oracle."""
+        payloads = [
+            generate_employee_payload(salary=salary, dependants=dependants)
+            for salary in (26000.0, 77777.77)
+            for dependants in (0, 3)
+        ]
+        results = employees_client.create_employees(payloads)
+        created = {str(r.response.json()["id"]): r.response.json() for r in results if r.ok}
+        created_ids = list(created)
+
+        try:
+            assert_bulk_status_codes(results, 200)
+
+            table = EmployeeTable.from_records(employees_client.iter_all_employees())
+            missing = [eid for eid in created_ids if eid not in table]
+            assert not missing, f"Created employees missing from the streamed list: {missing}"
+            rows = [table.get(eid) for eid in created_ids]
+            assert_employees_match_oracle(EmployeeTable.from_records(rows))
+            # Rows convert back to models holding what the API returned on create
+            for row in rows:
+                assert row.to_model().username == created[row["id"]]["username"]
+        finally:
+            # Cleanup
+            employees_client.delete_employees(created_ids)
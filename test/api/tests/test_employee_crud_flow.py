@@ -3,15 +3,20 @@ End-to-end CRUD flow tests for the Employee API.
 These tests validate the full lifecycle: Create → Read → Update → Delete.
 """
 
+import asyncio
+
 import pytest
 
+from clients.transport import HTTP2, TRANSPORTS
 from utils.assertions import (
     assert_status_code,
+    assert_bulk_status_codes,
     assert_employee_fields,
     assert_employee_in_list,
     assert_employee_not_in_list,
 )
 from utils.data_factory import generate_employee_payload, generate_employee_update_payload
+from utils.employee_index import EmployeeIndex
 
 
 class TestEmployeeCRUDFlow:
@@ -104,31 +109,104 @@ class TestEmployeeCRUDFlow:
     @pytest.mark.regression
     def test_create_multiple_employees_and_verify_list(self, employees_client):
         """Create multiple employees and verify they all appear in the list."""
-        created_ids = []
         num_employees = 3
+        payloads = [
+            generate_employee_payload(first_name=f"Multi{i}", last_name=f"Test{i}")
+            for i in range(num_employees)
+        ]
+        results = employees_client.create_employees(payloads)
+        created_ids = [str(r.response.json()["id"]) for r in results if r.ok]
 
         try:
-            for i in range(num_employees):
-                payload = generate_employee_payload(
-                    first_name=f"Multi{i}",
-                    last_name=f"Test{i}",
-                )
-                response = employees_client.create_employee(payload)
-                assert_status_code(response, 200)
-                created_ids.append(str(response.json()["id"]))
+            assert_bulk_status_codes(results, 200)
 
             # Verify all in list
             list_response = employees_client.get_all_employees()
             assert_status_code(list_response, 200)
-            employees = list_response.json()
+            employees = EmployeeIndex(list_response.json())
 
             for eid in created_ids:
                 assert_employee_in_list(employees, eid)
 
         finally:
             # Cleanup
+            employees_client.delete_employees(created_ids)
+
+    @pytest.mark.regression
+    @pytest.mark.parametrize("transport_client", TRANSPORTS, indirect=True)
+    def test_bulk_crud_reuses_pooled_connections(self, transport_client):
+        """Concurrent creates and deletes open no more connections than they run in parallel."""
+        concurrency = 4
+        payloads = [generate_employee_payload() for _ in range(12)]
+        results = transport_client.create_employees(payloads, concurrency=concurrency)
+        created_ids = [str(r.response.json()["id"]) for r in results if r.ok]
+
+        try:
+            assert_bulk_status_codes(results, 200)
+        finally:
+            deleted = transport_client.delete_employees(created_ids, concurrency=concurrency)
+        assert_bulk_status_codes(deleted, 200)
+
+        stats = transport_client.connection_stats
+        assert stats.requests >= 2 * len(payloads), stats.summary()
+        assert stats.new_connections <= concurrency, stats.summary()
+        assert stats.reused_connections >= stats.requests - concurrency, stats.summary()
+        if transport_client.transport == HTTP2 and transport_client.base_url.startswith("https://"):
+            assert "HTTP/2" in stats.http_versions, stats.summary()
+
+    @pytest.mark.regression
+    def test_concurrent_requests_share_one_http2_connection(self, https_http2_client):
+        """Over HTTPS the http2 transport multiplexes concurrent calls on one connection, past its pool size."""
+        client = https_http2_client
+        assert_status_code(client.get_all_employees(), 200)
+        assert client.connection_stats.http_versions == {"HTTP/2": 1}, client.connection_stats.summary()
+        client.connection_stats.reset()
+
+        payloads = [generate_employee_payload() for _ in range(16)]
+        results = client.create_employees(payloads, concurrency=8)
+        created_ids = [str(r.response.json()["id"]) for r in results if r.ok]
+        try:
+            assert_bulk_status_codes(results, 200)
+        finally:
+            client.delete_employees(created_ids, concurrency=8)
+
+        stats = client.connection_stats
+        assert stats.new_connections == 0, stats.summary()
+        assert stats.pool_waits == 0, stats.summary()
+        assert stats.http_versions == {"HTTP/2": stats.requests}, stats.summary()
+
+    @pytest.mark.regression
+    @pytest.mark.asyncio
+    async def test_create_multiple_employees_concurrently(self, async_employees_client):
+        """Employees created concurrently over a pooled connection should all appear in the list."""
+        num_employees = 5
+        payloads = [
+            generate_employee_payload(first_name=f"Async{i}", last_name=f"Test{i}")
+            for i in range(num_employees)
+        ]
+        responses = await asyncio.gather(
+            *(async_employees_client.create_employee(p) for p in payloads)
+        )
+        created_ids = [
+            str(r.json()["id"]) for r in responses if r.status_code == 200
+        ]
+
+        try:
+            for response in responses:
+                assert_status_code(response, 200)
+
+            list_response = await async_employees_client.get_all_employees()
+            assert_status_code(list_response, 200)
+            employees = EmployeeIndex(list_response.json())
+
             for eid in created_ids:
-                employees_client.delete_employee(eid)
+                assert_employee_in_list(employees, eid)
+
+        finally:
+            # Cleanup
+            await asyncio.gather(
+                *(async_employees_client.delete_employee(eid) for eid in created_ids)
+            )
 
     @pytest.mark.regression
     def test_update_does_not_change_id(self, employees_client):
@@ -18,9 +18,11 @@ class TestGetEmployeeById:
 
     @pytest.mark.smoke
     @pytest.mark.positive
-    def test_get_employee_by_id_returns_200(self, employees_client, created_employee):
+    def test_get_employee_by_id_returns_200(
+        self, employees_client, pooled_employee
+    ):
         """GET /api/Employees/{id} should return 200 for an existing employee."""
-        employee_data, _ = created_employee
+        employee_data, _ = pooled_employee
         employee_id = str(employee_data["id"])
 
         response = employees_client.get_employee_by_id(employee_id)
@@ -28,10 +30,10 @@ class TestGetEmployeeById:
 
     @pytest.mark.positive
     def test_get_employee_by_id_returns_correct_data(
-        self, employees_client, created_employee
+        self, employees_client, pooled_employee
     ):
         """GET /api/Employees/{id} should return the correct employee data."""
-        employee_data, payload = created_employee
+        employee_data, payload = pooled_employee
         employee_id = str(employee_data["id"])
 
         response = employees_client.get_employee_by_id(employee_id)
@@ -46,10 +48,10 @@ class TestGetEmployeeById:
 
     @pytest.mark.positive
     def test_get_employee_by_id_schema_validation(
-        self, employees_client, created_employee
+        self, employees_client, pooled_employee
     ):
         """The response should conform to the Employee schema."""
-        employee_data, _ = created_employee
+        employee_data, _ = pooled_employee
         employee_id = str(employee_data["id"])
 
         response = employees_client.get_employee_by_id(employee_id)
@@ -59,10 +61,10 @@ class TestGetEmployeeById:
 
     @pytest.mark.positive
     def test_get_employee_by_id_has_computed_fields(
-        self, employees_client, created_employee
+        self, employees_client, pooled_employee
     ):
         """The response should include read-only computed fields (gross, benefitsCost, net)."""
-        employee_data, _ = created_employee
+        employee_data, _ = pooled_employee
         employee_id = str(employee_data["id"])
 
         response = employees_client.get_employee_by_id(employee_id)
@@ -8,8 +8,11 @@ from utils.assertions import (
     assert_status_code,
     assert_json_response,
     assert_employee_in_list,
-    assert_employee_response_schema,
+    assert_employee_list_schema,
+    assert_employee_in_stream,
+    assert_employee_stream_schema,
 )
+from utils.namespace import filter_namespace, in_namespace
 
 
 class TestGetAllEmployees:
@@ -17,12 +20,14 @@ class TestGetAllEmployees:
 
     @pytest.mark.smoke
     @pytest.mark.positive
+    @pytest.mark.read_only
     def test_get_all_employees_returns_200(self, employees_client):
         """GET /api/Employees should return 200 OK."""
         response = employees_client.get_all_employees()
         assert_status_code(response, 200)
 
     @pytest.mark.positive
+    @pytest.mark.read_only
     def test_get_all_employees_returns_json_list(self, employees_client):
         """GET /api/Employees should return a JSON array."""
         response = employees_client.get_all_employees()
@@ -32,10 +37,10 @@ class TestGetAllEmployees:
 
     @pytest.mark.positive
     def test_get_all_employees_contains_created_employee(
-        self, employees_client, created_employee
+        self, employees_client, pooled_employee
     ):
         """A newly created employee should appear in the list."""
-        employee_data, _ = created_employee
+        employee_data, _ = pooled_employee
         employee_id = str(employee_data["id"])
 
         response = employees_client.get_all_employees()
@@ -46,30 +51,52 @@ class TestGetAllEmployees:
 
     @pytest.mark.positive
     def test_get_all_employees_response_schema(
-        self, employees_client, created_employee
+        self, employees_client, pooled_employee, employee_registry
     ):
-        """Each employee in the list should conform to the Employee schema."""
+        """Each employee created by this worker should conform to the Employee schema."""
         response = employees_client.get_all_employees()
         assert_status_code(response, 200)
-        employees = response.json()
+        # Scoped to this worker: other runs may be mid-way through negative tests
+        employees = filter_namespace(response.json(), employee_registry)
 
         assert len(employees) > 0, "Expected at least one employee in the list"
-        for emp in employees:
-            assert_employee_response_schema(emp)
+        assert_employee_list_schema(employees)
 
     @pytest.mark.positive
     def test_get_all_employees_returns_expected_fields(
-        self, employees_client, created_employee
+        self, employees_client, pooled_employee, employee_registry
     ):
-        """Each employee should contain all expected fields."""
+        """Each employee created by this worker should contain all expected fields."""
         expected_fields = [
             "id", "username", "firstName", "lastName", "dependants",
             "salary", "gross", "benefitsCost", "net",
         ]
         response = employees_client.get_all_employees()
         assert_status_code(response, 200)
-        employees = response.json()
+        employees = filter_namespace(response.json(), employee_registry)
+        assert len(employees) > 0, "Expected at least one employee in the list"
 
         for emp in employees:
             for field in expected_fields:
                 assert field in emp, f"Missing field '{field}' in employee response"
+
+    @pytest.mark.positive
+    def test_streamed_list_contains_created_employee(self, employees_client, pooled_employee):
+        """A created employee should be found while streaming the list."""
+        employee_data, _ = pooled_employee
+
+        employee = assert_employee_in_stream(
+            employees_client.iter_all_employees(), str(employee_data["id"])
+        )
+        assert employee["username"] == employee_data["username"]
+
+    @pytest.mark.positive
+    def test_streamed_list_response_schema(
+        self, employees_client, pooled_employee, employee_registry
+    ):
+        """Streamed employees created by this worker should conform to the Employee schema."""
+        checked = assert_employee_stream_schema(
+            employees_client.iter_all_employees(),
+            predicate=lambda employee: in_namespace(employee, employee_registry),
+        )
+        assert checked > 0, "Expected at least one employee in the list"
@@ -19,9 +19,11 @@ class TestUpdateEmployee:
     @pytest.mark.smoke
     @pytest.mark.positive
     @pytest.mark.crud
-    def test_update_employee_returns_200(self, employees_client, created_employee):
+    def test_update_employee_returns_200(
+        self, employees_client, mutable_pooled_employee
+    ):
         """PUT /api/Employees with valid data should return 200."""
-        employee_data, _ = created_employee
+        employee_data, _ = mutable_pooled_employee
         employee_id = str(employee_data["id"])
 
         update_payload = generate_employee_update_payload(employee_id)
@@ -30,9 +32,11 @@ class TestUpdateEmployee:
 
     @pytest.mark.positive
     @pytest.mark.crud
-    def test_update_employee_first_name(self, employees_client, created_employee):
+    def test_update_employee_first_name(
+        self, employees_client, mutable_pooled_employee
+    ):
         """PUT should update the employee's firstName."""
-        employee_data, payload = created_employee
+        employee_data, payload = mutable_pooled_employee
         employee_id = str(employee_data["id"])
 
         update_payload = generate_employee_update_payload(
@@ -48,9 +52,36 @@ class TestUpdateEmployee:
 
     @pytest.mark.positive
     @pytest.mark.crud
-    def test_update_employee_last_name(self, employees_client, created_employee):
+    def test_cached_read_reflects_update(
+        self, cached_employees_client, mutable_pooled_employee
+    ):
+        """A read after PUT through the same cached client should see the update."""
+        employee_data, payload = mutable_pooled_employee
+        employee_id = str(employee_data["id"])
+
+        before = cached_employees_client.get_employee_by_id(employee_id)
+        assert_status_code(before, 200)
+        assert_employee_fields(before.json(), {"firstName": payload["firstName"]})
+
+        update_payload = generate_employee_update_payload(
+            employee_id,
+            username=payload["username"],
+            first_name="CachedUpdate",
+            last_name=payload["lastName"],
+        )
+        assert_status_code(cached_employees_client.update_employee(update_payload), 200)
+
+        after = cached_employees_client.get_employee_by_id(employee_id)
+        assert_status_code(after, 200)
+        assert_employee_fields(after.json(), {"firstName": "CachedUpdate"})
+
+    @pytest.mark.positive
+    @pytest.mark.crud
+    def test_update_employee_last_name(
+        self, employees_client, mutable_pooled_employee
+    ):
         """PUT should update the employee's lastName."""
-        employee_data, payload = created_employee
+        employee_data, payload = mutable_pooled_employee
         employee_id = str(employee_data["id"])
 
         update_payload = generate_employee_update_payload(
@@ -66,9 +97,11 @@ class TestUpdateEmployee:
 
     @pytest.mark.positive
     @pytest.mark.crud
-    def test_update_employee_username(self, employees_client, created_employee):
+    def test_update_employee_username(
+        self, employees_client, mutable_pooled_employee
+    ):
         """PUT should update the employee's username."""
-        employee_data, payload = created_employee
+        employee_data, payload = mutable_pooled_employee
         employee_id = str(employee_data["id"])
 
         update_payload = generate_employee_update_payload(
@@ -84,9 +117,11 @@ class TestUpdateEmployee:
 
     @pytest.mark.positive
     @pytest.mark.crud
-    def test_update_employee_dependants(self, employees_client, created_employee):
+    def test_update_employee_dependants(
+        self, employees_client, mutable_pooled_employee
+    ):
         """PUT should update the employee's dependants count."""
-        employee_data, payload = created_employee
+        employee_data, payload = mutable_pooled_employee
         employee_id = str(employee_data["id"])
 
         update_payload = generate_employee_update_payload(
@@ -103,9 +138,11 @@ class TestUpdateEmployee:
 
     @pytest.mark.positive
     @pytest.mark.crud
-    def test_update_employee_salary(self, employees_client, created_employee):
+    def test_update_employee_salary(
+        self, employees_client, mutable_pooled_employee
+    ):
         """PUT should update the employee's salary."""
-        employee_data, payload = created_employee
+        employee_data, payload = mutable_pooled_employee
         employee_id = str(employee_data["id"])
 
         update_payload = generate_employee_update_payload(
@@ -122,10 +159,10 @@ class TestUpdateEmployee:
 
     @pytest.mark.positive
     def test_update_employee_schema_validation(
-        self, employees_client, created_employee
+        self, employees_client, mutable_pooled_employee
     ):
         """Updated employee response should conform to the Employee schema."""
-        employee_data, _ = created_employee
+        employee_data, _ = mutable_pooled_employee
         employee_id = str(employee_data["id"])
 
         update_payload = generate_employee_update_payload(employee_id)
@@ -136,10 +173,10 @@ class TestUpdateEmployee:
 
     @pytest.mark.positive
     def test_update_employee_persists_changes(
-        self, employees_client, created_employee
+        self, employees_client, mutable_pooled_employee
     ):
         """Changes from PUT should be reflected in a subsequent GET."""
-        employee_data, payload = created_employee
+        employee_data, payload = mutable_pooled_employee
         employee_id = str(employee_data["id"])
 
         update_payload = generate_employee_update_payload(
@@ -162,10 +199,10 @@ class TestUpdateEmployee:
 
     @pytest.mark.positive
     def test_update_employee_recomputes_benefits(
-        self, employees_client, created_employee
+        self, employees_client, mutable_pooled_employee
     ):
         """Updating dependants should recompute benefitsCost and net."""
-        employee_data, payload = created_employee
+        employee_data, payload = mutable_pooled_employee
         employee_id = str(employee_data["id"])
 
         # Get original values
@@ -197,9 +234,11 @@ class TestUpdateEmployee:
     # --- Negative Tests ---
 
     @pytest.mark.negative
-    def test_update_employee_missing_id(self, employees_client, created_employee):
+    def test_update_employee_missing_id(
+        self, employees_client, pooled_employee
+    ):
         """PUT without an id field should return 400."""
-        _, payload = created_employee
+        _, payload = pooled_employee
         update_payload = {
             "username": payload["username"],
             "firstName": "NoId",
@@ -223,10 +262,10 @@ class TestUpdateEmployee:
 
     @pytest.mark.negative
     def test_update_employee_missing_required_first_name(
-        self, employees_client, created_employee
+        self, employees_client, pooled_employee
     ):
         """PUT without firstName should return 400."""
-        employee_data, payload = created_employee
+        employee_data, payload = pooled_employee
         update_payload = {
             "id": str(employee_data["id"]),
             "username": payload["username"],
@@ -239,10 +278,10 @@ class TestUpdateEmployee:
 
     @pytest.mark.negative
     def test_update_employee_missing_required_last_name(
-        self, employees_client, created_employee
+        self, employees_client, pooled_employee
     ):
         """PUT without lastName should return 400."""
-        employee_data, payload = created_employee
+        employee_data, payload = pooled_employee
         update_payload = {
             "id": str(employee_data["id"]),
             "username": payload["username"],
@@ -255,10 +294,10 @@ class TestUpdateEmployee:
 
     @pytest.mark.negative
     def test_update_employee_missing_required_username(
-        self, employees_client, created_employee
+        self, employees_client, pooled_employee
     ):
         """PUT without username should return 400."""
-        employee_data, payload = created_employee
+        employee_data, payload = pooled_employee
         update_payload = {
             "id": str(employee_data["id"]),
             "firstName": payload["firstName"],
@@ -271,10 +310,10 @@ class TestUpdateEmployee:
 
     @pytest.mark.negative
     def test_update_employee_first_name_exceeds_max_length(
-        self, employees_client, created_employee
+        self, employees_client, pooled_employee
     ):
         """PUT with firstName > 50 chars should return 400."""
-        employee_data, _ = created_employee
+        employee_data, _ = pooled_employee
         employee_id = str(employee_data["id"])
 
         update_payload = generate_employee_update_payload(
@@ -287,10 +326,10 @@ class TestUpdateEmployee:
 
     @pytest.mark.negative
     def test_update_employee_dependants_exceeds_max(
-        self, employees_client, created_employee
+        self, employees_client, pooled_employee
     ):
         """PUT with dependants > 32 should return 400."""
-        employee_data, _ = created_employee
+        employee_data, _ = pooled_employee
         employee_id = str(employee_data["id"])
 
         update_payload = generate_employee_update_payload(
@@ -303,10 +342,10 @@ class TestUpdateEmployee:
 
     @pytest.mark.negative
     def test_update_employee_negative_dependants(
-        self, employees_client, created_employee
+        self, employees_client, pooled_employee
     ):
         """PUT with negative dependants should return 400."""
-        employee_data, _ = created_employee
+        employee_data, _ = pooled_employee
         employee_id = str(employee_data["id"])
 
         update_payload = generate_employee_update_payload(
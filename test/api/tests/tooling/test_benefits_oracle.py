@@ -0,0 +1,44 @@
+"""
+Rounding of the benefits oracle (utils/benefits_oracle.py) and the
+tolerance of ``assert_employees_match_oracle``.
+"""
+
+import pytest
+
+from utils.assertions import assert_employees_match_oracle
+from utils.benefits_oracle import PAYCHECKS_PER_YEAR, expected_paycheck
+
+
+def _employee(salary, dependants, gross, benefits_cost, net) -> dict:
+    return {
+        "id": "e1",
+        "salary": salary,
+        "dependants": dependants,
+        "gross": gross,
+        "benefitsCost": benefits_cost,
+        "net": net,
+    }
+
+
+@pytest.mark.regression
+class TestBenefitsOracle:
+    """The oracle should round each field on its own and tolerate a cent."""
+
+    def test_net_is_rounded_from_unrounded_pay(self):
+        # 2307.6923 − 134.6154 = 2173.0769; the rounded parts would give 2173.07
+        assert expected_paycheck(60000.0, 5) == {"gross": 2307.69, "benefitsCost": 134.62, "net": 2173.08}
+
+    def test_unrounded_pay_matches(self):
+        gross, benefits_cost = 60000.0 / PAYCHECKS_PER_YEAR, 3500.0 / PAYCHECKS_PER_YEAR
+        assert_employees_match_oracle([_employee(60000.0, 5, gross, benefits_cost, gross - benefits_cost)])
+
+    def test_net_from_rounded_parts_matches(self):
+        assert_employees_match_oracle([_employee(60000.0, 5, 2307.69, 134.62, 2173.07)])
+
+    def test_mismatch_beyond_a_cent_is_reported(self):
+        with pytest.raises(AssertionError, match="net expected 2173.08 got 2173.05"):
+            assert_employees_match_oracle([_employee(60000.0, 5, 2307.69, 134.62, 2173.05)])
+
+    def test_missing_pay_field_is_reported(self):
+        with pytest.raises(AssertionError, match="1 of 1 employees"):
+            assert_employees_match_oracle([_employee(60000.0, 5, 2307.69, None, 2173.08)])
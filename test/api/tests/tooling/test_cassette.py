@@ -0,0 +1,67 @@
+"""
+Record/replay round trips of the cassette transport (clients/cassette.py).
+
+Each test runs a slice of the suite in a pytest subprocess against the fake
+API, records it to a cassette under ``tmp_path`` and replays it.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+API_ROOT = Path(__file__).resolve().parents[2]
+
+# Pooled, created and list tests, negative cases included
+SELECTION = (
+    "tests/test_update_employee.py",
+    "tests/test_get_employees.py",
+    "tests/test_employee_crud_flow.py",
+)
+
+
+def _run_pytest(cassette_path, mode, *args) -> subprocess.CompletedProcess:
+    env = {
+        name: value
+        for name, value in os.environ.items()
+        if not name.startswith(("PYTEST_", "CASSETTE_")) and name not in ("TEST_RUN_ID", "FAKE_API_DEFECTS")
+    }
+    env.update(USE_FAKE_API="1", CASSETTE_MODE=mode, CASSETTE_PATH=str(cassette_path))
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "--no-sweep", *SELECTION, *args],
+        cwd=API_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+
+
+def _outcome(run: subprocess.CompletedProcess) -> str:
+    return f"exit {run.returncode}\n{run.stdout[-3000:]}\n{run.stderr[-2000:]}"
+
+
+class TestCassetteUnderXdist:
+    """Cassettes recorded and replayed by several workers."""
+
+    @pytest.mark.regression
+    def test_record_and_replay_with_two_workers(self, tmp_path):
+        """A cassette recorded with -n 2 replays cleanly with -n 2."""
+        cassette_path = tmp_path / "api"
+
+        recorded = _run_pytest(cassette_path, "record", "-n", "2", "--dist", "loadgroup")
+        assert recorded.returncode == 0, _outcome(recorded)
+        assert not list(tmp_path.glob("api.gw*")), "worker cassettes were not merged"
+
+        replayed = _run_pytest(cassette_path, "replay", "-n", "2")
+        assert replayed.returncode == 0, _outcome(replayed)
+        assert " passed" in replayed.stdout and "failed" not in replayed.stdout
+
+    @pytest.mark.regression
+    def test_record_under_load_distribution_is_refused(self, tmp_path):
+        """Recording with -n but without --dist loadgroup stops with a usage error."""
+        refused = _run_pytest(tmp_path / "api", "record", "-n", "2")
+        assert refused.returncode == pytest.ExitCode.USAGE_ERROR, _outcome(refused)
+        assert "--dist loadgroup" in refused.stderr
@@ -0,0 +1,175 @@
+"""
+Unit and smoke tests of the contract fuzzer (utils/contract_fuzzer.py).
+
+The full fuzz run (tests/fuzz) is opt-in; these run by default so the
+violation rules, shrinking and defect mapping are always exercised. The
+smoke tests start their own fake API so the outcome does not depend on
+FAKE_API_DEFECTS or the cassette mode.
+"""
+
+import itertools
+import random
+
+import pytest
+
+from clients.employees_client import EmployeesClient
+from fake_api import FakeEmployeesServer
+from utils.contract_fuzzer import (
+    ABOVE_MAX,
+    ACCEPTED_INVALID,
+    BELOW_MIN,
+    CREATE,
+    INPUT_FIELDS,
+    MAX_STRING_LENGTH,
+    MISSING,
+    NOT_ECHOED,
+    NOT_OBJECT,
+    NULL,
+    SERVER_ERROR,
+    TOO_LONG,
+    UPDATE,
+    WRONG_TYPE,
+    ContractFuzzer,
+    FuzzCase,
+    Signature,
+    Violation,
+    iter_cases,
+    match_defect,
+    shrink,
+    valid_value,
+    violations_of,
+)
+
+SMOKE_CASES = 50
+SMOKE_TOKEN = "contract-fuzzer-smoke"
+
+
+def _valid_payload() -> dict:
+    rng = random.Random(0)
+    return {name: valid_value(name, rng) for name in INPUT_FIELDS}
+
+
+@pytest.mark.regression
+class TestViolations:
+    """violations_of() should name every way a payload breaks the contract."""
+
+    def test_valid_payload_has_no_violations(self):
+        assert violations_of(_valid_payload()) == ()
+
+    @pytest.mark.parametrize(
+        "change, expected",
+        [
+            ({"username": MISSING}, Violation("username", MISSING)),
+            ({"username": None}, Violation("username", NULL)),
+            ({"firstName": "x" * (MAX_STRING_LENGTH + 1)}, Violation("firstName", TOO_LONG)),
+            ({"dependants": -1}, Violation("dependants", BELOW_MIN)),
+            ({"dependants": 33}, Violation("dependants", ABOVE_MAX)),
+            ({"dependants": True}, Violation("dependants", WRONG_TYPE)),
+            ({"salary": "abc"}, Violation("salary", WRONG_TYPE)),
+            ({"lastName": 123}, Violation("lastName", WRONG_TYPE)),
+        ],
+        ids=["missing", "null", "too_long", "below_min", "above_max", "bool_as_int", "str_as_float", "int_as_str"],
+    )
+    def test_single_violation(self, change, expected):
+        payload = _valid_payload()
+        for name, value in change.items():
+            if value is MISSING:
+                del payload[name]
+            else:
+                payload[name] = value
+        assert violations_of(payload) == (expected,)
+
+    @pytest.mark.parametrize("payload", [None, [], "employee"])
+    def test_non_object_body(self, payload):
+        assert violations_of(payload) == (Violation("", NOT_OBJECT),)
+        assert str(violations_of(payload)[0]) == "body:not_object"
+
+    def test_violations_are_sorted(self):
+        payload = {**_valid_payload(), "salary": "abc", "dependants": 33}
+        del payload["firstName"]
+        assert violations_of(payload) == tuple(sorted(violations_of(payload)))
+        assert len(violations_of(payload)) == 3
+
+
+@pytest.mark.regression
+class TestShrink:
+    """shrink() should reduce a case to the smallest payload that still reproduces."""
+
+    def test_shrinks_to_the_reproducing_violation(self):
+        payload = {**_valid_payload(), "username": "u" * 200, "dependants": 40}
+        case = FuzzCase(7, CREATE, payload)
+        reproducer = shrink(case, lambda candidate: Violation("username", TOO_LONG) in candidate.violations)
+
+        assert reproducer.violations == (Violation("username", TOO_LONG),)
+        # Optional fields are dropped; required ones stay, since dropping them adds violations
+        assert set(reproducer.payload) == {"username", "firstName", "lastName"}
+        assert reproducer.payload["username"] == "x" * (MAX_STRING_LENGTH + 1)
+        assert (reproducer.index, reproducer.operation) == (7, CREATE)
+
+    def test_returns_the_case_when_nothing_simpler_reproduces(self):
+        case = FuzzCase(0, UPDATE, {**_valid_payload(), "dependants": -1})
+        assert shrink(case, lambda candidate: False) is case
+
+    def test_attempts_are_bounded(self):
+        attempts = []
+
+        def reproduces(candidate):
+            attempts.append(candidate)
+            return False
+
+        shrink(FuzzCase(0, CREATE, {**_valid_payload(), "salary": "abc"}), reproduces, max_attempts=3)
+        assert len(attempts) == 3
+
+
+@pytest.mark.regression
+class TestDefectMapping:
+    """match_defect() should map failure signatures onto defects/api-bugs/."""
+
+    @pytest.mark.parametrize(
+        "signature, defect",
+        [
+            (Signature(CREATE, f"{NOT_ECHOED}:username", ()), "defect1.md"),
+            (Signature(CREATE, ACCEPTED_INVALID, ("username:missing",)), "defect2.md"),
+            (Signature(UPDATE, ACCEPTED_INVALID, ("username:null",)), "defect2.md"),
+            (Signature(CREATE, ACCEPTED_INVALID, ("username:too_long",)), "defect3.md"),
+            (Signature(CREATE, ACCEPTED_INVALID, ("firstName:too_long",)), "defect8.md"),
+            (Signature(UPDATE, ACCEPTED_INVALID, ("dependants:above_max",)), "defect8.md"),
+            (Signature(CREATE, ACCEPTED_INVALID, ("body:not_object",)), "defect8.md"),
+            (Signature(CREATE, ACCEPTED_INVALID, ("salary:wrong_type",)), None),
+            (Signature(CREATE, SERVER_ERROR, ("username:too_long",)), None),
+            (Signature(CREATE, f"{NOT_ECHOED}:firstName", ()), None),
+        ],
+        ids=str,
+    )
+    def test_match_defect(self, signature, defect):
+        assert match_defect(signature) == defect
+
+
+@pytest.mark.regression
+class TestContractFuzzerSmoke:
+    """A short ContractFuzzer run against a fake API of its own."""
+
+    def _run(self, emulate_defects: bool):
+        with FakeEmployeesServer(token=SMOKE_TOKEN, emulate_defects=emulate_defects) as server:
+            client = EmployeesClient(base_url=server.url, token=SMOKE_TOKEN)
+            try:
+                report = ContractFuzzer(client, concurrency=8).run(itertools.islice(iter_cases(seed=0), SMOKE_CASES))
+                remaining = client.get_all_employees().json()
+            finally:
+                client.close()
+        return report, remaining
+
+    def test_contract_holds_without_defects(self):
+        report, remaining = self._run(emulate_defects=False)
+        assert report.cases == SMOKE_CASES
+        assert not report.clusters, report.format()
+        assert remaining == [], "The fuzzer should delete everything it created"
+
+    def test_emulated_defects_are_found_and_mapped(self):
+        report, remaining = self._run(emulate_defects=True)
+        assert report.cases == SMOKE_CASES
+        assert report.clusters, "The fake API's emulated defects should be found"
+        assert "defect1.md" in {cluster.defect for cluster in report.clusters}, report.format()
+        for cluster in report.clusters:
+            assert len(cluster.reproducer.violations) <= len(cluster.example.violations), report.format()
+        assert remaining == [], "The fuzzer should delete everything it created"
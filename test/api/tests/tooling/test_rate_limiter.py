@@ -0,0 +1,90 @@
+"""
+Refill, burst and blocking of the token-bucket rate limiter
+(utils/rate_limiter.py), on a fake clock.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from utils import rate_limiter as rate_limiter_module
+from utils.rate_limiter import TokenBucket
+
+
+class _Clock:
+    """Fake ``time``: ``sleep`` records the delay and, unless ``frozen``, advances ``monotonic``."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+        self.frozen = False
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        if not self.frozen:
+            self.now += seconds
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(
+        rate_limiter_module, "time", SimpleNamespace(monotonic=fake.monotonic, sleep=fake.sleep)
+    )
+    return fake
+
+
+@pytest.mark.regression
+class TestTokenBucket:
+    """TokenBucket should allow a burst, then pace calls at ``rate`` per second."""
+
+    def test_burst_is_available_up_front(self, clock):
+        bucket = TokenBucket(rate=2.0, burst=3)
+
+        assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+        assert clock.sleeps == []
+
+    def test_refills_at_rate(self, clock):
+        bucket = TokenBucket(rate=2.0, burst=3)
+        for _ in range(3):
+            bucket.try_acquire()
+
+        clock.now += 0.49
+        assert not bucket.try_acquire()
+        clock.now += 0.01
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+
+    def test_refill_is_capped_at_burst(self, clock):
+        bucket = TokenBucket(rate=2.0, burst=3)
+        bucket.try_acquire()
+
+        clock.now += 60
+        assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+    def test_acquire_blocks_until_a_token_refills(self, clock):
+        bucket = TokenBucket(rate=4.0, burst=2)
+
+        waits = [bucket.acquire() for _ in range(5)]
+
+        assert waits == [0.0, 0.0, pytest.approx(0.25), pytest.approx(0.25), pytest.approx(0.25)]
+        assert clock.sleeps == waits[2:]
+        assert clock.now == pytest.approx(1000.75)
+
+    def test_waiting_callers_queue_behind_each_other(self, clock):
+        # Callers arriving together, before any sleep has run: each
+        # reservation pushes the next caller further back
+        clock.frozen = True
+        bucket = TokenBucket(rate=10.0, burst=1)
+
+        waits = [bucket.acquire() for _ in range(4)]
+
+        assert waits == [0.0, pytest.approx(0.1), pytest.approx(0.2), pytest.approx(0.3)]
+
+    @pytest.mark.parametrize("rate, burst", [(0, 1), (-1.0, 1), (1.0, 0)])
+    def test_rejects_invalid_settings(self, rate, burst):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=rate, burst=burst)
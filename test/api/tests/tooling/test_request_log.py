@@ -0,0 +1,52 @@
+"""
+Log levels and buffering of the request log (utils/request_log.py).
+"""
+
+import logging
+
+import pytest
+
+from utils.request_log import RequestLog
+
+URL = "http://api.test/api/Employees"
+
+
+@pytest.mark.regression
+class TestRequestLogLevels:
+    """Only server and transport errors should be logged unconditionally."""
+
+    @pytest.mark.parametrize("status", [400, 404, 422])
+    def test_client_errors_are_buffered_but_not_warned(self, caplog, status):
+        log = RequestLog(sample_rate=0.0)
+        caplog.set_level(logging.INFO, logger="utils.request_log")
+
+        exchange = log.record("POST", URL, status, 1.0, request_body=b"{}", response_body=b'{"error":"bad"}')
+
+        assert not caplog.records
+        assert log.recent() == [exchange]
+        assert exchange.failed and not exchange.errored
+
+    def test_sampled_client_error_is_info_with_bodies(self, caplog):
+        log = RequestLog(sample_rate=1.0)
+        caplog.set_level(logging.INFO, logger="utils.request_log")
+
+        log.record("PUT", URL, 400, 1.0, request_body=b"{}", response_body=b'{"error":"bad"}')
+
+        (record,) = caplog.records
+        assert record.levelno == logging.INFO
+        assert '"response_body":"{\\"error\\":\\"bad\\"}"' in record.getMessage()
+
+    @pytest.mark.parametrize(
+        "status, error",
+        [(500, None), (503, None), (None, "ConnectionError: refused")],
+        ids=["500", "503", "transport"],
+    )
+    def test_server_and_transport_errors_are_warned(self, caplog, status, error):
+        log = RequestLog(sample_rate=0.0)
+        caplog.set_level(logging.INFO, logger="utils.request_log")
+
+        log.record("GET", URL, status, 1.0, error=error)
+
+        (record,) = caplog.records
+        assert record.levelno == logging.WARNING
+        assert record.exchange.errored
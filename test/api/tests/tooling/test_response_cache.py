@@ -0,0 +1,165 @@
+"""
+Hits, revalidation, expiry and invalidation of the read cache
+(clients/response_cache.py). The revalidation tests run against a fake API
+of their own, which sends ETags.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from clients import response_cache as response_cache_module
+from clients.employees_client import EmployeesClient
+from clients.response_cache import ResponseCache
+from fake_api import FakeEmployeesServer
+from utils.data_factory import generate_employee_payload
+
+CACHE_TOKEN = "response-cache-test"
+URL = "http://api.test/api/Employees"
+
+
+def _response(status: int = 200, body=None, etag: str = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body if body is not None else []).encode("utf-8")
+    if etag:
+        response.headers["ETag"] = etag
+    return response
+
+
+class _Fetch:
+    """Fake ``fetch(headers)``: returns queued responses and records the headers."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def __call__(self, headers):
+        self.calls.append(headers)
+        return self.responses.pop(0)
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    """Controllable ``time.monotonic`` for the cache module."""
+    now = [1000.0]
+    monkeypatch.setattr(response_cache_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+@pytest.fixture()
+def cached_fake_client():
+    with FakeEmployeesServer(token=CACHE_TOKEN) as server:
+        cache = ResponseCache(ttl=0)
+        with EmployeesClient(base_url=server.url, token=CACHE_TOKEN, response_cache=cache) as client:
+            yield client
+
+
+@pytest.mark.regression
+class TestResponseCache:
+    """ResponseCache should serve, revalidate, expire and drop entries as documented."""
+
+    def test_fresh_entry_is_a_hit(self, clock):
+        cache = ResponseCache(ttl=2.0)
+        fetch = _Fetch(_response(body=[{"id": "1"}]))
+
+        first = cache.get(URL, fetch)
+        clock[0] += 1.9
+        second = cache.get(URL, fetch)
+
+        assert len(fetch.calls) == 1
+        assert (cache.hits, cache.misses, cache.revalidated) == (1, 1, 0)
+        assert second.json() == first.json() == [{"id": "1"}]
+        assert second is not first
+
+    def test_expired_entry_is_fetched_again(self, clock):
+        cache = ResponseCache(ttl=2.0)
+        fetch = _Fetch(_response(body=[{"id": "1"}]), _response(body=[{"id": "2"}]))
+
+        cache.get(URL, fetch)
+        clock[0] += 2.0
+        response = cache.get(URL, fetch)
+
+        assert fetch.calls == [{}, {}], "Without validators the refetch is unconditional"
+        assert response.json() == [{"id": "2"}]
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_expired_entry_with_etag_is_revalidated(self, clock):
+        cache = ResponseCache(ttl=2.0)
+        fetch = _Fetch(_response(body=[{"id": "1"}], etag='"v1"'), _response(status=304))
+
+        cache.get(URL, fetch)
+        clock[0] += 5
+        response = cache.get(URL, fetch)
+
+        assert fetch.calls[1] == {"If-None-Match": '"v1"'}
+        assert response.status_code == 200 and response.json() == [{"id": "1"}]
+        assert cache.revalidated == 1
+        # The 304 restarted the TTL
+        clock[0] += 1
+        cache.get(URL, fetch)
+        assert cache.hits == 1
+
+    @pytest.mark.parametrize("status", [404, 500])
+    def test_non_200_evicts_the_entry(self, clock, status):
+        cache = ResponseCache(ttl=2.0)
+        fetch = _Fetch(_response(body=[{"id": "1"}]), _response(status=status), _response(body=[]))
+
+        cache.get(URL, fetch)
+        clock[0] += 5
+        assert cache.get(URL, fetch).status_code == status
+        assert len(cache) == 0
+
+        cache.get(URL, fetch)
+        assert fetch.calls[2] == {}
+
+    def test_fetch_racing_an_invalidation_is_not_stored(self, clock):
+        cache = ResponseCache(ttl=2.0)
+
+        def fetch_during_write(headers):
+            # A write through another thread lands while this read is in flight
+            cache.invalidate(URL)
+            return _response(body=[{"id": "stale"}])
+
+        assert cache.get(URL, fetch_during_write).json() == [{"id": "stale"}]
+        assert len(cache) == 0
+
+        fetch = _Fetch(_response(body=[{"id": "fresh"}]))
+        assert cache.get(URL, fetch).json() == [{"id": "fresh"}]
+        assert len(fetch.calls) == 1
+
+    def test_fetch_racing_a_clear_is_not_stored(self, clock):
+        cache = ResponseCache(ttl=2.0)
+
+        def fetch_during_clear(headers):
+            cache.clear()
+            return _response(body=[{"id": "stale"}])
+
+        cache.get(URL, fetch_during_clear)
+        assert len(cache) == 0
+
+    def test_revalidates_against_fake_api_etag(self, cached_fake_client):
+        client = cached_fake_client
+        cache = client.response_cache
+        response = client.create_employee(generate_employee_payload())
+        employee_id = str(response.json()["id"])
+
+        first = client.get_employee_by_id(employee_id)
+        second = client.get_employee_by_id(employee_id)
+
+        assert first.headers.get("ETag")
+        assert second.status_code == 200 and second.json() == first.json()
+        assert (cache.misses, cache.revalidated) == (1, 1)
+
+    def test_write_invalidates_cached_read(self, cached_fake_client):
+        client = cached_fake_client
+        cache = client.response_cache
+        client.get_all_employees()
+        assert len(cache) == 1
+
+        client.create_employee(generate_employee_payload())
+        assert len(cache) == 0
+        assert len(client.get_all_employees().json()) == 1
+        assert (cache.misses, cache.revalidated) == (2, 0)
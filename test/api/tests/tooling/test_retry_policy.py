@@ -0,0 +1,26 @@
+"""
+Statuses and methods the client retry policy (clients/base_client.py) covers.
+"""
+
+import pytest
+
+from clients.base_client import build_retry
+
+
+@pytest.mark.regression
+class TestRetryPolicy:
+    """build_retry() should only retry transient failures by default."""
+
+    @pytest.mark.parametrize("status", [429, 502, 503, 504])
+    def test_transient_statuses_are_retried(self, status):
+        assert build_retry(retry_server_errors=False).is_retry("GET", status)
+
+    def test_server_error_is_not_retried_by_default(self):
+        assert not build_retry(retry_server_errors=False).is_retry("GET", 500)
+
+    def test_server_error_retry_is_opt_in(self):
+        assert build_retry(retry_server_errors=True).is_retry("PUT", 500)
+
+    def test_post_is_retried_only_when_enabled(self):
+        assert not build_retry(retry_post=False).is_retry("POST", 503)
+        assert build_retry(retry_post=True).is_retry("POST", 503)
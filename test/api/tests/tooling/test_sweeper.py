@@ -0,0 +1,55 @@
+"""
+Ledger handling of the orphan sweeper (utils/sweeper.py), against a fake
+API of its own.
+"""
+
+import pytest
+
+from clients.employees_client import EmployeesClient
+from fake_api import FakeEmployeesServer
+from utils.ledger import EmployeeLedger
+from utils.namespace import namespaced, run_id
+from utils.sweeper import sweep
+
+SWEEP_TOKEN = "sweeper-test"
+
+
+@pytest.fixture()
+def sweep_client():
+    with FakeEmployeesServer(token=SWEEP_TOKEN) as server:
+        with EmployeesClient(base_url=server.url, token=SWEEP_TOKEN) as client:
+            yield client
+
+
+def _orphan(client, ledger) -> str:
+    response = client.create_employee({"username": namespaced("orphan"), "firstName": "Orphan", "lastName": "Record"})
+    assert response.status_code == 200, response.text
+    employee_id = str(response.json()["id"])
+    ledger.record_created(employee_id)
+    return employee_id
+
+
+@pytest.mark.regression
+class TestSweepLedger:
+    """sweep() should only rewrite the ledger when asked to."""
+
+    def test_sweep_appends_without_compacting(self, sweep_client, tmp_path):
+        ledger = EmployeeLedger(tmp_path / "ledger.jsonl")
+        orphan = _orphan(sweep_client, ledger)
+        before = ledger.path.read_text(encoding="utf-8")
+
+        report = sweep(sweep_client, ledger=ledger, run=run_id())
+
+        assert report.deleted == [orphan]
+        after = ledger.path.read_text(encoding="utf-8")
+        # Appended to, never rewritten: entries other processes wrote are kept
+        assert after.startswith(before) and len(after) > len(before)
+        assert ledger.outstanding() == {}
+
+    def test_sweep_compacts_when_asked(self, sweep_client, tmp_path):
+        ledger = EmployeeLedger(tmp_path / "ledger.jsonl")
+        _orphan(sweep_client, ledger)
+
+        sweep(sweep_client, ledger=ledger, run=run_id(), compact=True)
+
+        assert ledger.path.read_text(encoding="utf-8") == ""
@@ -0,0 +1,56 @@
+"""
+Thread safety of the http2 transport's h2 state proxy (clients/transport.py).
+"""
+
+import threading
+import time
+
+import pytest
+
+from clients.transport import _LockedH2State
+
+
+class _RacyState:
+    """Stands in for ``H2Connection``: a read-modify-write with a gap."""
+
+    def __init__(self):
+        self.buffer = []
+        self.sent = []
+        self.max_outbound_frame_size = 16384
+
+    def append(self, frame):
+        self.buffer.append(frame)
+
+    def data_to_send(self):
+        data = list(self.buffer)
+        time.sleep(0.001)  # another thread may append here
+        self.buffer = []
+        self.sent.extend(data)
+
+
+@pytest.mark.regression
+class TestLockedH2State:
+    """_LockedH2State should make every call into the state machine atomic."""
+
+    def test_no_frame_is_lost_between_threads(self):
+        state = _RacyState()
+        proxy = _LockedH2State(state, threading.RLock())
+        offsets = (0, 1000, 2000, 3000)
+
+        def writer(offset):
+            for index in range(50):
+                proxy.append(offset + index)
+                proxy.data_to_send()
+
+        threads = [threading.Thread(target=writer, args=(offset,)) for offset in offsets]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        proxy.data_to_send()
+
+        assert sorted(state.sent) == sorted(offset + index for offset in offsets for index in range(50))
+
+    def test_attributes_pass_through(self):
+        proxy = _LockedH2State(_RacyState(), threading.RLock())
+        assert proxy.max_outbound_frame_size == 16384
@@ -0,0 +1 @@
+"""Command-line tools built on the API client layer."""
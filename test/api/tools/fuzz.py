@@ -0,0 +1,74 @@
+"""
+Fuzz POST/PUT /api/Employees against the contract (see utils/contract_fuzzer.py).
+
+    python -m tools.fuzz --cases 5000 --concurrency 16
+    python -m tools.fuzz --seed 7 --operations create --output fuzz.json
+    USE_FAKE_API=1 FAKE_API_DEFECTS=1 python -m tools.fuzz   # against the fake API's defects
+
+Prints one line per failure cluster with the defect report it maps onto
+and a shrunk reproducer. Every employee the fuzzer creates is deleted at
+the end. Exits 1 if any case broke the contract.
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import sys
+
+from clients.employees_client import EmployeesClient
+from config.settings import get_settings
+from fake_api import FakeEmployeesServer
+from utils.contract_fuzzer import OPERATIONS, ContractFuzzer, iter_cases
+
+
+def _operations(spec: str):
+    operations = tuple(name.strip() for name in spec.split(",") if name.strip())
+    unknown = set(operations) - set(OPERATIONS)
+    if unknown or not operations:
+        raise argparse.ArgumentTypeError(f"Choose operations from: {', '.join(OPERATIONS)}")
+    return operations
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Fuzz the Employees API against its contract.")
+    parser.add_argument("--cases", type=int, default=2000, help="Number of cases to send (default 2000)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the case generator (default 0)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent requests (default 16)")
+    parser.add_argument("--invalid-ratio", type=float, default=0.6,
+                        help="Share of cases given contract violations (default 0.6)")
+    parser.add_argument("--operations", type=_operations, default=OPERATIONS,
+                        help="Comma-separated operations to fuzz (default create,update)")
+    parser.add_argument("--no-shrink", action="store_true", help="Report failures without shrinking them")
+    parser.add_argument("--output", help="Also write the report as JSON to this path")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    # Rejected cases are the point here; don't log each one
+    logging.getLogger("utils.request_log").setLevel(logging.ERROR)
+
+    server = None
+    base_url = None
+    settings = get_settings()
+    if settings.USE_FAKE_API:
+        server = FakeEmployeesServer(token=settings.API_TOKEN, emulate_defects=settings.FAKE_API_DEFECTS).start()
+        base_url = server.url
+
+    try:
+        with EmployeesClient(base_url=base_url, max_connections=args.concurrency) as client:
+            fuzzer = ContractFuzzer(client, concurrency=args.concurrency, shrink=not args.no_shrink)
+            cases = itertools.islice(iter_cases(args.seed, args.invalid_ratio, args.operations), args.cases)
+            report = fuzzer.run(cases)
+    finally:
+        if server:
+            server.stop()
+
+    print(report.format())
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report.to_dict(), f, indent=2, default=str)
+    return 1 if report.clusters else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+"""
+Load generator that drives mixed workloads through EmployeesClient.
+
+    python -m tools.load_runner --duration 60 --concurrency 16
+    python -m tools.load_runner --rps 50 --mix get_all=70,create=20,update=5,delete=5
+    USE_FAKE_API=1 python -m tools.load_runner --duration 10   # local smoke run
+    python -m tools.load_runner --cache-ttl 1                  # reads through the client cache
+    python -m tools.load_runner --transport http2              # httpx / HTTP/2 transport
+
+Reports per-endpoint request count, error rate, throughput and
+p50/p95/p99 latency, plus how the client's connections were used (new vs
+reused, TLS handshakes, pool waits). Employees created during the run are
+deleted at the end.
+"""
+
+import argparse
+import json
+import logging
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from clients.employees_client import EmployeesClient
+from clients.response_cache import ResponseCache
+from clients.transport import TRANSPORTS
+from config.settings import get_settings
+from fake_api import FakeEmployeesServer
+from utils.data_factory import generate_employee_payload, generate_employee_update_payload
+from utils.latency import summarize
+from utils.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIX = {"get_all": 70, "create": 20, "update": 5, "delete": 5}
+
+# Operation name → endpoint label used in the report
+ENDPOINTS = {
+    "get_all": "GET /api/Employees",
+    "get_by_id": "GET /api/Employees/{id}",
+    "create": "POST /api/Employees",
+    "update": "PUT /api/Employees",
+    "delete": "DELETE /api/Employees/{id}",
+}
+
+
+def parse_mix(spec: str) -> Dict[str, int]:
+    """Parse ``name=weight,...`` into an operation → weight map."""
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise ValueError(f"Unknown operation '{name}'. Choose from: {', '.join(ENDPOINTS)}")
+        mix[name] = int(weight)
+    if sum(mix.values()) <= 0:
+        raise ValueError("Workload mix weights must sum to a positive number")
+    return mix
+
+
+class LoadRunner:
+    """Runs a weighted operation mix for a fixed duration and collects latencies."""
+
+    def __init__(
+        self,
+        client: EmployeesClient,
+        mix: Optional[Dict[str, int]] = None,
+        concurrency: int = 8,
+        duration: float = 30.0,
+        rps: Optional[float] = None,
+        seed: Optional[int] = None,
+    ):
+        self.client = client
+        self.mix = mix or DEFAULT_MIX
+        self.concurrency = concurrency
+        self.duration = duration
+        # burst=1 spaces request starts evenly at the target rate
+        self.pacer = TokenBucket(rps) if rps else None
+        self.random = random.Random(seed)
+
+        self._operations = list(self.mix)
+        self._weights = [self.mix[name] for name in self._operations]
+        self._created_ids: List[str] = []
+        self._lock = threading.Lock()
+        self._latencies = defaultdict(list)
+        self._errors = defaultdict(int)
+
+    # --- operations ---
+
+    def _take_id(self, remove: bool) -> Optional[str]:
+        with self._lock:
+            if not self._created_ids:
+                return None
+            index = self.random.randrange(len(self._created_ids))
+            if remove:
+                return self._created_ids.pop(index)
+            return self._created_ids[index]
+
+    def _run_operation(self, name: str):
+        """Execute one operation; returns (endpoint_name, response)."""
+        if name == "get_all":
+            return name, self.client.get_all_employees()
+
+        if name in ("get_by_id", "update", "delete"):
+            employee_id = self._take_id(remove=name == "delete")
+            if employee_id is None:
+                # Nothing to act on yet — seed the pool instead
+                name = "create"
+            elif name == "get_by_id":
+                return name, self.client.get_employee_by_id(employee_id)
+            elif name == "update":
+                return name, self.client.update_employee(
+                    generate_employee_update_payload(employee_id)
+                )
+            else:
+                return name, self.client.delete_employee(employee_id)
+
+        response = self.client.create_employee(generate_employee_payload())
+        if response.ok:
+            with self._lock:
+                self._created_ids.append(str(response.json()["id"]))
+        return name, response
+
+    # --- driver ---
+
+    def _worker(self, deadline: float):
+        while time.monotonic() < deadline:
+            if self.pacer:
+                self.pacer.acquire()
+                if time.monotonic() >= deadline:
+                    break
+            with self._lock:
+                name = self.random.choices(self._operations, self._weights)[0]
+            start = time.perf_counter()
+            ok = False
+            try:
+                name, response = self._run_operation(name)
+                ok = response.ok
+            except Exception as exc:  # noqa: BLE001 — counted as an error
+                logger.warning(f"{ENDPOINTS[name]} failed: {exc}")
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                self._latencies[name].append(elapsed_ms)
+                if not ok:
+                    self._errors[name] += 1
+
+    def run(self) -> dict:
+        """Run the workload and return the report (see ``build_report``)."""
+        started = time.monotonic()
+        deadline = started + self.duration
+        threads = [
+            threading.Thread(target=self._worker, args=(deadline,), daemon=True)
+            for _ in range(self.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+
+        self.cleanup()
+        return self.build_report(elapsed)
+
+    def cleanup(self):
+        """Delete every employee created during the run that is still alive."""
+        with self._lock:
+            ids, self._created_ids = self._created_ids, []
+        if ids:
+            logger.info(f"Deleting {len(ids)} employees created during the load run")
+            self.client.delete_employees(ids, concurrency=self.concurrency)
+
+    def build_report(self, elapsed: float) -> dict:
+        """Per-endpoint and overall latency, error rate and throughput."""
+        endpoints = {}
+        for name in sorted(self._latencies):
+            samples = self._latencies[name]
+            errors = self._errors[name]
+            endpoints[ENDPOINTS[name]] = {
+                **summarize(samples),
+                "errors": errors,
+                "error_rate": round(errors / len(samples), 4),
+                "throughput_rps": round(len(samples) / elapsed, 2),
+            }
+
+        all_samples = [ms for samples in self._latencies.values() for ms in samples]
+        total_errors = sum(self._errors.values())
+        return {
+            "duration_s": round(elapsed, 2),
+            "concurrency": self.concurrency,
+            "target_rps": round(self.pacer.rate, 2) if self.pacer else None,
+            "mix": self.mix,
+            "overall": {
+                **summarize(all_samples),
+                "errors": total_errors,
+                "error_rate": round(total_errors / len(all_samples), 4) if all_samples else 0.0,
+                "throughput_rps": round(len(all_samples) / elapsed, 2),
+            },
+            "endpoints": endpoints,
+            "cache": self._cache_stats(),
+            "transport": self.client.transport,
+            "connections": self.client.connection_stats.snapshot(),
+        }
+
+    def _cache_stats(self) -> Optional[dict]:
+        cache = getattr(self.client, "response_cache", None)
+        if cache is None:
+            return None
+        return {"hits": cache.hits, "revalidated": cache.revalidated, "misses": cache.misses}
+
+
+def format_report(report: dict) -> str:
+    """Render a report as a fixed-width text table."""
+    header = f"{'endpoint':<28}{'reqs':>8}{'err%':>8}{'rps':>9}{'p50ms':>9}{'p95ms':>9}{'p99ms':>9}"
+    rows = [header, "-" * len(header)]
+    sections = list(report["endpoints"].items()) + [("TOTAL", report["overall"])]
+    for label, stats in sections:
+        rows.append(
+            f"{label:<28}{stats['count']:>8}{stats['error_rate'] * 100:>7.2f}%"
+            f"{stats['throughput_rps']:>9.2f}{stats['p50_ms']:>9.1f}"
+            f"{stats['p95_ms']:>9.1f}{stats['p99_ms']:>9.1f}"
+        )
+    return "\n".join(rows)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Drive a mixed workload through EmployeesClient.")
+    parser.add_argument("--duration", type=float, default=30.0, help="Run time in seconds (default 30)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Worker threads (default 8)")
+    parser.add_argument("--rps", type=float, default=None, help="Target requests/second across all workers")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX,
+                        help="Operation weights, e.g. get_all=70,create=20,update=5,delete=5")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the operation picker")
+    parser.add_argument("--output", help="Also write the report as JSON to this path")
+    parser.add_argument("--cache-ttl", type=float, default=None,
+                        help="Serve reads through a client-side response cache with this TTL (seconds)")
+    parser.add_argument("--transport", choices=TRANSPORTS, default=None,
+                        help="Client transport (default HTTP_TRANSPORT, http1)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+
+    server = None
+    base_url = None
+    settings = get_settings()
+    if settings.USE_FAKE_API:
+        server = FakeEmployeesServer(token=settings.API_TOKEN).start()
+        base_url = server.url
+
+    try:
+        cache = ResponseCache(ttl=args.cache_ttl) if args.cache_ttl is not None else None
+        with EmployeesClient(
+            base_url=base_url, max_connections=args.concurrency, response_cache=cache, transport=args.transport
+        ) as client:
+            runner = LoadRunner(client, args.mix, args.concurrency, args.duration, args.rps, args.seed)
+            report = runner.run()
+    finally:
+        if server:
+            server.stop()
+
+    print(format_report(report))
+    if report["cache"]:
+        cache_stats = report["cache"]
+        print(
+            f"cache: {cache_stats['hits']} hits, {cache_stats['revalidated']} revalidated (304), "
+            f"{cache_stats['misses']} misses"
+        )
+    print(f"connections ({report['transport']}): {client.connection_stats.summary()}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0 if report["overall"]["errors"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
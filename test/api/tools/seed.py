@@ -0,0 +1,121 @@
+"""
+Seed employees for the E2E suite, and tear down a run's data in one pass.
+
+    python -m tools.seed create --count 20 --output seed.json   # one batch as a JSON fixture file
+    python -m tools.seed serve --port 8765                      # HTTP seeding service (utils/seeding.py)
+    python -m tools.seed teardown                               # delete everything this run created
+
+Seeded employees are created concurrently through ``EmployeesClient``, carry
+the run namespace and are recorded in the ledger (LEDGER_PATH). Set the same
+TEST_RUN_ID for the API suite (``pytest --testrunuid "$TEST_RUN_ID"``) and
+the seeding commands, and ``teardown`` sweeps both suites' leftovers at once.
+
+``serve`` deletes what it seeded when it stops, unless ``--keep`` is given
+(leave it to a later ``teardown``).
+"""
+
+import argparse
+import json
+import logging
+import signal
+import sys
+import time
+
+from clients.employees_client import DEFAULT_BULK_CONCURRENCY, EmployeesClient
+from config.settings import get_settings
+from utils.ledger import EmployeeLedger
+from utils.namespace import run_id
+from utils.registry import EmployeeRegistry
+from utils.seeding import EmployeeSeeder, SeedingServer
+from utils.sweeper import sweep
+
+DEFAULT_SEED_PORT = 8765
+
+
+def _client(args) -> EmployeesClient:
+    ledger = EmployeeLedger(get_settings().LEDGER_PATH)
+    return EmployeesClient(
+        base_url=args.base_url,
+        max_connections=args.concurrency,
+        registry=EmployeeRegistry(ledger=ledger),
+    )
+
+
+def _create(args) -> int:
+    with _client(args) as client:
+        batch = EmployeeSeeder(client, args.concurrency).seed(args.count, args.dependants)
+    output = json.dumps(batch.to_dict(), indent=2, default=str)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+        print(f"Seeded {len(batch.employees)} employee(s) for run {batch.run} into {args.output}")
+    else:
+        print(output)
+    return 1 if batch.failed else 0
+
+
+def _serve(args) -> int:
+    # Let a plain `kill` unwind through the teardown below
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    with _client(args) as client:
+        seeder = EmployeeSeeder(client, args.concurrency)
+        try:
+            with SeedingServer(seeder, args.host, args.port) as server:
+                print(f"Seeding service for run {run_id()} on {server.url} (Ctrl+C to stop)", flush=True)
+                while True:
+                    time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if not args.keep and seeder.seeded:
+                failed = seeder.teardown()
+                print(f"Deleted seeded employees ({len(failed)} failed)")
+    return 0
+
+
+def _teardown(args) -> int:
+    settings = get_settings()
+    with EmployeesClient(base_url=args.base_url, max_connections=args.concurrency) as client:
+        report = sweep(
+            client,
+            ledger=EmployeeLedger(settings.LEDGER_PATH),
+            run=args.run or run_id(),
+            concurrency=args.concurrency,
+            compact=True,
+        )
+    print(f"Teardown: {report.summary()}")
+    return 1 if report.failed else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Seed employees for other suites and tear them down.")
+    parser.add_argument("--base-url", help="Override BASE_URL")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_BULK_CONCURRENCY,
+                        help=f"Concurrent requests (default {DEFAULT_BULK_CONCURRENCY})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    create = commands.add_parser("create", help="Seed one batch and print it (or write it) as JSON")
+    create.add_argument("--count", type=int, default=10, help="Employees to create (default 10)")
+    create.add_argument("--dependants", type=int, help="Dependants for every employee (default random 0-10)")
+    create.add_argument("--output", help="Write the batch to this file instead of stdout")
+    create.set_defaults(handler=_create)
+
+    serve = commands.add_parser("serve", help="Serve POST/DELETE /employees over HTTP")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=DEFAULT_SEED_PORT,
+                       help=f"Port to listen on (default {DEFAULT_SEED_PORT})")
+    serve.add_argument("--keep", action="store_true", help="Leave seeded employees for a later teardown")
+    serve.set_defaults(handler=_serve)
+
+    teardown = commands.add_parser("teardown", help="Delete everything the current run created")
+    teardown.add_argument("--run", help="Sweep this run ID instead of the current one")
+    teardown.set_defaults(handler=_teardown)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logging.getLogger("utils.sweeper").setLevel(logging.INFO)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
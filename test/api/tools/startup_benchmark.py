@@ -0,0 +1,78 @@
+"""
+Startup benchmark — how long a fresh worker takes to import and collect.
+
+    python -m tools.startup_benchmark              # 10 runs of each measurement
+    python -m tools.startup_benchmark --runs 20 --output startup.json
+
+Measures, in fresh subprocesses:
+
+- ``import conftest``: the suite's own import cost (settings, clients,
+  Faker, models), i.e. what every xdist worker pays before running tests;
+- ``pytest --collect-only``: the full collection a short-lived CI shard pays.
+
+Reports min/median/max wall time in milliseconds.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SUITE_DIR = Path(__file__).resolve().parent.parent
+
+MEASUREMENTS = {
+    "import conftest": [sys.executable, "-c", "import conftest"],
+    "pytest --collect-only": [
+        sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider",
+    ],
+}
+
+
+def time_command(command, runs: int) -> dict:
+    """Run ``command`` ``runs`` times from the suite directory; wall times in ms."""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(
+            command,
+            cwd=SUITE_DIR,
+            env=os.environ.copy(),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        "runs": runs,
+        "min_ms": round(min(samples), 1),
+        "median_ms": round(statistics.median(samples), 1),
+        "max_ms": round(max(samples), 1),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="Runs per measurement (default 10)")
+    parser.add_argument("--output", help="Also write the results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    # Warm the OS file cache so the first sample is not an outlier
+    subprocess.run(MEASUREMENTS["import conftest"], cwd=SUITE_DIR, capture_output=True)
+
+    results = {name: time_command(command, args.runs) for name, command in MEASUREMENTS.items()}
+
+    print(f"{'measurement':<24}{'min ms':>10}{'median ms':>12}{'max ms':>10}")
+    for name, result in results.items():
+        print(f"{name:<24}{result['min_ms']:>10.1f}{result['median_ms']:>12.1f}{result['max_ms']:>10.1f}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
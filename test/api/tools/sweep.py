@@ -0,0 +1,62 @@
+"""
+Delete employees left on the backend by test runs.
+
+    python -m tools.sweep --dry-run          # list what would be deleted
+    python -m tools.sweep                    # delete every test-run record
+    python -m tools.sweep --run 3f9c2a       # only one run's records
+
+Orphans are records whose username carries a test-run namespace
+(``qa-<run>-<worker>-``) or whose ID is still outstanding in the ledger
+(LEDGER_PATH). They are deleted concurrently in batches. Don't sweep all
+runs while another run is in progress — its live records match too.
+"""
+
+import argparse
+import logging
+import sys
+
+from clients.employees_client import DEFAULT_BULK_CONCURRENCY, EmployeesClient
+from config.settings import get_settings
+from utils.ledger import EmployeeLedger
+from utils.sweeper import DEFAULT_SWEEP_BATCH_SIZE, sweep
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Delete employees left behind by test runs.")
+    parser.add_argument("--run", help="Only sweep this run ID (the 6 hex chars after 'qa-')")
+    parser.add_argument("--dry-run", action="store_true", help="Report orphans without deleting them")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_SWEEP_BATCH_SIZE,
+                        help=f"Deletes per batch (default {DEFAULT_SWEEP_BATCH_SIZE})")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_BULK_CONCURRENCY,
+                        help=f"Concurrent deletes within a batch (default {DEFAULT_BULK_CONCURRENCY})")
+    parser.add_argument("--base-url", help="Override BASE_URL")
+    parser.add_argument("--no-ledger", action="store_true", help="Match by username prefix only")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logging.getLogger("utils.sweeper").setLevel(logging.INFO)
+
+    settings = get_settings()
+    ledger = None if args.no_ledger else EmployeeLedger(settings.LEDGER_PATH)
+    with EmployeesClient(base_url=args.base_url, max_connections=args.concurrency) as client:
+        report = sweep(
+            client,
+            ledger=ledger,
+            run=args.run,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+            dry_run=args.dry_run,
+            compact=True,
+        )
+
+    if args.dry_run:
+        print(f"Dry run: {len(report.found)} orphaned employee(s)")
+        for employee_id in report.found:
+            print(f"  {employee_id}")
+    else:
+        print(f"Sweep: {report.summary()}")
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
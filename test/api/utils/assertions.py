@@ -2,7 +2,19 @@
 Reusable assertion helpers for API response validation.
 """
 
-from models.employee import EmployeeResponse
+from collections import defaultdict
+from functools import partial
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+import requests
+from pydantic import ValidationError
+
+from models.employee import EmployeeListAdapter, EmployeeResponse
+from models.employee_table import EmployeeTable
+from utils.benefits_oracle import PAY_FIELDS, PAY_TOLERANCE, expected_pay
+from utils.employee_index import EmployeeIndex
+from utils.json_codec import response_json
 
 
 def assert_status_code(response, expected_code: int):
@@ -13,6 +25,25 @@ def assert_status_code(response, expected_code: int):
     )
 
 
+def assert_bulk_status_codes(results, expected_code: int):
+    """Assert every BulkResult completed with the expected status code.
+
+    All failing items are reported together rather than stopping at the first.
+    """
+    failures = []
+    for index, result in enumerate(results):
+        if result.error is not None:
+            failures.append(f"[{index}] raised {result.error!r}")
+        elif result.response.status_code != expected_code:
+            failures.append(
+                f"[{index}] status {result.response.status_code}, body: {result.response.text}"
+            )
+    assert not failures, (
+        f"Expected status {expected_code} for all {len(results)} items, "
+        f"{len(failures)} failed:\n" + "\n".join(failures)
+    )
+
+
 def assert_employee_response_schema(data: dict):
     """Validate that the response data matches the EmployeeResponse schema."""
     employee = EmployeeResponse(**data)
@@ -22,6 +53,32 @@ def assert_employee_response_schema(data: dict):
     return employee
 
 
+def assert_employee_list_schema(source) -> list:
+    """Validate a whole employee list against the EmployeeResponse schema in one pass.
+
+    ``source`` may be a ``requests.Response`` — validated straight from the
+    raw body bytes — or an already-parsed list. Every invalid element is
+    reported in a single failure. Returns the validated models.
+    """
+    try:
+        if isinstance(source, requests.Response):
+            return EmployeeListAdapter.validate_json(source.content)
+        return EmployeeListAdapter.validate_python(source)
+    except ValidationError as exc:
+        by_index = defaultdict(list)
+        for error in exc.errors():
+            loc = error["loc"]
+            index = loc[0] if loc else "response"
+            field = ".".join(str(part) for part in loc[1:]) or "<item>"
+            by_index[index].append(f"{field}: {error['msg']}")
+        details = "\n".join(
+            f"  [{index}] " + "; ".join(messages) for index, messages in by_index.items()
+        )
+        raise AssertionError(
+            f"{len(by_index)} employee(s) failed schema validation:\n{details}"
+        ) from None
+
+
 def assert_employee_fields(data: dict, expected: dict):
     """Assert that specific fields in the employee response match expected values."""
     for key, value in expected.items():
@@ -36,21 +93,129 @@ def assert_json_response(response):
     assert "application/json" in content_type, (
         f"Expected JSON content type, got '{content_type}'"
     )
-    return response.json()
+    return response_json(response)
+
+
+def _employees_with_id(employees, employee_id) -> list:
+    """Return the records matching an ID from a list or an EmployeeIndex."""
+    if isinstance(employees, EmployeeIndex):
+        return employees.matches_id(employee_id)
+    # A single lookup in a plain list is cheaper as a scan than building an index
+    employee_id = str(employee_id)
+    return [e for e in employees if str(e.get("id")) == employee_id]
+
 
+def assert_employee_in_list(employees, employee_id: str) -> dict:
+    """Assert that an employee with the given ID exists in the list.
 
-def assert_employee_in_list(employees: list, employee_id: str) -> dict:
-    """Assert that an employee with the given ID exists in the list."""
-    matches = [e for e in employees if str(e.get("id")) == str(employee_id)]
+    ``employees`` may be a list response or an EmployeeIndex built from one;
+    pass an index when checking several IDs against the same list.
+    """
+    matches = _employees_with_id(employees, employee_id)
     assert len(matches) == 1, (
         f"Expected employee with id '{employee_id}' in list, found {len(matches)}"
     )
     return matches[0]
 
 
-def assert_employee_not_in_list(employees: list, employee_id: str):
-    """Assert that an employee with the given ID does NOT exist in the list."""
-    matches = [e for e in employees if str(e.get("id")) == str(employee_id)]
+def assert_employee_in_stream(employees: Iterable[dict], employee_id: str) -> dict:
+    """Assert an employee with the given ID appears in a streamed list.
+
+    Consumes ``employees`` (e.g. ``EmployeesClient.iter_all_employees()``)
+    only up to the first match.
+    """
+    for employee in employees:
+        if str(employee.get("id")) == str(employee_id):
+            return employee
+    raise AssertionError(f"Expected employee with id '{employee_id}' in list, found 0")
+
+
+def assert_employee_stream_schema(
+    employees: Iterable[dict], predicate: Optional[Callable[[dict], bool]] = None
+) -> int:
+    """Validate streamed employees against EmployeeResponse one at a time.
+
+    Only elements matching ``predicate`` (all, if None) are checked. Every
+    invalid element is reported in a single failure; nothing else is kept,
+    so memory stays flat. Returns the number of employees validated.
+    """
+    failures = []
+    checked = 0
+    for index, employee in enumerate(employees):
+        if predicate is not None and not predicate(employee):
+            continue
+        checked += 1
+        try:
+            EmployeeResponse.model_validate(employee)
+        except ValidationError as exc:
+            messages = [
+                f"{'.'.join(str(part) for part in error['loc']) or '<item>'}: {error['msg']}"
+                for error in exc.errors()
+            ]
+            failures.append(f"  [{index}] " + "; ".join(messages))
+    assert not failures, (
+        f"{len(failures)} employee(s) failed schema validation:\n" + "\n".join(failures)
+    )
+    return checked
+
+
+def assert_employee_not_in_list(employees, employee_id: str):
+    """Assert that an employee with the given ID does NOT exist in the list.
+
+    ``employees`` may be a list response or an EmployeeIndex built from one.
+    """
+    matches = _employees_with_id(employees, employee_id)
     assert len(matches) == 0, (
         f"Expected employee with id '{employee_id}' NOT in list, but found {len(matches)}"
     )
+
+
+def _column(employees: list, field: str) -> np.ndarray:
+    """Extract one numeric field from every record as a float array (None → NaN)."""
+    return np.array(
+        [np.nan if e.get(field) is None else e[field] for e in employees], dtype=float
+    )
+
+
+def _within_tolerance(actual, expected):
+    # Small epsilon: cent values are not exact in binary floating point
+    return np.abs(actual - expected) <= PAY_TOLERANCE + 1e-9
+
+
+def assert_employees_match_oracle(employees: Iterable[dict]):
+    """Assert every employee's gross/benefitsCost/net is within a cent of the oracle.
+
+    Compares all records in one vectorized pass and reports every mismatch,
+    including records with missing salary, dependants or pay fields.
+    ``employees`` may be an ``EmployeeTable``, whose columns are used as-is.
+    """
+    if isinstance(employees, EmployeeTable):
+        column = employees.column
+    else:
+        employees = list(employees)
+        column = partial(_column, employees)
+    if not len(employees):
+        return
+
+    expected = expected_pay(column("salary"), column("dependants"))
+    mismatched = np.zeros(len(employees), dtype=bool)
+    actual = {}
+    for field in PAY_FIELDS:
+        actual[field] = np.round(column(field), 2)
+        # NaN on either side (missing input or field) never matches
+        mismatched |= ~_within_tolerance(actual[field], expected[field])
+
+    indices = np.flatnonzero(mismatched)
+    details = "\n".join(
+        f"  [{i}] id={employees[i].get('id')} salary={employees[i].get('salary')} "
+        f"dependants={employees[i].get('dependants')}: "
+        + ", ".join(
+            f"{field} expected {expected[field][i]} got {actual[field][i]}"
+            for field in PAY_FIELDS
+            if not _within_tolerance(actual[field][i], expected[field][i])
+        )
+        for i in indices
+    )
+    assert len(indices) == 0, (
+        f"{len(indices)} of {len(employees)} employees do not match the benefits oracle:\n{details}"
+    )
@@ -0,0 +1,45 @@
+"""
+Benefits-calculation oracle.
+
+Computes the expected per-paycheck ``gross``, ``benefitsCost`` and ``net``
+from the README rules, vectorized with NumPy so a whole list response can be
+checked in one pass. Each field is rounded to cents on its own: net is
+computed from the unrounded gross and benefitsCost, so it can differ by a
+cent from the difference of the rounded values (salary 60000 with 5
+dependants: 2173.08, not 2307.69 − 134.62 = 2173.07). Backends may round
+either way, so compare within ``PAY_TOLERANCE``.
+"""
+
+import numpy as np
+
+# Benefits rules (see project README)
+PAYCHECKS_PER_YEAR = 26
+EMPLOYEE_BENEFITS_COST = 1000
+DEPENDANT_BENEFITS_COST = 500
+
+PAY_FIELDS = ("gross", "benefitsCost", "net")
+
+# Largest accepted difference between an actual and an expected pay field
+PAY_TOLERANCE = 0.01
+
+
+def expected_pay(salaries, dependants) -> dict:
+    """Expected gross, benefitsCost and net arrays for parallel input arrays.
+
+    Missing inputs (None/NaN) propagate as NaN.
+    """
+    salaries = np.asarray(salaries, dtype=float)
+    dependants = np.asarray(dependants, dtype=float)
+
+    gross = salaries / PAYCHECKS_PER_YEAR
+    benefits_cost = (EMPLOYEE_BENEFITS_COST + DEPENDANT_BENEFITS_COST * dependants) / PAYCHECKS_PER_YEAR
+    return {
+        "gross": np.round(gross, 2),
+        "benefitsCost": np.round(benefits_cost, 2),
+        "net": np.round(gross - benefits_cost, 2),
+    }
+
+
+def expected_paycheck(salary: float, dependants: int) -> dict:
+    """Expected gross, benefitsCost and net for a single employee, as floats."""
+    return {field: float(values) for field, values in expected_pay(salary, dependants).items()}
@@ -0,0 +1,536 @@
+"""
+Property-based contract fuzzer for POST and PUT /api/Employees.
+
+The payload space comes from ``EmployeeResponse`` plus the OpenAPI limits
+the model does not carry:
+
+- Input fields are the model's fields minus the server-computed ones.
+- Fields without a default (username, firstName, lastName) are required.
+- Each field's type comes from its annotation.
+- Names have maxLength 50, and dependants must be between 0 and 32.
+
+``iter_cases`` is a seeded, endless generator. Each case starts from a
+valid payload built from boundary and random values, and some cases then
+get one or two contract violations. A case's violations are always derived
+from its final payload (``violations_of``), so they stay correct however
+the payload was built or shrunk.
+
+``ContractFuzzer`` sends the cases concurrently through ``EmployeesClient``
+and checks the properties:
+- Valid payloads get 200, echo their input fields, and match the benefits
+  oracle.
+- Invalid payloads get a 4xx.
+- Nothing gets a 5xx.
+
+Failures are grouped by ``Signature``: operation, outcome and violation
+kinds. One representative per group is shrunk to a minimal reproducer by
+re-sending simpler payloads until the signature stops reproducing. Each
+cluster is mapped onto the report in ``defects/api-bugs/`` it reproduces,
+if any.
+"""
+
+import itertools
+import logging
+import math
+import random
+import string
+import typing
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from clients.base_client import run_concurrently
+from clients.employees_client import DEFAULT_BULK_CONCURRENCY, EmployeesClient
+from models.employee import EmployeeResponse
+from utils.benefits_oracle import PAY_FIELDS, PAY_TOLERANCE, expected_paycheck
+from utils.namespace import USERNAME_MAX_LENGTH, namespaced
+
+logger = logging.getLogger(__name__)
+
+CREATE = "create"
+UPDATE = "update"
+OPERATIONS = (CREATE, UPDATE)
+
+# OpenAPI limits (see defects/api-bugs/defect3.md and defect8.md)
+MAX_STRING_LENGTH = USERNAME_MAX_LENGTH
+MIN_DEPENDANTS = 0
+MAX_DEPENDANTS = 32
+
+# Fields the server fills in; never part of a request payload
+COMPUTED_FIELDS = frozenset({"partitionKey", "sortKey", "id", "expiration", "gross", "benefitsCost", "net"})
+
+# Violation kinds
+MISSING = "missing"
+NULL = "null"
+TOO_LONG = "too_long"
+BELOW_MIN = "below_min"
+ABOVE_MAX = "above_max"
+WRONG_TYPE = "wrong_type"
+NOT_OBJECT = "not_object"  # the body itself is not a JSON object
+
+# Outcomes (``None`` means the response honoured the contract)
+ACCEPTED_INVALID = "accepted_invalid"
+REJECTED_VALID = "rejected_valid"
+SERVER_ERROR = "server_error"
+TRANSPORT_ERROR = "transport_error"
+PAY_MISMATCH = "pay_mismatch"
+NOT_ECHOED = "not_echoed"  # reported as "not_echoed:<field>"
+
+# Bound on the requests spent shrinking one cluster
+MAX_SHRINK_ATTEMPTS = 60
+
+_ALPHABET = string.ascii_letters + string.digits + "éøßñ中-_. '"
+
+
+def _field_spec(name: str) -> Tuple[type, bool]:
+    """(value type, required) for one model field."""
+    info = EmployeeResponse.model_fields[name]
+    annotation = info.annotation
+    if typing.get_origin(annotation) is typing.Union:
+        annotation = next(arg for arg in typing.get_args(annotation) if arg is not type(None))
+    return annotation, info.is_required()
+
+
+INPUT_FIELDS: Dict[str, Tuple[type, bool]] = {
+    name: _field_spec(name) for name in EmployeeResponse.model_fields if name not in COMPUTED_FIELDS
+}
+REQUIRED_FIELDS = tuple(name for name, (_, required) in INPUT_FIELDS.items() if required)
+
+
+@dataclass(frozen=True, order=True)
+class Violation:
+    field: str
+    kind: str
+
+    def __str__(self) -> str:
+        return f"{self.field or 'body'}:{self.kind}"
+
+
+def violations_of(payload) -> Tuple[Violation, ...]:
+    """Every way ``payload`` breaks the contract, sorted (empty if valid)."""
+    if not isinstance(payload, dict):
+        return (Violation("", NOT_OBJECT),)
+    found = []
+    for name, (kind, required) in INPUT_FIELDS.items():
+        if name not in payload:
+            if required:
+                found.append(Violation(name, MISSING))
+            continue
+        value = payload[name]
+        if value is None:
+            if required:
+                found.append(Violation(name, NULL))
+        elif kind is str:
+            if not isinstance(value, str):
+                found.append(Violation(name, WRONG_TYPE))
+            elif len(value) > MAX_STRING_LENGTH:
+                found.append(Violation(name, TOO_LONG))
+        elif kind is int:
+            if isinstance(value, bool) or not isinstance(value, int):
+                found.append(Violation(name, WRONG_TYPE))
+            elif value < MIN_DEPENDANTS:
+                found.append(Violation(name, BELOW_MIN))
+            elif value > MAX_DEPENDANTS:
+                found.append(Violation(name, ABOVE_MAX))
+        elif kind is float:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                found.append(Violation(name, WRONG_TYPE))
+    return tuple(sorted(found))
+
+
+# --- Generation -------------------------------------------------------------
+
+
+def _text(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice(_ALPHABET) for _ in range(length))
+
+
+def valid_value(name: str, rng: random.Random):
+    """A valid value for one input field, biased towards the boundaries."""
+    kind, _ = INPUT_FIELDS[name]
+    if kind is str:
+        length = rng.choice((0, 1, MAX_STRING_LENGTH - 1, MAX_STRING_LENGTH, rng.randint(1, MAX_STRING_LENGTH)))
+        if name == "username":
+            # Namespaced so the sweeper can find it; padded to the drawn length
+            username = namespaced(_text(rng, 6))
+            return (username + _text(rng, MAX_STRING_LENGTH))[:max(length, len(username))]
+        return _text(rng, length)
+    if kind is int:
+        return rng.choice((MIN_DEPENDANTS, MIN_DEPENDANTS + 1, MAX_DEPENDANTS - 1, MAX_DEPENDANTS,
+                           rng.randint(MIN_DEPENDANTS, MAX_DEPENDANTS)))
+    return rng.choice((0, 0.01, 52000.0, 123456.78, round(rng.uniform(0, 500000), 2)))
+
+
+def invalid_value(name: str, rng: random.Random):
+    """(kind, value) breaking the contract for one field; ``value`` is
+    ``MISSING`` when the field should be left out."""
+    kind, required = INPUT_FIELDS[name]
+    options = []
+    if required:
+        options += [(MISSING, MISSING), (NULL, None)]
+    if kind is str:
+        options += [
+            (TOO_LONG, _text(rng, MAX_STRING_LENGTH + 1)),
+            (TOO_LONG, _text(rng, rng.randint(MAX_STRING_LENGTH + 2, 500))),
+            (WRONG_TYPE, rng.choice((123, True, ["a"], {"a": 1}))),
+        ]
+    elif kind is int:
+        options += [
+            (BELOW_MIN, MIN_DEPENDANTS - 1),
+            (BELOW_MIN, rng.choice((-1000, -(2 ** 31)))),
+            (ABOVE_MAX, MAX_DEPENDANTS + 1),
+            (ABOVE_MAX, rng.choice((1000, 2 ** 31 - 1))),
+            (WRONG_TYPE, rng.choice(("3", 1.5, True))),
+        ]
+    else:
+        options.append((WRONG_TYPE, rng.choice(("abc", "52000", True, [52000]))))
+    return rng.choice(options)
+
+
+@dataclass
+class FuzzCase:
+    index: int
+    operation: str
+    payload: object
+
+    @property
+    def violations(self) -> Tuple[Violation, ...]:
+        return violations_of(self.payload)
+
+    @property
+    def valid(self) -> bool:
+        return not self.violations
+
+
+def iter_cases(
+    seed: int = 0,
+    invalid_ratio: float = 0.6,
+    operations: Iterable[str] = OPERATIONS,
+) -> Iterator[FuzzCase]:
+    """Endless, reproducible stream of fuzz cases."""
+    rng = random.Random(seed)
+    operations = tuple(operations)
+    for index in itertools.count():
+        operation = rng.choice(operations)
+        roll = rng.random()
+        if roll < 0.01:
+            yield FuzzCase(index, operation, rng.choice((None, [], "employee")))
+            continue
+        if roll < 0.02:
+            yield FuzzCase(index, operation, {})
+            continue
+
+        payload = {}
+        for name, (_, required) in INPUT_FIELDS.items():
+            if required or rng.random() < 0.8:  # optional fields are sometimes left out
+                payload[name] = valid_value(name, rng)
+        if rng.random() < invalid_ratio:
+            for name in rng.sample(list(INPUT_FIELDS), k=rng.choice((1, 1, 1, 2))):
+                _, value = invalid_value(name, rng)
+                if value is MISSING:
+                    payload.pop(name, None)
+                else:
+                    payload[name] = value
+        yield FuzzCase(index, operation, payload)
+
+
+# --- Checking ---------------------------------------------------------------
+
+
+class Signature(NamedTuple):
+    """What went wrong, independent of the exact payload."""
+
+    operation: str
+    outcome: str
+    violations: Tuple[str, ...]
+
+    def __str__(self) -> str:
+        detail = f" [{', '.join(self.violations)}]" if self.violations else ""
+        return f"{self.operation} {self.outcome}{detail}"
+
+
+def _same_number(actual, expected, tolerance: float = 0.005) -> bool:
+    return isinstance(actual, (int, float)) and not isinstance(actual, bool) and math.isclose(
+        actual, expected, rel_tol=1e-9, abs_tol=tolerance
+    )
+
+
+def check(case: FuzzCase, response=None, error: Optional[Exception] = None) -> Optional[Signature]:
+    """The failure ``case`` produced, or None if the response honoured the contract."""
+    violations = tuple(str(v) for v in case.violations)
+
+    def failure(outcome: str) -> Signature:
+        return Signature(case.operation, outcome, violations)
+
+    if error is not None or response is None:
+        return failure(TRANSPORT_ERROR)
+    status = response.status_code
+    if status >= 500:
+        return failure(SERVER_ERROR)
+    if violations:
+        return failure(ACCEPTED_INVALID) if status < 400 else None
+    if status != 200:
+        return failure(REJECTED_VALID)
+
+    try:
+        data = response.json()
+    except ValueError:
+        return failure(REJECTED_VALID)
+    if not isinstance(data, dict):
+        return failure(REJECTED_VALID)
+    for name, (kind, _) in INPUT_FIELDS.items():
+        if name not in case.payload:
+            continue
+        sent, got = case.payload[name], data.get(name)
+        echoed = _same_number(got, sent) if kind is float else got == sent
+        if not echoed:
+            return failure(f"{NOT_ECHOED}:{name}")
+    salary, dependants = data.get("salary"), data.get("dependants")
+    if isinstance(salary, (int, float)) and isinstance(dependants, int):
+        expected = expected_paycheck(salary, dependants)
+        if not all(_same_number(data.get(name), expected[name], PAY_TOLERANCE) for name in PAY_FIELDS):
+            return failure(PAY_MISMATCH)
+    return None
+
+
+# --- Shrinking --------------------------------------------------------------
+
+
+def _simplest_valid(name: str):
+    kind, _ = INPUT_FIELDS[name]
+    if kind is str:
+        return namespaced("x") if name == "username" else "x"
+    return MIN_DEPENDANTS if kind is int else 52000.0
+
+
+# Smallest value still showing each kind of violation
+_SIMPLEST_VIOLATION = {TOO_LONG: "x" * (MAX_STRING_LENGTH + 1), BELOW_MIN: MIN_DEPENDANTS - 1, ABOVE_MAX: MAX_DEPENDANTS + 1}
+
+
+def _simpler_payloads(payload) -> Iterator[object]:
+    """Candidate simplifications of ``payload``, most aggressive first:
+    drop a field, supply a missing required field, fix a violating field,
+    then shrink values towards the simplest valid value or the boundary
+    they violate."""
+    if not isinstance(payload, dict):
+        return
+    for name in list(payload):
+        yield {key: value for key, value in payload.items() if key != name}
+    violated = {v.field: v.kind for v in violations_of(payload)}
+    for name in REQUIRED_FIELDS:
+        if violated.get(name) == MISSING:
+            yield {**payload, name: _simplest_valid(name)}
+    for name, value in payload.items():
+        if name not in INPUT_FIELDS:
+            continue
+        if name in violated:
+            yield {**payload, name: _simplest_valid(name)}
+            simplest = _SIMPLEST_VIOLATION.get(violated[name], value)
+            if simplest != value:
+                yield {**payload, name: simplest}
+        elif value != _simplest_valid(name):
+            yield {**payload, name: _simplest_valid(name)}
+
+
+def _complexity(payload) -> Tuple[int, int, int, int]:
+    """Shrink order: fewer violations, then fewer fields, then shorter values,
+    then more values already in their simplest form."""
+    if not isinstance(payload, dict):
+        return 1, 0, len(repr(payload)), 0
+    simplest = {*_SIMPLEST_VIOLATION.values(), *(_simplest_valid(name) for name in INPUT_FIELDS)}
+    return (
+        len(violations_of(payload)),
+        len(payload),
+        sum(len(repr(value)) for value in payload.values()),
+        sum(1 for value in payload.values() if not isinstance(value, (str, int, float)) or value not in simplest),
+    )
+
+
+def shrink(case: FuzzCase, reproduces: Callable[[FuzzCase], bool], max_attempts: int = MAX_SHRINK_ATTEMPTS) -> FuzzCase:
+    """Greedily simplify ``case`` while ``reproduces`` still holds.
+
+    Only strictly simpler candidates (``_complexity``) are tried, so
+    shrinking always terminates.
+    """
+    attempts = 0
+    current = case
+    progressed = True
+    while progressed and attempts < max_attempts:
+        progressed = False
+        for payload in _simpler_payloads(current.payload):
+            if _complexity(payload) >= _complexity(current.payload):
+                continue
+            if attempts >= max_attempts:
+                break
+            attempts += 1
+            candidate = FuzzCase(current.index, current.operation, payload)
+            if reproduces(candidate):
+                current = candidate
+                progressed = True
+                break
+    return current
+
+
+# --- Defect mapping ---------------------------------------------------------
+
+
+def _accepted(signature: Signature, fields: Iterable[str], kinds: Iterable[str] = None) -> bool:
+    if signature.outcome != ACCEPTED_INVALID:
+        return False
+    fields, kinds = set(fields), set(kinds) if kinds else None
+    for violation in signature.violations:
+        name, _, kind = violation.partition(":")
+        if name in fields and (kinds is None or kind in kinds):
+            return True
+    return False
+
+
+# First matching rule wins
+DEFECT_RULES: Tuple[Tuple[str, Callable[[Signature], bool]], ...] = (
+    ("defect1.md", lambda s: s.outcome == f"{NOT_ECHOED}:username"),
+    ("defect2.md", lambda s: _accepted(s, ["username"], [MISSING, NULL])),
+    ("defect3.md", lambda s: _accepted(s, ["username"], [TOO_LONG])),
+    ("defect8.md", lambda s: _accepted(s, ["firstName", "lastName", "dependants", "body"])),
+)
+
+
+def match_defect(signature: Signature) -> Optional[str]:
+    """The ``defects/api-bugs/`` report a failure signature reproduces, if any."""
+    return next((name for name, rule in DEFECT_RULES if rule(signature)), None)
+
+
+# --- Running ----------------------------------------------------------------
+
+
+@dataclass
+class Cluster:
+    signature: Signature
+    count: int
+    example: FuzzCase
+    reproducer: FuzzCase
+    defect: Optional[str] = None
+
+
+@dataclass
+class FuzzReport:
+    cases: int
+    clusters: List[Cluster] = field(default_factory=list)
+
+    @property
+    def failures(self) -> int:
+        return sum(cluster.count for cluster in self.clusters)
+
+    def to_dict(self) -> dict:
+        return {
+            "cases": self.cases,
+            "failures": self.failures,
+            "clusters": [
+                {
+                    "signature": str(cluster.signature),
+                    "count": cluster.count,
+                    "defect": cluster.defect,
+                    "operation": cluster.reproducer.operation,
+                    "reproducer": cluster.reproducer.payload,
+                    "example": cluster.example.payload,
+                }
+                for cluster in self.clusters
+            ],
+        }
+
+    def format(self) -> str:
+        lines = [f"{self.cases} cases, {self.failures} failures in {len(self.clusters)} clusters"]
+        for cluster in self.clusters:
+            lines.append(
+                f"  {cluster.count:>5}  {cluster.signature}  → {cluster.defect or 'unreported'}"
+            )
+            lines.append(f"         reproducer: {cluster.reproducer.operation.upper()} {cluster.reproducer.payload!r}")
+        return "\n".join(lines)
+
+
+class ContractFuzzer:
+    """Sends fuzz cases through ``EmployeesClient`` and clusters the failures."""
+
+    def __init__(self, client: EmployeesClient, concurrency: int = DEFAULT_BULK_CONCURRENCY, shrink: bool = True):
+        self.client = client
+        self.concurrency = concurrency
+        self.shrink = shrink
+        self._target_id: Optional[str] = None
+        self._created: List[str] = []
+
+    def _send(self, case: FuzzCase):
+        if case.operation == UPDATE:
+            payload = {**case.payload, "id": self._target_id} if isinstance(case.payload, dict) else case.payload
+            return self.client.update_employee(payload)
+        response = self.client.create_employee(case.payload)
+        if response.status_code == 200:
+            try:
+                employee_id = response.json().get("id")
+            except (ValueError, AttributeError):
+                employee_id = None
+            if employee_id:
+                self._created.append(str(employee_id))
+        return response
+
+    def _signature(self, case: FuzzCase) -> Optional[Signature]:
+        try:
+            return check(case, self._send(case))
+        except Exception as exc:  # noqa: BLE001 — a crash is a finding too
+            return check(case, error=exc)
+
+    def _reproduces(self, candidate: FuzzCase, signature: Signature) -> bool:
+        """True if ``candidate`` fails the same way, with a subset of the violations."""
+        found = self._signature(candidate)
+        return (
+            found is not None
+            and found.outcome == signature.outcome
+            and bool(found.violations) == bool(signature.violations)
+            and set(found.violations) <= set(signature.violations)
+        )
+
+    def _provision_target(self):
+        rng = random.Random(0)
+        payload = {name: valid_value(name, rng) for name in INPUT_FIELDS}
+        response = self._send(FuzzCase(-1, CREATE, payload))
+        assert response.status_code == 200, (
+            f"Fuzzer: failed to create the PUT target. Status: {response.status_code}, Body: {response.text}"
+        )
+        self._target_id = str(response.json()["id"])
+
+    def run(self, cases: Iterable[FuzzCase]) -> FuzzReport:
+        """Send every case, then shrink and map one representative per cluster."""
+        cases = list(cases)
+        try:
+            if any(case.operation == UPDATE for case in cases):
+                self._provision_target()
+            results = run_concurrently(self._send, cases, self.concurrency)
+
+            groups: "OrderedDict[Signature, List[FuzzCase]]" = OrderedDict()
+            for case, result in zip(cases, results):
+                signature = check(case, result.response, result.error)
+                if signature is not None:
+                    groups.setdefault(signature, []).append(case)
+
+            clusters: "OrderedDict[Signature, Cluster]" = OrderedDict()
+            for signature, members in groups.items():
+                example = members[0]
+                reproducer = example
+                if self.shrink:
+                    reproducer = shrink(example, lambda candidate: self._reproduces(candidate, signature))
+                key = Signature(reproducer.operation, signature.outcome,
+                                tuple(str(v) for v in reproducer.violations))
+                if key in clusters:
+                    clusters[key].count += len(members)
+                else:
+                    clusters[key] = Cluster(key, len(members), example, reproducer, match_defect(key))
+            return FuzzReport(len(cases), sorted(clusters.values(), key=lambda c: -c.count))
+        finally:
+            self.cleanup()
+
+    def cleanup(self):
+        """Delete every employee the fuzzer created."""
+        ids, self._created = self._created, []
+        if self._target_id:
+            ids.append(self._target_id)
+            self._target_id = None
+        if ids:
+            self.client.delete_employees(ids, concurrency=self.concurrency)
@@ -1,11 +1,115 @@
 """
 Test data factory for generating employee payloads.
+
+Generated usernames carry the run/worker namespace (see utils/namespace.py)
+so records created by parallel workers never collide.
+
+Names come from a ``PayloadPool``: one batch of usernames and first/last
+names generated from a fixed seed the first time a payload is needed, then
+handed out at O(1) cost, so Faker stays off the hot path of bulk creation
+and load runs. The same seed yields the same dataset on every run.
+
+The Faker instance is built on first use: importing faker and loading its
+providers is the most expensive part of importing the suite.
 """
 
-import uuid
-from faker import Faker
+import threading
+import zlib
+from functools import lru_cache
+from typing import List, Tuple
+
+from config.settings import get_settings
+from utils.namespace import namespaced
+
+# Base usernames are cut to this length so namespace + base + draw index
+# always fit in USERNAME_MAX_LENGTH, keeping the index (what makes the
+# username unique) from being truncated.
+_BASE_USERNAME_LENGTH = 20
+
+
+# lru_cache doesn't stop concurrent first callers from each building their
+# own instance, which would hand out the same pooled usernames twice.
+_build_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _build_faker():
+    from faker import Faker  # deferred: slow to import
+
+    return Faker()
+
+
+def get_faker():
+    """The shared Faker instance, created on first use."""
+    with _build_lock:
+        return _build_faker()
+
+
+def __getattr__(name: str):
+    """Keep ``data_factory.fake`` working without building Faker at import."""
+    if name == "fake":
+        return get_faker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-fake = Faker()
+class PayloadPool:
+    """Precomputed employee identities, handed out in order.
+
+    ``size`` (username, first name, last name) triples are generated once
+    from ``seed``. Each draw appends its draw index to the username, and
+    ``namespaced`` prefixes the run/worker namespace, so usernames are
+    unique within a worker and across xdist workers even after the pool
+    wraps around. Thread-safe.
+    """
+
+    def __init__(self, size: int, seed: int = 0):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        from faker import Faker  # deferred: slow to import
+
+        faker = Faker()
+        faker.seed_instance(seed)
+        self.size = size
+        self.seed = seed
+        self._identities: List[Tuple[str, str, str]] = [
+            (faker.user_name()[:_BASE_USERNAME_LENGTH], faker.first_name()[:50], faker.last_name()[:50])
+            for _ in range(size)
+        ]
+        self._cursor = 0
+        self._lock = threading.Lock()
+
+    def seek(self, position: int):
+        """Continue drawing from ``position`` (e.g. to make a test's draws reproducible)."""
+        with self._lock:
+            self._cursor = position
+
+    def identity(self) -> Tuple[str, str, str]:
+        """Next (username, first name, last name); the username is namespaced."""
+        with self._lock:
+            index = self._cursor
+            self._cursor += 1
+        username, first_name, last_name = self._identities[index % self.size]
+        return namespaced(f"{username}{index}"), first_name, last_name
+
+
+@lru_cache(maxsize=None)
+def _build_payload_pool() -> PayloadPool:
+    settings = get_settings()
+    return PayloadPool(settings.PAYLOAD_POOL_SIZE, seed=settings.PAYLOAD_SEED)
+
+
+def get_payload_pool() -> PayloadPool:
+    """The shared pool, built from PAYLOAD_POOL_SIZE / PAYLOAD_SEED on first use."""
+    with _build_lock:
+        return _build_payload_pool()
+
+
+def _identity(username, first_name, last_name) -> Tuple[str, str, str]:
+    """Fill in whichever of the three names the caller did not supply."""
+    if username and first_name and last_name:
+        return username, first_name, last_name
+    pooled = get_payload_pool().identity()
+    return username or pooled[0], first_name or pooled[1], last_name or pooled[2]
 
 
 def generate_employee_payload(
@@ -16,10 +120,11 @@ def generate_employee_payload(
     salary: float = 52000.0,
 ) -> dict:
     """Generate a valid employee creation payload."""
+    username, first_name, last_name = _identity(username, first_name, last_name)
     return {
-        "username": username or fake.user_name()[:50],
-        "firstName": first_name or fake.first_name()[:50],
-        "lastName": last_name or fake.last_name()[:50],
+        "username": username,
+        "firstName": first_name,
+        "lastName": last_name,
         "dependants": dependants,
         "salary": salary,
     }
@@ -34,16 +139,29 @@ def generate_employee_update_payload(
     salary: float = 52000.0,
 ) -> dict:
     """Generate a valid employee update payload (includes id)."""
+    username, first_name, last_name = _identity(username, first_name, last_name)
     return {
         "id": employee_id,
-        "username": username or fake.user_name()[:50],
-        "firstName": first_name or fake.first_name()[:50],
-        "lastName": last_name or fake.last_name()[:50],
+        "username": username,
+        "firstName": first_name,
+        "lastName": last_name,
         "dependants": dependants,
         "salary": salary,
     }
 
 
+def seed(value) -> None:
+    """Make subsequent payloads and random UUIDs reproducible for ``value``.
+
+    Seeds Faker and moves the payload pool to a position derived from
+    ``value``, so the same value always draws the same identities
+    regardless of what was drawn before.
+    """
+    get_faker().seed_instance(value)
+    # Spread positions far apart so different values do not reuse draw indices
+    get_payload_pool().seek(zlib.crc32(str(value).encode("utf-8")) << 16)
+
+
 def random_uuid() -> str:
-    """Return a random UUID string."""
-    return str(uuid.uuid4())
+    """Return a random UUID string (reproducible once ``seed`` is called)."""
+    return get_faker().uuid4()
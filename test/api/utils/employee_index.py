@@ -0,0 +1,55 @@
+"""
+Indexed view over a GET /api/Employees list response.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+
+class EmployeeIndex:
+    """Maps employee ID (and optionally username) to records in a list response.
+
+    Build it once per list response, then look employees up in O(1) instead
+    of scanning the list for every assertion. IDs are compared as strings.
+    Duplicate IDs are kept so assertions can still detect them.
+    """
+
+    def __init__(self, employees: Iterable[dict], by_username: bool = False):
+        self.employees: List[dict] = list(employees)
+        self._by_id: Dict[str, List[dict]] = {}
+        self._by_username: Optional[Dict[str, List[dict]]] = {} if by_username else None
+
+        for employee in self.employees:
+            self._by_id.setdefault(str(employee.get("id")), []).append(employee)
+            if self._by_username is not None:
+                self._by_username.setdefault(employee.get("username"), []).append(employee)
+
+    @classmethod
+    def of(cls, employees) -> "EmployeeIndex":
+        """Return ``employees`` if it is already an index, else index it."""
+        if isinstance(employees, cls):
+            return employees
+        return cls(employees)
+
+    def __len__(self) -> int:
+        return len(self.employees)
+
+    def __contains__(self, employee_id) -> bool:
+        return str(employee_id) in self._by_id
+
+    def matches_id(self, employee_id) -> List[dict]:
+        """Return every record with the given ID (normally zero or one)."""
+        return self._by_id.get(str(employee_id), [])
+
+    def get(self, employee_id) -> Optional[dict]:
+        """Return the first record with the given ID, or None."""
+        matches = self.matches_id(employee_id)
+        return matches[0] if matches else None
+
+    def matches_username(self, username: str) -> List[dict]:
+        """Return every record with the given username.
+
+        Requires the index to be built with ``by_username=True``.
+        """
+        if self._by_username is None:
+            raise ValueError("EmployeeIndex was built without by_username=True")
+        return self._by_username.get(username, [])
@@ -0,0 +1,110 @@
+"""
+Session-level pool of pre-provisioned employees.
+
+Instead of a POST and a DELETE per test, the pool bulk-creates a few
+employees once, lends one to each test and takes it back afterwards.
+Employees lent to tests that modify them are reset to their original
+payload with a single PUT before being lent again.
+"""
+
+import logging
+import threading
+import zlib
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+from clients.employees_client import EmployeesClient
+from utils.data_factory import generate_employee_payload
+
+logger = logging.getLogger(__name__)
+
+# (response_data, payload), the same shape the created_employee fixture yields
+PooledEmployee = Tuple[dict, dict]
+
+
+class EmployeePool:
+    """Lends pre-created employees to tests and resets them via PUT on return."""
+
+    def __init__(
+        self,
+        client: EmployeesClient,
+        size: int,
+        payload_factory: Callable[[], dict] = generate_employee_payload,
+    ):
+        self.client = client
+        self.size = size
+        self.payload_factory = payload_factory
+        self._available = deque()
+        self._owned: Dict[str, None] = {}
+        self._lock = threading.Lock()
+
+    def provision(self):
+        """Bulk-create ``size`` employees up front."""
+        payloads = [self.payload_factory() for _ in range(self.size)]
+        for result in self.client.create_employees(payloads):
+            if result.ok:
+                self._add(result.response.json(), result.item)
+            else:
+                logger.warning(f"Pool provisioning failed for one employee: {result.error or result.response.text}")
+
+    def _add(self, data: dict, payload: dict):
+        with self._lock:
+            self._owned[str(data["id"])] = None
+            self._available.append((data, payload))
+
+    def acquire(self, key: Optional[str] = None) -> PooledEmployee:
+        """Lend an employee, creating a new one if the pool is empty.
+
+        With a ``key`` (e.g. the test's node ID) the same free employees yield
+        the same pick for the same key, whatever was lent before, so a test's
+        requests do not depend on test order (see clients/cassette.py).
+        """
+        with self._lock:
+            if self._available:
+                if key is not None:
+                    owned = list(self._owned)
+                    self._available = deque(
+                        sorted(self._available, key=lambda employee: owned.index(str(employee[0]["id"])))
+                    )
+                    self._available.rotate(-(zlib.crc32(key.encode("utf-8")) % len(self._available)))
+                return self._available.popleft()
+
+        payload = self.payload_factory()
+        response = self.client.create_employee(payload)
+        assert response.status_code == 200, (
+            f"Pool: failed to create employee. Status: {response.status_code}, Body: {response.text}"
+        )
+        data = response.json()
+        with self._lock:
+            self._owned[str(data["id"])] = None
+        return data, payload
+
+    def release(self, employee: PooledEmployee, dirty: bool = False):
+        """Return a lent employee.
+
+        With ``dirty`` the employee is first restored to its original payload
+        through PUT; if that fails it is retired rather than lent again.
+        """
+        data, payload = employee
+        if dirty:
+            response = self.client.update_employee({**payload, "id": str(data["id"])})
+            if response.status_code != 200:
+                logger.warning(
+                    f"Pool: could not reset employee {data['id']} "
+                    f"(status {response.status_code}); retiring it"
+                )
+                return
+            data = response.json()
+
+        with self._lock:
+            self._available.append((data, payload))
+
+    def drain(self) -> List[str]:
+        """Delete every employee the pool ever created, in one concurrent batch."""
+        with self._lock:
+            ids = list(self._owned)
+            self._owned.clear()
+            self._available.clear()
+        if ids:
+            self.client.delete_employees(ids)
+        return ids
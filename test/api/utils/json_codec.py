@@ -0,0 +1,52 @@
+"""
+JSON decoding for API responses.
+
+Uses orjson when it is installed (``pip install orjson``) and falls back to
+the standard library otherwise. Parsed bodies are cached on the response,
+so repeated ``.json()`` calls in a test only decode once.
+"""
+
+import json
+
+import requests
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+_CACHE_ATTR = "_parsed_json"
+_MISSING = object()
+
+
+def loads(data):
+    """Decode JSON from bytes or str with the fastest available decoder."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def response_json(response: requests.Response, **kwargs):
+    """Return the decoded body of ``response``, parsing it at most once.
+
+    Keyword arguments (``json.loads`` options) bypass the fast path and the
+    cache, matching ``requests.Response.json``. The cached object is shared
+    between calls, so copy it before mutating.
+    """
+    if kwargs:
+        return requests.Response.json(response, **kwargs)
+
+    cached = response.__dict__.get(_CACHE_ATTR, _MISSING)
+    if cached is not _MISSING:
+        return cached
+
+    try:
+        parsed = loads(response.content)
+    except ValueError as exc:
+        # Same exception type callers get from requests.Response.json
+        raise requests.exceptions.JSONDecodeError(
+            str(exc), response.text, getattr(exc, "pos", 0) or 0
+        ) from exc
+
+    response.__dict__[_CACHE_ATTR] = parsed
+    return parsed
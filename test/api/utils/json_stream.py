@@ -0,0 +1,115 @@
+"""
+Incremental parser for a top-level JSON array.
+
+``iter_json_array`` turns a stream of byte chunks (e.g.
+``response.iter_content()``) into the array's elements, one at a time.
+Only the current chunk and the element being parsed are held in memory, so
+peak memory stays flat however long the array is, and the caller can stop
+as soon as it has found what it needs.
+
+Each element is decoded by the standard library's C scanner
+(``JSONDecoder.raw_decode``); an element split across chunks is simply
+retried once more data has arrived.
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_WHITESPACE = " \t\n\r"
+# What may follow an array element
+_DELIMITERS = _WHITESPACE + ",]"
+_decoder = json.JSONDecoder()
+
+# Drop consumed text from the buffer once this much has piled up
+_COMPACT_AFTER = 64 * 1024
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    while pos < len(text) and text[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+def iter_json_array(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[Any]:
+    """Yield the elements of a JSON array streamed as byte chunks.
+
+    Raises ``json.JSONDecodeError`` if the document is not a JSON array or
+    ends early.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    chunk_iter = iter(chunks)
+    buffer = ""
+    pos = 0
+    exhausted = False
+
+    def read_more():
+        """Append the next chunk to the buffer, compacting consumed text first."""
+        nonlocal buffer, pos, exhausted
+        if pos > _COMPACT_AFTER:
+            buffer, pos = buffer[pos:], 0
+        chunk = next(chunk_iter, None)
+        if chunk is None:
+            exhausted = True
+            buffer += decoder.decode(b"", final=True)
+        else:
+            buffer += decoder.decode(chunk)
+
+    started = False      # seen the opening "["
+    expect_value = True  # next token is an element (vs "," or "]")
+    count = 0
+    while True:
+        pos = _skip_whitespace(buffer, pos)
+        if pos >= len(buffer):
+            if exhausted:
+                raise json.JSONDecodeError(
+                    "Unterminated JSON array" if started else "Expected a JSON array", buffer, pos
+                )
+            read_more()
+            continue
+
+        char = buffer[pos]
+        if not started:
+            if char != "[":
+                raise json.JSONDecodeError("Expected a JSON array", buffer, pos)
+            started = True
+            pos += 1
+        elif expect_value:
+            if char == "]" and count == 0:
+                pos += 1
+                break
+            try:
+                value, end = _decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if exhausted:
+                    raise
+                read_more()  # element split across chunks; retry from ``pos``
+                continue
+            if (
+                not exhausted
+                and char not in '{["'
+                and (end == len(buffer) or buffer[end] not in _DELIMITERS)
+            ):
+                read_more()  # a number may continue in the next chunk ("-1." + "5")
+                continue
+            pos = end
+            expect_value = False
+            count += 1
+            yield value
+        elif char == ",":
+            expect_value = True
+            pos += 1
+        elif char == "]":
+            pos += 1
+            break
+        else:
+            raise json.JSONDecodeError("Expected ',' or ']'", buffer, pos)
+
+    # Only whitespace may follow the array
+    while True:
+        pos = _skip_whitespace(buffer, pos)
+        if pos < len(buffer):
+            raise json.JSONDecodeError("Extra data after JSON array", buffer, pos)
+        if exhausted:
+            return
+        read_more()
@@ -0,0 +1,62 @@
+"""
+Latency statistics helpers shared by the load runner and timing reports.
+"""
+
+import math
+from typing import Iterable, List
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Return the ``pct`` percentile (0–100) of pre-sorted values.
+
+    Uses linear interpolation between closest ranks; returns 0.0 for an
+    empty list.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return sorted_values[lower]
+    weight = rank - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+def summarize(samples_ms: Iterable[float]) -> dict:
+    """Summarize latency samples (milliseconds) as count/min/mean/max and p50/p95/p99."""
+    values = sorted(samples_ms)
+    count = len(values)
+    return {
+        "count": count,
+        "min_ms": round(values[0], 2) if values else 0.0,
+        "mean_ms": round(sum(values) / count, 2) if values else 0.0,
+        "p50_ms": round(percentile(values, 50), 2),
+        "p95_ms": round(percentile(values, 95), 2),
+        "p99_ms": round(percentile(values, 99), 2),
+        "max_ms": round(values[-1], 2) if values else 0.0,
+    }
+
+
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+DEFAULT_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+def histogram(samples_ms: Iterable[float], bounds=DEFAULT_BUCKETS_MS) -> List[dict]:
+    """Count samples per latency bucket.
+
+    Returns one ``{"le_ms": bound, "count": n}`` entry per bound plus a final
+    ``{"le_ms": None, ...}`` overflow bucket.
+    """
+    counts = [0] * (len(bounds) + 1)
+    for value in samples_ms:
+        for index, bound in enumerate(bounds):
+            if value <= bound:
+                counts[index] += 1
+                break
+        else:
+            counts[-1] += 1
+    return [
+        {"le_ms": bound, "count": count}
+        for bound, count in zip(list(bounds) + [None], counts)
+    ]
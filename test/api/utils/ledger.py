@@ -0,0 +1,82 @@
+"""
+Persistent ledger of employees created by test runs.
+
+The in-memory ``EmployeeRegistry`` is lost if a worker crashes or is
+killed; the ledger survives it. Every create and delete is appended as one
+JSON line tagged with the run ID, so the sweeper (``tools/sweep.py`` and the
+session-finish hook) can find records on the backend even when their
+username was overwritten (see api-bugs/defect1).
+
+Each entry is a single short ``write`` in append mode, which POSIX keeps
+atomic, so all xdist workers of a run can share one file.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from utils.namespace import run_id
+
+ADD = "add"
+DELETE = "del"
+
+
+class EmployeeLedger:
+    """Append-only log of created/deleted employee IDs, replayed on read."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def _append(self, entries: Iterable[dict]):
+        lines = "".join(json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries)
+        if not lines:
+            return
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as ledger:
+                ledger.write(lines)
+
+    def record_created(self, employee_id):
+        self._append([{"op": ADD, "id": str(employee_id), "run": run_id()}])
+
+    def record_deleted(self, *employee_ids):
+        self._append({"op": DELETE, "id": str(employee_id)} for employee_id in employee_ids)
+
+    def outstanding(self, run: Optional[str] = None) -> Dict[str, str]:
+        """IDs created and not yet deleted, mapped to their run ID.
+
+        With ``run`` only that run's entries are returned.
+        """
+        if not self.path.exists():
+            return {}
+        created: Dict[str, str] = {}
+        with open(self.path, encoding="utf-8") as ledger:
+            for line in ledger:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn line from a killed process
+                if entry.get("op") == ADD:
+                    created[entry["id"]] = entry.get("run", "")
+                elif entry.get("op") == DELETE:
+                    created.pop(entry["id"], None)
+        if run is not None:
+            return {employee_id: owner for employee_id, owner in created.items() if owner == run}
+        return created
+
+    def compact(self):
+        """Rewrite the ledger keeping only outstanding entries.
+
+        Entries appended by another process during the rewrite are lost, so
+        only compact when no run is writing to the same ledger.
+        """
+        with self._lock:
+            remaining = self.outstanding()
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as ledger:
+                for employee_id, owner in remaining.items():
+                    ledger.write(json.dumps({"op": ADD, "id": employee_id, "run": owner}, separators=(",", ":")) + "\n")
+            os.replace(tmp_path, self.path)
@@ -0,0 +1,111 @@
+"""
+Per-request timing records and pluggable metrics sinks.
+
+BaseClient reports a RequestTiming for every call to its ``metrics_sink``,
+or to the process-wide default sink when none is given. The default is a
+no-op; the latency report plugin installs an in-memory sink for the session.
+"""
+
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+_UUID_SEGMENT = re.compile(
+    r"/[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}(?=/|$)"
+)
+_EMPLOYEE_ID_SEGMENT = re.compile(r"(/api/Employees)/[^/]+$")
+
+
+def endpoint_template(path: str) -> str:
+    """Collapse resource IDs in a path so calls group by endpoint.
+
+    ``/api/Employees/3f2a...`` and ``/api/Employees/not-a-uuid`` both map to
+    ``/api/Employees/{id}``.
+    """
+    path = _UUID_SEGMENT.sub("/{id}", path)
+    return _EMPLOYEE_ID_SEGMENT.sub(r"\1/{id}", path)
+
+
+@dataclass
+class RequestTiming:
+    """Timing breakdown for one HTTP exchange (all durations in milliseconds).
+
+    ``ttfb_ms`` runs from sending the request until the response headers are
+    parsed, so it includes connection setup unless ``connect_ms`` is known.
+    ``download_ms`` is the time spent reading the body after that.
+    """
+
+    method: str
+    endpoint: str
+    url: str
+    status: Optional[int]
+    total_ms: float
+    ttfb_ms: Optional[float] = None
+    download_ms: Optional[float] = None
+    connect_ms: Optional[float] = None
+    response_bytes: int = 0
+    error: Optional[str] = None
+    test: Optional[str] = None
+    timestamp: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class MetricsSink:
+    """Receives RequestTiming records. The base implementation discards them."""
+
+    def record(self, timing: RequestTiming):
+        pass
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """Thread-safe sink that keeps every timing in memory.
+
+    ``context`` (e.g. the running test's node ID) is stamped onto each
+    record that does not already carry one.
+    """
+
+    def __init__(self):
+        self.context: Optional[str] = None
+        self._timings: List[RequestTiming] = []
+        self._lock = threading.Lock()
+
+    def record(self, timing: RequestTiming):
+        if timing.test is None:
+            timing.test = self.context
+        with self._lock:
+            self._timings.append(timing)
+
+    def timings(self) -> List[RequestTiming]:
+        with self._lock:
+            return list(self._timings)
+
+    def by_endpoint(self) -> Dict[str, List[RequestTiming]]:
+        """Group timings by ``"METHOD /endpoint"``."""
+        grouped: Dict[str, List[RequestTiming]] = {}
+        for timing in self.timings():
+            grouped.setdefault(f"{timing.method} {timing.endpoint}", []).append(timing)
+        return grouped
+
+    def clear(self):
+        with self._lock:
+            self._timings.clear()
+
+
+_default_sink: MetricsSink = MetricsSink()
+
+
+def get_default_sink() -> MetricsSink:
+    """Return the process-wide sink used by clients without their own."""
+    return _default_sink
+
+
+def set_default_sink(sink: Optional[MetricsSink]) -> MetricsSink:
+    """Install a process-wide sink (None restores the no-op); returns the previous one."""
+    global _default_sink
+    previous = _default_sink
+    _default_sink = sink or MetricsSink()
+    return previous
@@ -0,0 +1,52 @@
+"""
+Client-side token-bucket rate limiter shared across threads.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Caps the rate of ``acquire`` calls at ``rate`` per second.
+
+    The bucket holds up to ``burst`` tokens and refills continuously; each
+    ``acquire`` takes one token, sleeping until one is available. With
+    ``burst=1`` calls are spaced evenly at ``1 / rate`` seconds.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = float(rate)
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Take a token, blocking until one is available. Returns the seconds waited."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            # Reserve the token now (the balance may go negative) so waiting
+            # threads queue up behind each other instead of racing.
+            self._tokens -= 1
+            delay = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available right now, without blocking."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
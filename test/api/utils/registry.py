@@ -0,0 +1,50 @@
+"""
+Registry of employees created through a client, used for teardown.
+"""
+
+import threading
+from typing import List, Optional
+
+from utils.ledger import EmployeeLedger
+
+
+class EmployeeRegistry:
+    """Thread-safe set of employee IDs created and not yet deleted.
+
+    EmployeesClient adds an ID on every successful create and discards it on
+    every successful delete, so whatever remains at session end is leftover
+    data from tests that failed before their own cleanup.
+
+    With a ``ledger`` every add/discard is also persisted, so records are
+    still found by the sweeper if the process dies before teardown.
+    """
+
+    def __init__(self, ledger: Optional[EmployeeLedger] = None):
+        self._ids = {}
+        self._lock = threading.Lock()
+        self.ledger = ledger
+
+    def add(self, employee_id):
+        with self._lock:
+            self._ids[str(employee_id)] = None
+        if self.ledger is not None:
+            self.ledger.record_created(employee_id)
+
+    def discard(self, employee_id):
+        with self._lock:
+            self._ids.pop(str(employee_id), None)
+        if self.ledger is not None:
+            self.ledger.record_deleted(employee_id)
+
+    def ids(self) -> List[str]:
+        """Registered IDs in creation order."""
+        with self._lock:
+            return list(self._ids)
+
+    def __contains__(self, employee_id) -> bool:
+        with self._lock:
+            return str(employee_id) in self._ids
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._ids)
@@ -0,0 +1,173 @@
+"""
+Structured, sampled request logging with a ring buffer of recent exchanges.
+
+Both clients hand every HTTP exchange to the process-wide ``RequestLog``
+(``get_request_log()``):
+
+- Server errors (status >= 500) and transport errors are always logged at
+  WARNING, with the request and response bodies.
+- Everything else is logged at INFO for a sampled fraction only
+  (REQUEST_LOG_SAMPLE, 0 to 1; default 0). A 4xx is usually what a
+  negative test asked for, so it is sampled like a success, but keeps its
+  bodies.
+- The last REQUEST_LOG_BUFFER exchanges, bodies included, are kept in a
+  ring buffer. The request-log plugin attaches it to a test's report only
+  when the test fails.
+
+Each log line is one JSON object. Nothing is formatted unless a handler
+actually emits the record: the message is a lazy ``JsonLine``, and the
+level check runs before anything is built. Structured handlers can read the
+``Exchange`` from ``record.exchange``. Bodies are truncated to
+REQUEST_LOG_BODY_LIMIT bytes when recorded, so the buffer stays small even
+for large list responses.
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import List, Optional, Union
+
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+Body = Union[bytes, str, None]
+
+
+def _truncate(body: Body, limit: int) -> Body:
+    return body if body is None or len(body) <= limit else body[:limit]
+
+
+def _text(body: Body) -> Optional[str]:
+    if isinstance(body, bytes):
+        return body.decode("utf-8", errors="replace")
+    return body
+
+
+@dataclass
+class Exchange:
+    """One request/response pair; bodies are already truncated."""
+
+    method: str
+    url: str
+    status: Optional[int]
+    elapsed_ms: float
+    request_body: Body = None
+    response_body: Body = None
+    # Full response size, when the body was read (not streamed)
+    response_bytes: Optional[int] = None
+    error: Optional[str] = None
+    test: Optional[str] = None
+    timestamp: float = field(default_factory=time.time)
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None or self.status is None or self.status >= 400
+
+    @property
+    def errored(self) -> bool:
+        """A server or transport error, never an outcome a caller asks for."""
+        return self.error is not None or self.status is None or self.status >= 500
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["elapsed_ms"] = round(self.elapsed_ms, 2)
+        data["request_body"] = _text(self.request_body)
+        data["response_body"] = _text(self.response_body)
+        return data
+
+
+class JsonLine:
+    """Log message that renders an exchange as JSON only when emitted."""
+
+    __slots__ = ("exchange", "bodies")
+
+    def __init__(self, exchange: Exchange, bodies: bool):
+        self.exchange = exchange
+        self.bodies = bodies
+
+    def __str__(self) -> str:
+        data = self.exchange.to_dict()
+        if not self.bodies:
+            del data["request_body"], data["response_body"]
+        return json.dumps(data, separators=(",", ":"))
+
+
+class RequestLog:
+    """Logs exchanges (server/transport errors always, the rest sampled) and keeps the last few."""
+
+    def __init__(self, sample_rate: float = 0.0, buffer_size: int = 20, body_limit: int = 2048):
+        self.sample_rate = sample_rate
+        self.body_limit = body_limit
+        # Stamped onto each exchange, like InMemoryMetricsSink.context
+        self.context: Optional[str] = None
+        self._recent = deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        status: Optional[int],
+        elapsed_ms: float,
+        request_body: Body = None,
+        response_body: Body = None,
+        error: Optional[str] = None,
+    ) -> Exchange:
+        """Buffer one exchange and log it if it errored or is sampled."""
+        exchange = Exchange(
+            method=method,
+            url=url,
+            status=status,
+            elapsed_ms=elapsed_ms,
+            request_body=_truncate(request_body, self.body_limit),
+            response_body=_truncate(response_body, self.body_limit),
+            response_bytes=None if response_body is None else len(response_body),
+            error=error,
+            test=self.context,
+        )
+        with self._lock:
+            self._recent.append(exchange)
+
+        if exchange.errored:
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("%s", JsonLine(exchange, bodies=True), extra={"exchange": exchange})
+        elif self.sample_rate > 0 and random.random() < self.sample_rate:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("%s", JsonLine(exchange, bodies=exchange.failed), extra={"exchange": exchange})
+        return exchange
+
+    def recent(self) -> List[Exchange]:
+        """Buffered exchanges, oldest first."""
+        with self._lock:
+            return list(self._recent)
+
+    def clear(self):
+        with self._lock:
+            self._recent.clear()
+
+    def dump(self) -> str:
+        """The buffered exchanges as JSON lines, bodies included."""
+        return "\n".join(str(JsonLine(exchange, bodies=True)) for exchange in self.recent())
+
+
+_default_log: Optional[RequestLog] = None
+_default_lock = threading.Lock()
+
+
+def get_request_log() -> RequestLog:
+    """The process-wide log, configured from settings on first use."""
+    global _default_log
+    with _default_lock:
+        if _default_log is None:
+            settings = get_settings()
+            _default_log = RequestLog(
+                sample_rate=settings.REQUEST_LOG_SAMPLE,
+                buffer_size=settings.REQUEST_LOG_BUFFER,
+                body_limit=settings.REQUEST_LOG_BODY_LIMIT,
+            )
+        return _default_log
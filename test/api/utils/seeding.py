@@ -0,0 +1,224 @@
+"""
+Bulk employee seeding for suites that don't talk to the API themselves.
+
+The Playwright E2E suite used to create every employee it needed by filling
+in the Add Employee form. ``EmployeeSeeder`` creates them through
+``EmployeesClient`` instead, concurrently, and hands back the records as the
+API returned them (ID, names and computed pay fields), ready to serve as
+JSON fixtures.
+
+``SeedingServer`` exposes the seeder over HTTP, so a test runner in another
+language can ask for N employees in one call:
+
+    POST   /employees   {"count": 10, "dependants": 1}  → {"run", "count", "employees", "failed"}
+    DELETE /employees   delete everything this server seeded
+    GET    /health      {"run", "seeded"}
+
+Seeded usernames carry the run namespace (see utils/namespace.py) and, when
+the client has a registry with a ledger, every ID is recorded there. That
+way one sweep of the run (``python -m tools.seed teardown``) deletes the
+E2E suite's employees together with whatever the API suite left behind.
+"""
+
+import json
+import logging
+import threading
+import uuid
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+from clients.employees_client import DEFAULT_BULK_CONCURRENCY, EmployeesClient
+from utils.data_factory import generate_employee_payload, get_faker
+from utils.namespace import namespaced, run_id
+
+logger = logging.getLogger(__name__)
+
+MAX_SEED_COUNT = 500
+# Same range as generateEmployee() in the E2E data factory
+DEFAULT_MAX_DEPENDANTS = 10
+
+
+@dataclass
+class SeedBatch:
+    """Employees created by one ``seed`` call."""
+
+    run: str
+    employees: List[dict] = field(default_factory=list)
+    # One message per employee that could not be created
+    failed: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "run": self.run,
+            "count": len(self.employees),
+            "employees": self.employees,
+            "failed": self.failed,
+        }
+
+
+class EmployeeSeeder:
+    """Bulk-creates employees for other suites and deletes them again."""
+
+    def __init__(self, client: EmployeesClient, concurrency: int = DEFAULT_BULK_CONCURRENCY):
+        self.client = client
+        self.concurrency = concurrency
+        self._seeded: Dict[str, None] = {}
+        self._lock = threading.Lock()
+
+    def _payload(self, dependants: Optional[int]) -> dict:
+        # UI tests find rows by name, and the payload pool's names repeat
+        # from run to run; draw fresh ones. The pool's usernames are only
+        # unique within one process, and several seeders may share a run.
+        faker = get_faker()
+        if dependants is None:
+            dependants = faker.random_int(0, DEFAULT_MAX_DEPENDANTS)
+        return generate_employee_payload(
+            username=namespaced(f"seed-{uuid.uuid4().hex[:12]}"),
+            first_name=faker.first_name()[:50],
+            last_name=faker.last_name()[:50],
+            dependants=dependants,
+        )
+
+    def seed(self, count: int, dependants: Optional[int] = None) -> SeedBatch:
+        """Create ``count`` employees (random dependants unless given)."""
+        if not 1 <= count <= MAX_SEED_COUNT:
+            raise ValueError(f"count must be between 1 and {MAX_SEED_COUNT}, got {count}")
+        payloads = [self._payload(dependants) for _ in range(count)]
+
+        batch = SeedBatch(run=run_id())
+        for result in self.client.create_employees(payloads, concurrency=self.concurrency):
+            if result.ok:
+                employee = result.response.json()
+                with self._lock:
+                    self._seeded[str(employee["id"])] = None
+                batch.employees.append(employee)
+            elif result.error is not None:
+                batch.failed.append(str(result.error))
+            else:
+                batch.failed.append(f"{result.response.status_code}: {result.response.text}")
+        if batch.failed:
+            logger.warning(f"Seeding: {len(batch.failed)} of {count} employee(s) could not be created")
+        return batch
+
+    @property
+    def seeded(self) -> int:
+        """How many seeded employees have not been torn down yet."""
+        with self._lock:
+            return len(self._seeded)
+
+    def teardown(self) -> List[str]:
+        """Delete every employee this seeder created; returns the IDs that failed."""
+        with self._lock:
+            ids = list(self._seeded)
+            self._seeded.clear()
+        failed = []
+        for result in self.client.delete_employees(ids, concurrency=self.concurrency):
+            # 404: already deleted (e.g. by a test that deletes it) — just as good
+            if result.response is None or result.response.status_code not in (200, 204, 404):
+                failed.append(result.item)
+        return failed
+
+
+class _SeedingHandler(BaseHTTPRequestHandler):
+    """Routes seeding requests to the server's EmployeeSeeder."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "EmployeeSeeder/1.0"
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _send_json(self, status: int, body):
+        data = json.dumps(body, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        body = json.loads(self.rfile.read(length))
+        if not isinstance(body, dict):
+            raise ValueError("request body must be a JSON object")
+        return body
+
+    def _path(self) -> str:
+        return self.path.split("?", 1)[0].rstrip("/")
+
+    def do_GET(self):
+        if self._path() != "/health":
+            self._send_json(404, {"error": "not found"})
+            return
+        self._send_json(200, {"run": run_id(), "seeded": self.server.seeder.seeded})
+
+    def do_POST(self):
+        if self._path() != "/employees":
+            self._send_json(404, {"error": "not found"})
+            return
+        try:
+            body = self._read_json()
+            count = body.get("count", 1)
+            dependants = body.get("dependants")
+            if isinstance(count, bool) or not isinstance(count, int):
+                raise ValueError("count must be an integer")
+            if dependants is not None and (isinstance(dependants, bool) or not isinstance(dependants, int)):
+                raise ValueError("dependants must be an integer")
+            batch = self.server.seeder.seed(count, dependants)
+        except ValueError as exc:
+            self._send_json(400, {"error": str(exc)})
+            return
+        # 502: the API refused every employee, so there is nothing to hand out
+        self._send_json(200 if batch.employees else 502, batch.to_dict())
+
+    def do_DELETE(self):
+        if self._path() != "/employees":
+            self._send_json(404, {"error": "not found"})
+            return
+        failed = self.server.seeder.teardown()
+        self._send_json(200 if not failed else 502, {"failed": failed})
+
+
+class SeedingServer:
+    """Threaded HTTP front end for an ``EmployeeSeeder``.
+
+    Binds to an ephemeral port by default; ``url`` is where to send
+    requests. Usable as a context manager.
+    """
+
+    def __init__(self, seeder: EmployeeSeeder, host: str = "127.0.0.1", port: int = 0):
+        self.seeder = seeder
+        self._httpd = ThreadingHTTPServer((host, port), _SeedingHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.seeder = seeder
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Start serving on a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="employee-seeder", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Seeding service listening on {self.url}")
+        return self
+
+    def stop(self):
+        """Stop serving and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
@@ -0,0 +1,105 @@
+"""
+Orphan sweeper — deletes employees left on the backend by test runs.
+
+A record is an orphan if its username carries a test-run namespace (see
+utils/namespace.py) or the ledger still lists its ID as created and not
+deleted (see utils/ledger.py). Orphans are deleted concurrently in batches,
+keeping ``GET /api/Employees`` — and every list test — small and fast.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional
+
+from clients.employees_client import DEFAULT_BULK_CONCURRENCY, EmployeesClient
+from utils.ledger import EmployeeLedger
+from utils.namespace import NAMESPACE_TAG, is_test_username
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SWEEP_BATCH_SIZE = 100
+
+
+@dataclass
+class SweepReport:
+    """What a sweep found and did."""
+
+    found: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    # Ledger entries whose employee was already gone from the backend
+    stale: List[str] = field(default_factory=list)
+
+    def summary(self) -> str:
+        return (
+            f"found {len(self.found)} orphaned employee(s), deleted {len(self.deleted)}, "
+            f"failed {len(self.failed)}, pruned {len(self.stale)} stale ledger entries"
+        )
+
+
+def find_orphans(employees: Iterable[dict], ledger_ids: Iterable[str] = (), run: Optional[str] = None) -> List[str]:
+    """IDs of test-run records in a list response.
+
+    With ``run`` only that run's namespace matches by username; ledger IDs
+    are expected to be filtered by the caller.
+    """
+    prefix = f"{NAMESPACE_TAG}{run}-" if run else None
+    ledger_ids = set(ledger_ids)
+    orphans = []
+    for employee in employees:
+        employee_id = str(employee.get("id"))
+        username = employee.get("username")
+        tagged = is_test_username(username) and (prefix is None or username.startswith(prefix))
+        if tagged or employee_id in ledger_ids:
+            orphans.append(employee_id)
+    return orphans
+
+
+def _batches(items: List[str], size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def sweep(
+    client: EmployeesClient,
+    ledger: Optional[EmployeeLedger] = None,
+    run: Optional[str] = None,
+    batch_size: int = DEFAULT_SWEEP_BATCH_SIZE,
+    concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    dry_run: bool = False,
+    compact: bool = False,
+) -> SweepReport:
+    """Find and delete orphaned test records (only ``run``'s, if given).
+
+    ``compact`` also rewrites the ledger without its settled entries. That
+    loses entries other processes append meanwhile, so only the explicit
+    tools (tools/sweep.py, ``tools.seed teardown``) ask for it, never the
+    automatic session-finish sweep.
+    """
+    response = client.get_all_employees()
+    response.raise_for_status()
+    employees = response.json()
+
+    ledger_ids = ledger.outstanding(run) if ledger else {}
+    report = SweepReport(found=find_orphans(employees, ledger_ids, run))
+
+    present = {str(employee.get("id")) for employee in employees}
+    report.stale = [employee_id for employee_id in ledger_ids if employee_id not in present]
+
+    if dry_run:
+        return report
+
+    for batch in _batches(report.found, batch_size):
+        for result in client.delete_employees(batch, concurrency=concurrency):
+            # 404: deleted by someone else in the meantime — just as good
+            if result.response is not None and result.response.status_code in (200, 204, 404):
+                report.deleted.append(result.item)
+            else:
+                report.failed.append(result.item)
+        logger.info(f"Sweep: deleted {len(report.deleted)}/{len(report.found)}")
+
+    if ledger:
+        ledger.record_deleted(*report.deleted, *report.stale)
+        if compact:
+            ledger.compact()
+    return report
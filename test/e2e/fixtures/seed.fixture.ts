@@ -0,0 +1,50 @@
+import { test as authTest, expect } from "./auth.fixture";
+import { ENV } from "../utils/env";
+import { SeedBatch, type SeededEmployee } from "../utils/seed-client";
+
+type SeedFixtures = {
+  seededEmployees: (count: number) => Promise<SeededEmployee[]>;
+  seededEmployee: SeededEmployee;
+};
+
+type SeedWorkerFixtures = {
+  seedBatch: SeedBatch;
+};
+
+/**
+ * Seeded fixture — hands tests employees pre-created through the API
+ * seeding service instead of the Add Employee form.
+ *
+ * One batch is seeded per worker before its first test, so the employees
+ * are already in the table when the dashboard loads. If a batch runs out,
+ * the next one is seeded and the dashboard reloaded.
+ */
+export const test = authTest.extend<SeedFixtures, SeedWorkerFixtures>({
+  seedBatch: [
+    async ({}, use) => {
+      // One dependant, so edits to any other count visibly change the row
+      const batch = new SeedBatch(ENV.SEED_BATCH_SIZE, { dependants: 1 });
+      await batch.fill();
+      await use(batch);
+    },
+    { scope: "worker", auto: true },
+  ],
+
+  seededEmployees: async ({ seedBatch, dashboardPage }, use) => {
+    await use(async (count: number) => {
+      const { employees, refilled } = await seedBatch.take(count);
+      if (refilled) {
+        await dashboardPage.page.reload();
+        await dashboardPage.waitForTableData();
+      }
+      return employees;
+    });
+  },
+
+  seededEmployee: async ({ seededEmployees }, use) => {
+    const [employee] = await seededEmployees(1);
+    await use(employee);
+  },
+});
+
+export { expect };
@@ -1,20 +1,12 @@
-import { test, expect } from "../fixtures/auth.fixture";
-import { generateEmployee } from "../utils/data-factory";
+import { test } from "../fixtures/seed.fixture";
 
+// Employees come from the seeding service; any left over are removed by
+// the run's bulk teardown.
 test.describe("Scenario 3: Delete Employee", () => {
   test("should delete an employee when clicking the Delete (X) action", async ({
     dashboardPage,
-    employeeModal,
+    seededEmployee: employee,
   }) => {
-    const employee = generateEmployee();
-
-    await dashboardPage.clickAddEmployee();
-    await employeeModal.addEmployee(
-      employee.firstName,
-      employee.lastName,
-      employee.dependants
-    );
-    await employeeModal.expectToBeClosed();
     await dashboardPage.expectEmployeeVisible(
       employee.firstName,
       employee.lastName
@@ -33,18 +25,8 @@ test.describe("Scenario 3: Delete Employee", () => {
 
   test("should not delete employee when clicking Cancel in confirmation modal", async ({
     dashboardPage,
-    employeeModal,
+    seededEmployee: employee,
   }) => {
-    const employee = generateEmployee();
-
-    await dashboardPage.clickAddEmployee();
-    await employeeModal.addEmployee(
-      employee.firstName,
-      employee.lastName,
-      employee.dependants
-    );
-    await employeeModal.expectToBeClosed();
-
     await dashboardPage.openDeleteModalForEmployee(
       employee.firstName,
       employee.lastName
@@ -55,35 +37,13 @@ test.describe("Scenario 3: Delete Employee", () => {
       employee.firstName,
       employee.lastName
     );
-
-    await dashboardPage.clickDeleteForEmployee(
-      employee.firstName,
-      employee.lastName
-    );
   });
 
   test("should not affect other employees when deleting one", async ({
     dashboardPage,
-    employeeModal,
+    seededEmployees,
   }) => {
-    const employee1 = generateEmployee();
-    const employee2 = generateEmployee();
-
-    await dashboardPage.clickAddEmployee();
-    await employeeModal.addEmployee(
-      employee1.firstName,
-      employee1.lastName,
-      employee1.dependants
-    );
-    await employeeModal.expectToBeClosed();
-
-    await dashboardPage.clickAddEmployee();
-    await employeeModal.addEmployee(
-      employee2.firstName,
-      employee2.lastName,
-      employee2.dependants
-    );
-    await employeeModal.expectToBeClosed();
+    const [employee1, employee2] = await seededEmployees(2);
 
     await dashboardPage.expectEmployeeVisible(
       employee1.firstName,
@@ -107,10 +67,5 @@ test.describe("Scenario 3: Delete Employee", () => {
       employee2.firstName,
       employee2.lastName
     );
-
-    await dashboardPage.clickDeleteForEmployee(
-      employee2.firstName,
-      employee2.lastName
-    );
   });
 });
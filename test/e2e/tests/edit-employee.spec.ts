@@ -1,44 +1,21 @@
-import { test, expect } from "../fixtures/auth.fixture";
+import { test, expect } from "../fixtures/seed.fixture";
 import { generateEmployee } from "../utils/data-factory";
 import { calculateBenefits } from "../utils/benefits-calculator";
+import type { SeededEmployee } from "../utils/seed-client";
 
+// Employees come from the seeding service and are removed by the run's
+// bulk teardown, so the tests neither add nor delete them through the UI.
 test.describe("Scenario 2: Edit Employee", () => {
-  let originalEmployee: ReturnType<typeof generateEmployee>;
+  let originalEmployee: SeededEmployee;
 
-  test.beforeEach(async ({ dashboardPage, employeeModal }) => {
-    originalEmployee = generateEmployee({ dependants: 1 });
-
-    await dashboardPage.clickAddEmployee();
-    await employeeModal.addEmployee(
-      originalEmployee.firstName,
-      originalEmployee.lastName,
-      originalEmployee.dependants
-    );
-    await employeeModal.expectToBeClosed();
+  test.beforeEach(async ({ seededEmployee, dashboardPage }) => {
+    originalEmployee = seededEmployee;
     await dashboardPage.expectEmployeeVisible(
       originalEmployee.firstName,
       originalEmployee.lastName
     );
   });
 
-  test.afterEach(async ({ dashboardPage }) => {
-    // Best-effort cleanup — skip if the employee was already deleted or renamed
-    const row = dashboardPage.getEmployeeRow(
-      originalEmployee.firstName,
-      originalEmployee.lastName
-    );
-    if (await row.isVisible().catch(() => false)) {
-      try {
-        await dashboardPage.clickDeleteForEmployee(
-          originalEmployee.firstName,
-          originalEmployee.lastName
-        );
-      } catch {
-        // ignore
-      }
-    }
-  });
-
   test("should open the Edit modal with pre-filled employee data", async ({
     dashboardPage,
     employeeModal,
@@ -56,11 +33,6 @@ test.describe("Scenario 2: Edit Employee", () => {
     );
 
     await employeeModal.cancel();
-
-    await dashboardPage.clickDeleteForEmployee(
-      originalEmployee.firstName,
-      originalEmployee.lastName
-    );
   });
 
   test("should not save changes when clicking Cancel in Edit modal", async ({
@@ -94,11 +66,6 @@ test.describe("Scenario 2: Edit Employee", () => {
     expect(afterData.dependants).toBe(beforeData.dependants);
     expect(afterData.benefitsCost).toBe(beforeData.benefitsCost);
     expect(afterData.net).toBe(beforeData.net);
-
-    await dashboardPage.clickDeleteForEmployee(
-      originalEmployee.firstName,
-      originalEmployee.lastName
-    );
   });
 
   test("should update employee first name and reflect in the table", async ({
@@ -131,11 +98,6 @@ test.describe("Scenario 2: Edit Employee", () => {
       updatedEmployee.firstName,
       updatedEmployee.lastName
     );
-
-    await dashboardPage.clickDeleteForEmployee(
-      updatedEmployee.firstName,
-      updatedEmployee.lastName
-    );
   });
 
   test("should update employee dependants and recalculate benefits", async ({
@@ -166,11 +128,6 @@ test.describe("Scenario 2: Edit Employee", () => {
     expect(rowData.dependants).toBe(newDependants);
     expect(rowData.benefitsCost).toBeCloseTo(expected.benefitsCostPerPaycheck, 2);
     expect(rowData.net).toBeCloseTo(expected.netPerPaycheck, 2);
-
-    await dashboardPage.clickDeleteForEmployee(
-      originalEmployee.firstName,
-      originalEmployee.lastName
-    );
   });
 
   test("should update all employee fields", async ({
@@ -206,10 +163,5 @@ test.describe("Scenario 2: Edit Employee", () => {
     expect(rowData.dependants).toBe(updatedEmployee.dependants);
     expect(rowData.benefitsCost).toBeCloseTo(expected.benefitsCostPerPaycheck, 2);
     expect(rowData.net).toBeCloseTo(expected.netPerPaycheck, 2);
-
-    await dashboardPage.clickDeleteForEmployee(
-      updatedEmployee.firstName,
-      updatedEmployee.lastName
-    );
   });
 });
@@ -26,8 +26,15 @@ function requireEnv(name: string): string {
   return value;
 }
 
+function optionalEnv(name: string, fallback: string): string {
+  return process.env[name] || fallback;
+}
+
 export const ENV = {
   BASE_URL: requireEnv("BASE_URL"),
   TEST_USERNAME: requireEnv("TEST_USERNAME"),
   TEST_PASSWORD: requireEnv("TEST_PASSWORD"),
+  // Seeding service from the API suite (python -m tools.seed serve)
+  SEED_URL: optionalEnv("SEED_URL", "http://127.0.0.1:8765"),
+  SEED_BATCH_SIZE: Number(optionalEnv("SEED_BATCH_SIZE", "10")),
 } as const;
@@ -0,0 +1,86 @@
+import { request } from "@playwright/test";
+import { ENV } from "./env";
+
+/**
+ * Client for the API suite's seeding service (test/api/tools/seed.py).
+ *
+ * Employees are created through the API in one call instead of through the
+ * Add Employee form. They are left for the run's bulk teardown
+ * (`python -m tools.seed teardown`).
+ */
+
+export interface SeededEmployee {
+  id: string;
+  username: string;
+  firstName: string;
+  lastName: string;
+  dependants: number;
+  salary: number;
+  gross: number;
+  benefitsCost: number;
+  net: number;
+}
+
+export interface SeedOptions {
+  dependants?: number;
+}
+
+export async function seedEmployees(
+  count: number,
+  options: SeedOptions = {}
+): Promise<SeededEmployee[]> {
+  const context = await request.newContext({ baseURL: ENV.SEED_URL });
+  try {
+    const response = await context.post("/employees", {
+      data: { count, ...options },
+    });
+    if (!response.ok()) {
+      throw new Error(
+        `Seeding service at ${ENV.SEED_URL} returned ${response.status()}: ` +
+          `${await response.text()}. Is \`python -m tools.seed serve\` running?`
+      );
+    }
+    const body = await response.json();
+    return body.employees as SeededEmployee[];
+  } catch (error) {
+    if (error instanceof Error && error.message.includes("ECONNREFUSED")) {
+      throw new Error(
+        `No seeding service at ${ENV.SEED_URL}. Start it from test/api with ` +
+          "`python -m tools.seed serve`."
+      );
+    }
+    throw error;
+  } finally {
+    await context.dispose();
+  }
+}
+
+/**
+ * Employees seeded ahead of time and handed out one by one.
+ * Fetches another batch when the current one runs out.
+ */
+export class SeedBatch {
+  private employees: SeededEmployee[] = [];
+
+  constructor(
+    private readonly size: number,
+    private readonly options: SeedOptions = {}
+  ) {}
+
+  async fill(): Promise<void> {
+    this.employees.push(...(await seedEmployees(this.size, this.options)));
+  }
+
+  /**
+   * Take `count` employees. `refilled` is true if a new batch had to be
+   * seeded, i.e. a page loaded before this call does not show them yet.
+   */
+  async take(count = 1): Promise<{ employees: SeededEmployee[]; refilled: boolean }> {
+    let refilled = false;
+    while (this.employees.length < count) {
+      await this.fill();
+      refilled = true;
+    }
+    return { employees: this.employees.splice(0, count), refilled };
+  }
+}